@@ -1,9 +1,14 @@
 import logging
 import os
-from typing import Optional
+import threading
+import time
+from typing import Callable, Optional
 import mysql.connector
 from dotenv import load_dotenv
 
+from app.db_pool import ConnectionPool
+from app.utils.region import listing_region, region_query_keys
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -24,10 +29,62 @@ def _build_db_config() -> tuple[dict, str]:
 DB_CONFIG, DB_NAME = _build_db_config()
 
 
-def get_connection():
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))
+
+
+def _mysql_factory():
     return mysql.connector.connect(database=DB_NAME, **DB_CONFIG)
 
 
+# 커넥션은 첫 대여 시점에 생성되므로 임포트만으로는 DB에 접속하지 않는다
+_pool = ConnectionPool(_mysql_factory, size=DB_POOL_SIZE, timeout=DB_POOL_TIMEOUT, name="mysql")
+
+
+def configure_pool(factory: Optional[Callable] = None, size: Optional[int] = None, timeout: Optional[float] = None):
+    """
+    풀 재구성. 풀 크기·대기 시간을 바꾸거나 다른 DB-API 커넥션 팩토리를 주입할 때 사용.
+    예) configure_pool(lambda: sqlite3.connect("test.db", check_same_thread=False))
+    sqlite3 같은 대체 커넥션은 풀 자체(대여·반납·타임아웃·reopen)만 검증할 수 있다.
+    이 모듈의 쿼리는 MySQL 전용(cursor(dictionary=True), %s 자리표시자, @@auto_increment_increment 등)이라
+    get_listing_by_id_db 같은 함수는 대체 커넥션에서 동작하지 않는다.
+    """
+    global _pool, _autoinc_step
+    _pool.close()
+    # 다른 서버를 가리킬 수 있으므로 서버 설정 캐시도 비운다
+    _autoinc_step = None
+    _pool = ConnectionPool(
+        factory or _mysql_factory,
+        size=size or DB_POOL_SIZE,
+        timeout=timeout or DB_POOL_TIMEOUT,
+        name="mysql" if factory is None else "custom",
+    )
+
+
+def get_pool_size() -> int:
+    """현재 커넥션 풀 크기 (configure_pool(size=...) 반영)"""
+    return _pool.size
+
+
+def open_pool():
+    """close_pool() 이후 재사용 — lifespan 시작 시 호출 (TestClient·--reload로 lifespan이 반복되는 경우)"""
+    _pool.reopen()
+
+
+def close_pool():
+    _pool.close()
+
+
+def get_pool_stats() -> dict:
+    """풀 포화 지표 (대여 중·유휴 커넥션 수, 대기·타임아웃 횟수 등)"""
+    return _pool.stats()
+
+
+def get_connection():
+    """풀에서 커넥션을 대여하는 컨텍스트 매니저. with 블록을 벗어나면 자동 반납"""
+    return _pool.connection()
+
+
 def init_db():
     """DB 및 테이블 초기화"""
     conn = mysql.connector.connect(**DB_CONFIG)
@@ -52,9 +109,14 @@ def init_db():
             distance_km FLOAT,
             source      VARCHAR(50),
             city        VARCHAR(100),
-            created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            sido        VARCHAR(20),
+            region      VARCHAR(50),
+            created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            INDEX idx_region_type_created (region, type, created_at, price),
+            INDEX idx_sido_type_created (sido, type, created_at, price)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
     """)
+    _migrate_listings(cursor)
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS favorites (
             id          INT AUTO_INCREMENT PRIMARY KEY,
@@ -64,102 +126,299 @@ def init_db():
             UNIQUE KEY unique_fav (user_id, listing_id)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
     """)
+    # 지역·유형·날짜별 일일 집계 — save_listings가 저장과 같은 트랜잭션에서 누적 갱신
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS market_daily (
+            sido        VARCHAR(20) NOT NULL DEFAULT '',
+            region      VARCHAR(50) NOT NULL DEFAULT '',
+            type        VARCHAR(50) NOT NULL DEFAULT '',
+            date        DATE NOT NULL,
+            count       INT NOT NULL,
+            price_count INT NOT NULL DEFAULT 0,
+            sum_price   BIGINT NOT NULL,
+            sum_area    DOUBLE NOT NULL,
+            min_price   INT,
+            max_price   INT,
+            PRIMARY KEY (region, sido, type, date),
+            INDEX idx_sido_type_date (sido, type, date)
+        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+    """)
+    _migrate_market_daily(cursor)
     conn.commit()
     cursor.close()
     conn.close()
     logger.info("[DB] roomitai 초기화 완료")
 
 
-def save_listings(listings: list, city: str = None) -> list:
-    """매물 리스트를 DB에 저장하고, DB auto-increment id가 포함된 리스트 반환"""
-    if not listings:
-        return []
-    conn = get_connection()
-    cursor = conn.cursor()
-    result = []
-    for l in listings:
+def _migrate_market_daily(cursor):
+    """price_count가 없던 market_daily에 컬럼을 추가한다"""
+    cursor.execute(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'market_daily'",
+        (DB_NAME,),
+    )
+    if "price_count" in {row[0] for row in cursor.fetchall()}:
+        return
+    cursor.execute("ALTER TABLE market_daily ADD COLUMN price_count INT NOT NULL DEFAULT 0 AFTER count")
+    # 이전 행은 가격 없는 매물 수를 알 수 없으므로 count로 채운다 (이전과 같은 평균)
+    cursor.execute("UPDATE market_daily SET price_count = count")
+    logger.info("[DB] market_daily price_count 컬럼 추가")
+
+
+# 기존 listings 테이블에 추가할 컬럼·인덱스 (CREATE TABLE 정의와 동일하게 유지)
+# 인덱스 끝의 price는 트렌드 집계를 인덱스만으로 처리하기 위한 커버링 컬럼
+_LISTING_ADDED_COLUMNS = {
+    "sido":   "VARCHAR(20) AFTER city",
+    "region": "VARCHAR(50) AFTER sido",
+}
+_LISTING_INDEXES = {
+    "idx_region_type_created": "(region, type, created_at, price)",
+    "idx_sido_type_created":   "(sido, type, created_at, price)",
+}
+_BACKFILL_BATCH = 5000
+
+
+def _migrate_listings(cursor):
+    """이전 스키마의 listings 테이블에 지역 키 컬럼·인덱스를 추가하고 기존 행을 채운다"""
+    cursor.execute(
+        "SELECT COLUMN_NAME FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'listings'",
+        (DB_NAME,),
+    )
+    columns = {row[0] for row in cursor.fetchall()}
+    added = [col for col in _LISTING_ADDED_COLUMNS if col not in columns]
+    for col in added:
+        cursor.execute(f"ALTER TABLE listings ADD COLUMN {col} {_LISTING_ADDED_COLUMNS[col]}")
+    if added:
+        _backfill_listing_regions(cursor)
+
+    cursor.execute(
+        "SELECT DISTINCT INDEX_NAME FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'listings'",
+        (DB_NAME,),
+    )
+    indexes = {row[0] for row in cursor.fetchall()}
+    for name, cols in _LISTING_INDEXES.items():
+        if name not in indexes:
+            cursor.execute(f"CREATE INDEX {name} ON listings {cols}")
+            logger.info(f"[DB] listings 인덱스 추가: {name}")
+
+
+def _backfill_listing_regions(cursor):
+    """기존 행의 sido / region을 주소·city에서 추출해 id 순으로 배치 갱신"""
+    last_id, updated = 0, 0
+    while True:
         cursor.execute(
-            """
-            INSERT INTO listings
-                (name, address, area, deposit, monthly, price,
-                 lat, lng, type, distance_km, source, city)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """,
-            (
-                l.get("name"), l.get("address"), l.get("area"),
-                l.get("deposit"), l.get("monthly"), l.get("price"),
-                l.get("lat"), l.get("lng"), l.get("type"),
-                l.get("distance_km"), l.get("source"), city,
-            ),
+            "SELECT id, address, city FROM listings WHERE id > %s ORDER BY id LIMIT %s",
+            (last_id, _BACKFILL_BATCH),
         )
-        result.append({"id": cursor.lastrowid, **{k: v for k, v in l.items() if k != "id"}})
-    conn.commit()
-    cursor.close()
-    conn.close()
-    return result
+        rows = cursor.fetchall()
+        if not rows:
+            break
+        cursor.executemany(
+            "UPDATE listings SET sido = %s, region = %s WHERE id = %s",
+            [(*listing_region(address, city), listing_id) for listing_id, address, city in rows],
+        )
+        updated += len(rows)
+        last_id = rows[-1][0]
+    logger.info(f"[DB] listings 지역 키 백필 완료 ({updated}건)")
+
+
+_LISTING_INSERT_PREFIX = """
+    INSERT INTO listings
+        (name, address, area, deposit, monthly, price,
+         lat, lng, type, distance_km, source, city, sido, region)
+    VALUES """
+_LISTING_ROW_PLACEHOLDER = "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+
+# 다중 행 INSERT 1회에 담는 최대 행 수 (max_allowed_packet 여유 고려)
+SAVE_CHUNK_SIZE = int(os.getenv("DB_SAVE_CHUNK_SIZE", 500))
+
+# 최근 저장 처리량 — /api/admin/metrics 노출용
+_insert_stats = {"calls": 0, "rows": 0, "seconds": 0.0, "last_rows_per_sec": 0.0}
+_insert_stats_lock = threading.Lock()
+
+# 서버의 auto_increment_increment (복제 구성에 따라 1이 아닐 수 있음)
+_autoinc_step: Optional[int] = None
+
+
+def _listing_row(l: dict, city: Optional[str]) -> tuple:
+    return (
+        l.get("name"), l.get("address"), l.get("area"),
+        l.get("deposit"), l.get("monthly"), l.get("price"),
+        l.get("lat"), l.get("lng"), l.get("type"),
+        l.get("distance_km"), l.get("source"), city,
+        *listing_region(l.get("address"), city),
+    )
+
+
+def _insert_rows_bulk(cursor, rows: list, chunk_size: int) -> list:
+    """
+    다중 행 VALUES INSERT를 chunk 단위로 실행하고 입력 순서대로 id 목록 반환.
+
+    InnoDB는 행 수가 확정된 다중 행 INSERT("simple insert")에 id를 한 번에 연속 할당하고,
+    lastrowid(LAST_INSERT_ID)는 그 중 첫 번째 행의 id를 돌려준다.
+    """
+    global _autoinc_step
+    if _autoinc_step is None:
+        cursor.execute("SELECT @@auto_increment_increment")
+        _autoinc_step = int(cursor.fetchone()[0])
+
+    ids = []
+    for offset in range(0, len(rows), chunk_size):
+        chunk = rows[offset:offset + chunk_size]
+        sql = _LISTING_INSERT_PREFIX + ", ".join([_LISTING_ROW_PLACEHOLDER] * len(chunk))
+        cursor.execute(sql, [v for row in chunk for v in row])
+        first_id = cursor.lastrowid
+        ids.extend(first_id + i * _autoinc_step for i in range(len(chunk)))
+    return ids
+
+
+def _insert_rows_each(cursor, rows: list) -> list:
+    """행 단위 INSERT (이전 방식 — 벤치마크 비교용)"""
+    ids = []
+    sql = _LISTING_INSERT_PREFIX + _LISTING_ROW_PLACEHOLDER
+    for row in rows:
+        cursor.execute(sql, row)
+        ids.append(cursor.lastrowid)
+    return ids
+
+
+# LEAST/GREATEST는 인자 중 NULL이 있으면 NULL — 가격 없는 묶음이 기존 최소·최대를 지우지 않도록 양쪽 모두 COALESCE
+_MARKET_DAILY_UPSERT = """
+    INSERT INTO market_daily
+        (sido, region, type, date, count, price_count, sum_price, sum_area, min_price, max_price)
+    VALUES (%s, %s, %s, CURDATE(), %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        count       = count + VALUES(count),
+        price_count = price_count + VALUES(price_count),
+        sum_price   = sum_price + VALUES(sum_price),
+        sum_area    = sum_area + VALUES(sum_area),
+        min_price   = LEAST(COALESCE(min_price, VALUES(min_price)), COALESCE(VALUES(min_price), min_price)),
+        max_price   = GREATEST(COALESCE(max_price, VALUES(max_price)), COALESCE(VALUES(max_price), max_price))
+"""
+
+
+def _accumulate_market_daily(cursor, rows: list):
+    """저장한 행을 (시도, 시군구, 유형)별로 묶어 오늘 날짜 일일 집계에 더한다"""
+    groups: dict[tuple, list] = {}
+    for row in rows:
+        price, area, listing_type, sido, region = row[5], row[2], row[8], row[12], row[13]
+        key = (sido or "", region or "", listing_type or "")
+        g = groups.get(key)
+        if g is None:
+            g = groups[key] = [0, 0, 0, 0.0, None, None]
+        g[0] += 1
+        g[3] += area or 0.0
+        if price is not None:
+            # 평균 가격의 분모는 가격이 있는 매물 수 (AVG(price)와 같은 기준)
+            g[1] += 1
+            g[2] += price
+            g[4] = price if g[4] is None else min(g[4], price)
+            g[5] = price if g[5] is None else max(g[5], price)
+    cursor.executemany(_MARKET_DAILY_UPSERT, [(*key, *g) for key, g in groups.items()])
+
+
+def save_listings(listings: list, city: str = None, bulk: bool = True, chunk_size: int = SAVE_CHUNK_SIZE) -> list:
+    """
+    매물 리스트를 DB에 저장하고, DB auto-increment id가 포함된 리스트 반환.
+    bulk=True면 chunk_size 행씩 다중 행 INSERT로 저장한다. id 순서는 입력 순서와 같다.
+    """
+    if not listings:
+        return []
+    start = time.perf_counter()
+    rows = [_listing_row(l, city) for l in listings]
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        if bulk:
+            ids = _insert_rows_bulk(cursor, rows, chunk_size)
+        else:
+            ids = _insert_rows_each(cursor, rows)
+        _accumulate_market_daily(cursor, rows)
+        conn.commit()
+        cursor.close()
+    elapsed = time.perf_counter() - start
+
+    rows_per_sec = len(rows) / elapsed if elapsed > 0 else 0.0
+    with _insert_stats_lock:
+        _insert_stats["calls"] += 1
+        _insert_stats["rows"] += len(rows)
+        _insert_stats["seconds"] += elapsed
+        _insert_stats["last_rows_per_sec"] = round(rows_per_sec, 1)
+    logger.info(f"[DB] listings {len(rows)}건 저장 ({'bulk' if bulk else 'row'}), {rows_per_sec:,.0f} rows/s")
+
+    return [
+        {"id": listing_id, **{k: v for k, v in l.items() if k != "id"}}
+        for listing_id, l in zip(ids, listings)
+    ]
+
+
+def get_insert_stats() -> dict:
+    """save_listings 누적 처리량 (rows/s)"""
+    with _insert_stats_lock:
+        stats = dict(_insert_stats)
+    stats["avg_rows_per_sec"] = round(stats["rows"] / stats["seconds"], 1) if stats["seconds"] else 0.0
+    stats["seconds"] = round(stats["seconds"], 3)
+    return stats
 
 
 def get_listing_by_id_db(listing_id: int) -> Optional[dict]:
     """DB에서 id로 매물 단건 조회"""
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM listings WHERE id = %s", (listing_id,))
-    row = cursor.fetchone()
-    cursor.close()
-    conn.close()
+    with get_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute("SELECT * FROM listings WHERE id = %s", (listing_id,))
+        row = cursor.fetchone()
+        cursor.close()
     return row
 
 
 def add_favorite(user_id: str, listing_id: int) -> Optional[dict]:
     """즐겨찾기 추가. 이미 존재하면 None 반환"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    try:
-        cursor.execute(
-            "INSERT INTO favorites (user_id, listing_id) VALUES (%s, %s)",
-            (user_id, listing_id),
-        )
-        conn.commit()
-        return {"id": cursor.lastrowid, "user_id": user_id, "listing_id": listing_id}
-    except Exception:
-        return None
-    finally:
-        cursor.close()
-        conn.close()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "INSERT INTO favorites (user_id, listing_id) VALUES (%s, %s)",
+                (user_id, listing_id),
+            )
+            conn.commit()
+            return {"id": cursor.lastrowid, "user_id": user_id, "listing_id": listing_id}
+        except Exception:
+            return None
+        finally:
+            cursor.close()
 
 
 def get_favorites_db(user_id: str) -> list:
     """유저의 즐겨찾기 목록 조회 (listings JOIN)"""
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    cursor.execute(
-        """
-        SELECT f.id AS favorite_id, l.*
-        FROM favorites f
-        JOIN listings l ON f.listing_id = l.id
-        WHERE f.user_id = %s
-        ORDER BY f.created_at DESC
-        """,
-        (user_id,),
-    )
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    with get_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(
+            """
+            SELECT f.id AS favorite_id, l.*
+            FROM favorites f
+            JOIN listings l ON f.listing_id = l.id
+            WHERE f.user_id = %s
+            ORDER BY f.created_at DESC
+            """,
+            (user_id,),
+        )
+        rows = cursor.fetchall()
+        cursor.close()
     return rows
 
 
 def delete_favorite(favorite_id: int, user_id: str) -> bool:
     """즐겨찾기 삭제. 삭제된 행이 있으면 True"""
-    conn = get_connection()
-    cursor = conn.cursor()
-    cursor.execute(
-        "DELETE FROM favorites WHERE id = %s AND user_id = %s",
-        (favorite_id, user_id),
-    )
-    conn.commit()
-    affected = cursor.rowcount
-    cursor.close()
-    conn.close()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "DELETE FROM favorites WHERE id = %s AND user_id = %s",
+            (favorite_id, user_id),
+        )
+        conn.commit()
+        affected = cursor.rowcount
+        cursor.close()
     return affected > 0
 
 
@@ -176,51 +435,139 @@ def reset_table_auto_increment(table: str) -> dict:
     if table not in _RESETTABLE_TABLES:
         raise ValueError(f"허용되지 않은 테이블입니다: {table}")
 
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
+    with get_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
 
-    cursor.execute(f"SELECT COUNT(*) AS cnt FROM `{table}`")
-    before = cursor.fetchone()["cnt"]
+        cursor.execute(f"SELECT COUNT(*) AS cnt FROM `{table}`")
+        before = cursor.fetchone()["cnt"]
 
-    if table == "listings":
-        # favorites에서 참조 중인 listing_id는 삭제하지 않음
-        cursor.execute("""
-            DELETE FROM listings
-            WHERE id NOT IN (SELECT listing_id FROM favorites)
-        """)
-        deleted = cursor.rowcount
-        # 테이블이 비었을 때만 AUTO_INCREMENT = 1이 실제로 적용됨
-        cursor.execute("ALTER TABLE listings AUTO_INCREMENT = 1")
-    else:
-        cursor.execute(f"TRUNCATE TABLE `{table}`")
-        deleted = before
+        if table == "listings":
+            # favorites에서 참조 중인 listing_id는 삭제하지 않음
+            cursor.execute("""
+                DELETE FROM listings
+                WHERE id NOT IN (SELECT listing_id FROM favorites)
+            """)
+            deleted = cursor.rowcount
+            # 테이블이 비었을 때만 AUTO_INCREMENT = 1이 실제로 적용됨
+            cursor.execute("ALTER TABLE listings AUTO_INCREMENT = 1")
+        else:
+            cursor.execute(f"TRUNCATE TABLE `{table}`")
+            deleted = before
 
-    conn.commit()
-    cursor.close()
-    conn.close()
+        conn.commit()
+        cursor.close()
 
     logger.info(f"[DB] {table} 초기화 완료 (삭제 {deleted}건, 보호 {before - deleted}건)")
     return {"table": table, "deleted_count": deleted, "protected_count": before - deleted, "auto_increment": 1}
 
 
-def get_market_trend_db(area: str, listing_type: Optional[str] = None) -> list:
-    """지역·타입별 날짜별 평균 가격 트렌드 조회"""
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
-    query = """
+def rebuild_market_daily(full: bool = False) -> dict:
+    """
+    listings 원본에서 일일 집계를 다시 계산한다.
+    listings는 10분마다 비워지므로 남은 행만으로는 어느 날짜도 완전하지 않다.
+    기본값은 집계에 없는 (지역, 유형, 날짜) 행만 채우고 기존 누적값은 건드리지 않는다.
+    full=True면 집계 테이블 전체를 비우고 남은 listings로 재생성한다 (이미 비워진 기록은 사라진다).
+    """
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cleared = 0
+        if full:
+            cursor.execute("DELETE FROM market_daily")
+            cleared = cursor.rowcount
+        # 이미 있는 키는 그대로 둔다 (count = count는 변경 없음 → rowcount 0)
+        cursor.execute("""
+            INSERT INTO market_daily
+                (sido, region, type, date, count, price_count, sum_price, sum_area, min_price, max_price)
+            SELECT COALESCE(sido, ''), COALESCE(region, ''), COALESCE(type, ''), DATE(created_at),
+                   COUNT(*), COUNT(price), COALESCE(SUM(price), 0), COALESCE(SUM(area), 0), MIN(price), MAX(price)
+            FROM listings
+            GROUP BY COALESCE(sido, ''), COALESCE(region, ''), COALESCE(type, ''), DATE(created_at)
+            ON DUPLICATE KEY UPDATE count = count
+        """)
+        rebuilt = cursor.rowcount
+        conn.commit()
+        cursor.close()
+    logger.info(f"[DB] market_daily 재생성 완료 (삭제 {cleared}행, 생성 {rebuilt}행, full={full})")
+    return {"cleared_rows": cleared, "rebuilt_rows": rebuilt, "full": full}
+
+
+def _region_filter(area: str) -> Optional[tuple[str, list]]:
+    """지역명을 sido / region 인덱스 조건으로 변환. 지역 키로 표현할 수 없으면 None"""
+    keys = region_query_keys(area)
+    if keys is None:
+        return None
+    sido, regions = keys
+    clauses, params = [], []
+    if sido:
+        clauses.append("sido = %s")
+        params.append(sido)
+    if regions:
+        clauses.append(f"region IN ({', '.join(['%s'] * len(regions))})")
+        params.extend(regions)
+    return " AND ".join(clauses), params
+
+
+def _query_trend(cursor, where: str, params: list, listing_type: Optional[str]) -> list:
+    query = f"""
         SELECT DATE(created_at) AS date,
                ROUND(AVG(price), 0) AS avg_price,
                COUNT(*) AS count
         FROM listings
-        WHERE (city LIKE %s OR address LIKE %s)
+        WHERE {where}
     """
-    params: list = [f"%{area}%", f"%{area}%"]
     if listing_type:
         query += " AND type = %s"
-        params.append(listing_type)
+        params = [*params, listing_type]
     query += " GROUP BY DATE(created_at) ORDER BY date ASC"
     cursor.execute(query, params)
-    rows = cursor.fetchall()
-    cursor.close()
-    conn.close()
+    return cursor.fetchall()
+
+
+def _query_trend_rollup(cursor, where: str, params: list, listing_type: Optional[str]) -> list:
+    query = f"""
+        SELECT date,
+               ROUND(SUM(sum_price) / NULLIF(SUM(price_count), 0), 0) AS avg_price,
+               CAST(SUM(count) AS UNSIGNED) AS count
+        FROM market_daily
+        WHERE {where}
+    """
+    if listing_type:
+        query += " AND type = %s"
+        params = [*params, listing_type]
+    query += " GROUP BY date ORDER BY date ASC"
+    cursor.execute(query, params)
+    return cursor.fetchall()
+
+
+def get_market_trend_db(area: str, listing_type: Optional[str] = None) -> list:
+    """
+    지역·타입별 날짜별 평균 가격 트렌드 조회.
+    시도·시군구로 해석되는 지역명은 일일 집계(market_daily)에서 읽고, 집계가 비어 있으면
+    같은 sido / region 조건으로 listings 원본을 조회한다 (idx_*_type_created 인덱스 사용).
+    지역 키로 해석되지 않는 지역명만 city·address 부분 일치 검색을 한다.
+    """
+    region_filter = _region_filter(area)
+    with get_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        if region_filter is not None:
+            rows = _query_trend_rollup(cursor, *region_filter, listing_type)
+            if not rows:
+                rows = _query_trend(cursor, *region_filter, listing_type)
+        else:
+            rows = _query_trend(cursor, "(city LIKE %s OR address LIKE %s)", [f"%{area}%", f"%{area}%"], listing_type)
+        cursor.close()
     return rows
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="roomitai DB 관리 명령")
+    sub = parser.add_subparsers(dest="command", required=True)
+    rebuild = sub.add_parser("rebuild-rollup", help="listings에서 market_daily 일일 집계 재생성")
+    rebuild.add_argument("--full", action="store_true", help="기존 집계를 모두 지우고 재생성")
+    args = parser.parse_args()
+
+    if args.command == "rebuild-rollup":
+        print(rebuild_market_daily(full=args.full))
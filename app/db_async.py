@@ -0,0 +1,112 @@
+"""
+비동기 DB 접근 계층 — 라우터에서 사용.
+
+블로킹 mysql.connector 호출을 DB 전용 스레드풀에서 실행한다.
+asyncio.to_thread의 기본 스레드풀과 분리되어 있으므로 DB 요청이 몰려도
+Gemini 요약·유형 추론 같은 다른 to_thread 작업이 뒤에서 대기하지 않는다.
+워커 수는 커넥션 풀 크기와 같게 두어 워커가 커넥션을 기다리며 놀지 않게 한다.
+
+함수 시그니처는 app.database의 동기 함수와 동일하며, 동기 호출자는
+기존처럼 app.database를 직접 사용하면 된다.
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from app import database
+from app.database import SAVE_CHUNK_SIZE
+
+# 첫 사용 시 생성 — shutdown_executor() 후 lifespan이 다시 시작되면 새로 만든다
+# 워커 수는 생성 시점의 커넥션 풀 크기 (configure_pool(size=...)로 바뀌면 다음 사용 때 다시 만든다)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_stats = {"submitted": 0, "pending": 0, "running": 0, "peak_pending": 0}
+
+
+def _tracked(fn, *args):
+    with _stats_lock:
+        _stats["pending"] -= 1
+        _stats["running"] += 1
+    try:
+        return fn(*args)
+    finally:
+        with _stats_lock:
+            _stats["running"] -= 1
+
+
+async def _run(fn, *args):
+    with _stats_lock:
+        _stats["submitted"] += 1
+        _stats["pending"] += 1
+        _stats["peak_pending"] = max(_stats["peak_pending"], _stats["pending"])
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), functools.partial(_tracked, fn, *args))
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor, _executor_workers
+    stale = None
+    with _executor_lock:
+        size = database.get_pool_size()
+        if _executor is not None and _executor_workers != size:
+            stale, _executor = _executor, None
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix="db")
+            _executor_workers = size
+        executor = _executor
+    if stale is not None:
+        # 이미 제출된 작업은 이전 스레드풀에서 마저 실행된다
+        stale.shutdown(wait=False)
+    return executor
+
+
+def get_executor_stats() -> dict:
+    """DB 전용 스레드풀 상태 (대기·실행 중 작업 수)"""
+    with _stats_lock:
+        return {"workers": _executor_workers or database.get_pool_size(), **_stats}
+
+
+def shutdown_executor():
+    global _executor, _executor_workers
+    with _executor_lock:
+        executor, _executor = _executor, None
+        _executor_workers = 0
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+async def save_listings(listings: list, city: str = None, bulk: bool = True, chunk_size: int = SAVE_CHUNK_SIZE) -> list:
+    return await _run(database.save_listings, listings, city, bulk, chunk_size)
+
+
+async def get_listing_by_id_db(listing_id: int) -> Optional[dict]:
+    return await _run(database.get_listing_by_id_db, listing_id)
+
+
+async def add_favorite(user_id: str, listing_id: int) -> Optional[dict]:
+    return await _run(database.add_favorite, user_id, listing_id)
+
+
+async def get_favorites_db(user_id: str) -> list:
+    return await _run(database.get_favorites_db, user_id)
+
+
+async def delete_favorite(favorite_id: int, user_id: str) -> bool:
+    return await _run(database.delete_favorite, favorite_id, user_id)
+
+
+async def reset_table_auto_increment(table: str) -> dict:
+    return await _run(database.reset_table_auto_increment, table)
+
+
+async def get_market_trend_db(area: str, listing_type: Optional[str] = None) -> list:
+    return await _run(database.get_market_trend_db, area, listing_type)
+
+
+async def rebuild_market_daily(full: bool = False) -> dict:
+    return await _run(database.rebuild_market_daily, full)
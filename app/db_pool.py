@@ -0,0 +1,211 @@
+"""
+DB 커넥션 풀 — 요청마다 connect/close 하던 비용(TCP + 인증 핸드셰이크)을 제거.
+
+드라이버에 의존하지 않도록 connect 팩토리를 주입받는다.
+MySQL 운영 환경에서는 mysql.connector.connect, 로컬 검증에서는
+sqlite3.connect(..., check_same_thread=False) 같은 대체 팩토리를 넣어 사용할 수 있다.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """풀이 포화 상태여서 제한 시간 내에 커넥션을 받지 못함"""
+
+
+class ConnectionPool:
+    """
+    고정 크기 스레드 안전 커넥션 풀.
+
+    - size: 동시에 열어 둘 수 있는 최대 커넥션 수
+    - timeout: 풀이 가득 찼을 때 반납을 기다리는 최대 시간(초)
+    - ping_after: 이 시간(초) 이상 유휴 상태였던 커넥션은 대여 시 헬스체크
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = 5,
+        timeout: float = 10.0,
+        ping_after: float = 5.0,
+        name: str = "db",
+    ):
+        if size < 1:
+            raise ValueError("풀 크기는 1 이상이어야 합니다.")
+        self.name = name
+        self._factory = factory
+        self._size = size
+        self._timeout = timeout
+        self._ping_after = ping_after
+
+        self._idle: deque = deque()   # (conn, 마지막 반납 시각)
+        self._cond = threading.Condition()
+        self._open = 0                # 현재 열려 있는 커넥션 수 (대여 중 + 유휴)
+        self._in_use = 0
+        self._closed = False
+
+        # 포화 지표
+        self._peak_in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._wait_seconds = 0.0
+        self._created = 0
+        self._discarded = 0
+
+    # ── 대여 / 반납 ───────────────────────────────────────────
+    def acquire(self):
+        start = time.monotonic()
+        deadline = start + self._timeout
+        waited = False
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f"[{self.name}] 이미 종료된 풀입니다.")
+                if self._idle:
+                    conn, released_at = self._idle.pop()
+                    break
+                if self._open < self._size:
+                    self._open += 1
+                    conn, released_at = None, None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolTimeout(
+                        f"[{self.name}] 커넥션 대기 시간 초과 ({self._timeout}초, size={self._size})"
+                    )
+                waited = True
+                self._cond.wait(remaining)
+
+            self._checkouts += 1
+            if waited:
+                self._waits += 1
+                self._wait_seconds += time.monotonic() - start
+
+        # 커넥션 생성·헬스체크는 락 밖에서 수행 (네트워크 I/O)
+        try:
+            if conn is None:
+                conn = self._connect()
+            elif time.monotonic() - released_at >= self._ping_after and not self._is_healthy(conn):
+                logger.warning(f"[{self.name} 풀] 끊어진 커넥션 폐기 후 재연결")
+                self._close_quietly(conn)
+                with self._cond:
+                    self._discarded += 1
+                conn = self._connect()
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+        return conn
+
+    def release(self, conn, discard: bool = False):
+        if not discard:
+            # 커밋되지 않은 트랜잭션이 다음 대여자에게 넘어가지 않도록 정리
+            try:
+                conn.rollback()
+            except Exception:
+                discard = True
+
+        with self._cond:
+            self._in_use -= 1
+            if discard or self._closed:
+                self._open -= 1
+                if discard:
+                    self._discarded += 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+                conn = None
+            self._cond.notify()
+
+        if conn is not None:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        except Exception:
+            self.release(conn, discard=not self._is_healthy(conn))
+            raise
+        else:
+            self.release(conn)
+
+    def close(self):
+        """유휴 커넥션을 모두 닫고, 대여 중인 커넥션은 반납 시 닫히도록 표시"""
+        with self._cond:
+            self._closed = True
+            idle = [c for c, _ in self._idle]
+            self._idle.clear()
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for conn in idle:
+            self._close_quietly(conn)
+
+    def reopen(self):
+        """close() 이후 다시 대여 가능하게 한다 (같은 프로세스에서 lifespan이 다시 시작될 때)"""
+        with self._cond:
+            self._closed = False
+
+    # ── 지표 ──────────────────────────────────────────────────
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "size": self._size,
+                "open": self._open,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "saturation": round(self._in_use / self._size, 2),
+                "peak_in_use": self._peak_in_use,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._wait_seconds / self._waits * 1000, 2) if self._waits else 0.0,
+                "created": self._created,
+                "discarded": self._discarded,
+            }
+
+    # ── 내부 ──────────────────────────────────────────────────
+    def _connect(self):
+        conn = self._factory()
+        with self._cond:
+            self._created += 1
+        return conn
+
+    @staticmethod
+    def _is_healthy(conn) -> bool:
+        try:
+            if hasattr(conn, "ping"):
+                conn.ping(reconnect=False)  # mysql.connector
+            else:
+                cursor = conn.cursor()      # DB-API 공통 (sqlite3 등)
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
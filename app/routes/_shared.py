@@ -7,6 +7,8 @@ import requests
 from typing import Optional
 
 from app.services.geolocation import address_to_coords
+from app.services.http_clients import get_rate_limiter, NAVER_MOBILE_HOST
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -59,14 +61,52 @@ TYPES_QUERY_DESC = (
     "- 연립주택 (또는 JWJT)"
 )
 
-# ── 매물 리스트 캐시 (단일 프로세스 기준) ─────────────────
-listing_query_cache: dict = {"query": None, "listings": []}
+# ── 매물 검색 캐시 (단일 프로세스 기준) ───────────────────
+# (정규화된 query, 정렬된 유형 코드) → 저장된 매물 리스트
 listing_cache_ttl: int = 60
-listing_cache_time: Optional[float] = None
+listing_search_cache = TTLCache("listing_search", maxsize=1_000, ttl=listing_cache_ttl)
 cached_listings: list = []
 
+# complexList는 APT·OPST 단지만 반환
+_COMPLEX_TYPE_CODES = {"APT", "OPST"}
+
+
+def normalize_types(types: Optional[list[str]]) -> tuple[str, ...]:
+    """유형 입력(표시명·코드 혼용)을 정렬된 유형 코드 튜플로 변환. 필터 없음은 ()"""
+    if not types:
+        return ()
+    return tuple(sorted({TYPE_LABEL_TO_CODE.get(t, t) for t in types}))
+
+
+def listing_cache_key(query: str, types: Optional[list[str]]) -> tuple:
+    return " ".join(query.split()).lower(), normalize_types(types)
+
+
+def filter_listings_by_types(listings: list, types: list[str]) -> Optional[list]:
+    """
+    전체 유형 검색 결과에서 types 필터 결과를 만든다.
+    Naver 필터와 같은 규칙을 따르며(단지 매물은 APT·OPST 요청 시 포함),
+    유형을 알 수 없는 매물이 있어 동일한 결과를 보장할 수 없으면 None을 반환한다.
+    """
+    codes = {TYPE_LABEL_TO_CODE[t] for t in types if t in TYPE_LABEL_TO_CODE}
+    if not codes:
+        return None
+    include_complex = bool(codes & _COMPLEX_TYPE_CODES)
+    filtered = []
+    for l in listings:
+        if l.get("source") == "complex":
+            if include_complex:
+                filtered.append(l)
+            continue
+        code = TYPE_LABEL_TO_CODE.get(l.get("type"))
+        if code is None:
+            return None
+        if code in codes:
+            filtered.append(l)
+    return filtered
+
 # ── 유형 추론 캐시 ─────────────────────────────────────────
-_type_cache: dict = {}
+_type_cache = TTLCache("type_infer", maxsize=20_000, ttl=24 * 3600)
 
 
 async def infer_type_from_address(address: str) -> str:
@@ -74,8 +114,9 @@ async def infer_type_from_address(address: str) -> str:
     주소 기반 매물 유형 자동 추론.
     동기 requests를 asyncio.to_thread로 감싸 이벤트 루프 블로킹 방지.
     """
-    if address in _type_cache:
-        return _type_cache[address]
+    cached = _type_cache.get(address)
+    if cached is not None:
+        return cached
 
     lat, lng = await address_to_coords(address)
     url = "https://m.land.naver.com/cluster/ajax/articleList"
@@ -96,10 +137,11 @@ async def infer_type_from_address(address: str) -> str:
         return res.json()
 
     try:
+        await get_rate_limiter(NAVER_MOBILE_HOST).acquire()
         data = await asyncio.to_thread(_fetch)
         if data.get("body"):
             inferred = data["body"][0].get("rletTpNm", "기타")
-            _type_cache[address] = inferred
+            _type_cache.set(address, inferred)
             return inferred
     except Exception:
         pass
@@ -1,9 +1,16 @@
-import asyncio
 import logging
 import os
 
 from fastapi import APIRouter, Depends, Header, HTTPException
-from app.database import reset_table_auto_increment
+from app.database import get_pool_stats, get_insert_stats
+from app.utils.cache import get_cache_stats
+from app.utils.singleflight import get_singleflight_stats
+from app.utils.rate_limit import get_rate_limit_stats
+from app.services.geolocation import get_reverse_geocode_stats
+from app.services.geocode_store import get_store
+from app.services.prefetch import get_prefetch_stats
+from src.util import get_direction_latency_stats
+from app.db_async import reset_table_auto_increment, rebuild_market_daily, get_executor_stats
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -33,7 +40,7 @@ def verify_admin_key(x_admin_key: str = Header(..., description="관리자 API K
 )
 async def reset_table(table: str):
     try:
-        result = await asyncio.to_thread(reset_table_auto_increment, table)
+        result = await reset_table_auto_increment(table)
         logger.info(f"[테이블 초기화] {table} 완료")
         return result
     except ValueError as e:
@@ -41,3 +48,49 @@ async def reset_table(table: str):
     except Exception as e:
         logger.error(f"[테이블 초기화 실패] {e}")
         return {"error": str(e)}
+
+
+@router.post(
+    "/admin/rollup/rebuild",
+    summary="시세 일일 집계 재생성",
+    description=(
+        "listings 원본에서 market_daily 일일 집계를 다시 계산합니다.\n\n"
+        "**인증 필수:** `X-Admin-Key` 헤더에 관리자 키를 포함해야 합니다.\n\n"
+        "기본값은 집계에 없는 (지역, 유형, 날짜) 행만 채우며 기존 누적값은 보존합니다.\n\n"
+        "`full=true`면 집계 전체를 비우고 현재 listings로 재생성합니다 (이미 비워진 매물의 집계는 사라집니다).\n\n"
+        "CLI: `python -m app.database rebuild-rollup`"
+    ),
+    response_description="삭제·생성된 집계 행 수",
+    dependencies=[Depends(verify_admin_key)],
+)
+async def rebuild_rollup(full: bool = False):
+    try:
+        return await rebuild_market_daily(full)
+    except Exception as e:
+        logger.error(f"[집계 재생성 실패] {e}")
+        return {"error": str(e)}
+
+@router.get(
+    "/admin/metrics",
+    summary="서버 내부 지표 조회",
+    description=(
+        "DB 커넥션 풀 포화도, listings 저장 처리량(rows/s), 캐시 적중률, 업스트림 요청 병합 횟수 등 서버 내부 지표를 반환합니다.\n\n"
+        "**인증 필수:** `X-Admin-Key` 헤더에 관리자 키를 포함해야 합니다."
+    ),
+    response_description="내부 지표",
+    dependencies=[Depends(verify_admin_key)],
+)
+async def get_metrics():
+    store = get_store()
+    return {
+        "db_pool": get_pool_stats(),
+        "db_insert": get_insert_stats(),
+        "db_executor": get_executor_stats(),
+        "caches": get_cache_stats(),
+        "singleflight": get_singleflight_stats(),
+        "rate_limits": get_rate_limit_stats(),
+        "reverse_geocode": get_reverse_geocode_stats(),
+        "geocode_store": store.stats() if store else None,
+        "direction_fanout": get_direction_latency_stats(),
+        "prefetch": get_prefetch_stats(),
+    }
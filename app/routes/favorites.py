@@ -1,9 +1,8 @@
-import asyncio
 import logging
 
 from fastapi import APIRouter, Body, Query
 from app.schemas import FavoriteRequest
-from app.database import add_favorite, get_favorites_db, delete_favorite
+from app.db_async import add_favorite, get_favorites_db, delete_favorite
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -20,7 +19,7 @@ router = APIRouter()
 )
 async def create_favorite(data: FavoriteRequest = Body(...)):
     try:
-        result = await asyncio.to_thread(add_favorite, data.user_id, data.listing_id)
+        result = await add_favorite(data.user_id, data.listing_id)
         if result is None:
             return {"error": "이미 즐겨찾기에 추가된 매물입니다."}
         return result
@@ -37,7 +36,7 @@ async def create_favorite(data: FavoriteRequest = Body(...)):
 )
 async def list_favorites(user_id: str):
     try:
-        rows = await asyncio.to_thread(get_favorites_db, user_id)
+        rows = await get_favorites_db(user_id)
         return {"favorites": rows}
     except Exception as e:
         logger.error(f"[즐겨찾기 조회 실패] {e}")
@@ -59,7 +58,7 @@ async def remove_favorite(
     user_id: str = Query(..., description="사용자 식별자"),
 ):
     try:
-        deleted = await asyncio.to_thread(delete_favorite, favorite_id, user_id)
+        deleted = await delete_favorite(favorite_id, user_id)
         if not deleted:
             return {"error": "해당 즐겨찾기 항목이 없거나 권한이 없습니다."}
         return {"deleted": True, "favorite_id": favorite_id}
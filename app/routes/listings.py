@@ -1,12 +1,15 @@
 import asyncio
+import json
 import logging
 import time
 from typing import List, Optional
 
 from fastapi import APIRouter, Query
-from app.database import save_listings, get_listing_by_id_db
+from fastapi.responses import StreamingResponse
+from app.db_async import save_listings, get_listing_by_id_db
 from app.services.geolocation import address_to_coords
-from app.routes._shared import CITY_CENTERS, TYPES_QUERY_DESC, cached_listings, listing_query_cache, listing_cache_ttl, listing_cache_time
+from app.services.prefetch import get_area_listings
+from app.routes._shared import CITY_CENTERS, TYPES_QUERY_DESC, listing_cache_key, filter_listings_by_types
 from src.classes import NLocation
 from src.util import get_article_listings, get_complex_listings
 
@@ -21,7 +24,8 @@ router = APIRouter()
     summary="지역 기반 매물 검색",
     description=(
         "지역명(동·역·학교 등)을 입력하면 해당 위치 주변 매물 목록을 반환합니다.\n\n"
-        "동일한 query는 60초 동안 캐시됩니다. types 필터를 사용하면 캐시가 적용되지 않습니다."
+        "동일한 query·types 조합은 60초 동안 캐시됩니다.\n\n"
+        "같은 query의 전체 유형 결과가 캐시에 있으면 types 필터 결과도 캐시에서 만들어 반환합니다."
     ),
     response_description="매물 리스트",
 )
@@ -31,21 +35,23 @@ async def search_listings(
 ):
     start = time.perf_counter()
 
-    if (
-        not types
-        and _shared.listing_query_cache["query"] == query
-        and _shared.listing_cache_time is not None
-        and (time.time() - _shared.listing_cache_time) < _shared.listing_cache_ttl
-    ):
-        logger.info(f"[리스트 캐시 반환] {time.perf_counter() - start:.2f}초 소요")
-        return {"listings": _shared.listing_query_cache["listings"]}
+    cache_key = listing_cache_key(query, types)
+    cached = _shared.listing_search_cache.get(cache_key)
+    if cached is None and types:
+        unfiltered = _shared.listing_search_cache.get(listing_cache_key(query, None))
+        if unfiltered is not None:
+            cached = filter_listings_by_types(unfiltered, types)
+            if cached is not None:
+                _shared.listing_search_cache.set(cache_key, cached)
+    if cached is not None:
+        logger.info(f"[리스트 캐시 반환] {len(cached)}건, {time.perf_counter() - start:.2f}초 소요")
+        return {"listings": cached}
 
     try:
         lat, lng = await address_to_coords(query)
         loc = NLocation(lat, lng)
         listings = []
 
-        await asyncio.sleep(0.3)
         results = await asyncio.gather(
             get_article_listings(loc, pages=2, estate_types=types),
             get_complex_listings(loc, estate_types=types),
@@ -57,13 +63,11 @@ async def search_listings(
             else:
                 listings.extend(r)
 
-        saved = await asyncio.to_thread(save_listings, listings, query)
+        saved = await save_listings(listings, query)
 
+        _shared.listing_search_cache.set(cache_key, saved)
         if not types:
             _shared.cached_listings = saved
-            _shared.listing_query_cache["query"] = query
-            _shared.listing_query_cache["listings"] = saved
-            _shared.listing_cache_time = time.time()
 
         logger.info(f"[리스트 검색 완료] {len(saved)}건, {time.perf_counter() - start:.2f}초 소요")
         return {"listings": saved}
@@ -78,37 +82,26 @@ async def search_listings(
     summary="전국 주요 도시 매물 조회",
     description=(
         "서울·부산·대구 등 13개 주요 도시 중심 좌표 기준으로 매물을 가져옵니다.\n\n"
-        "13개 도시를 동시에 조회하므로 응답에 수십 초가 걸릴 수 있습니다."
+        "도시별 매물은 백그라운드에서 주기적으로 갱신한 스냅샷으로 응답하며, "
+        "스냅샷이 없을 때만 실시간으로 조회해 수십 초가 걸릴 수 있습니다.\n\n"
+        "stream=true이면 도시별 조회·저장이 끝나는 순서대로 한 줄씩 NDJSON으로 보냅니다 "
+        "(`{\"city\", \"listings\", \"count\", \"elapsed_ms\"}` 줄들과 마지막 `{\"done\": true, \"failed\", ...}` 요약 줄). "
+        "실패한 도시는 `{\"city\", \"error\"}` 줄로 보냅니다."
     ),
-    response_description="도시별 매물 딕셔너리",
+    response_description="도시별 매물 딕셔너리 (stream=true이면 application/x-ndjson)",
 )
 async def nationwide_listings(
     types: Optional[List[str]] = Query(None, description=TYPES_QUERY_DESC),
+    stream: bool = Query(False, description="도시별 결과를 완료 순서대로 NDJSON 스트리밍"),
 ):
+    if stream:
+        return StreamingResponse(_stream_nationwide(types), media_type="application/x-ndjson")
+
     results = {}
     all_listings = []
 
-    async def fetch(city: str, lat: float, lng: float):
-        loc = NLocation(lat, lng)
-        city_results = await asyncio.gather(
-            get_article_listings(loc, pages=2, estate_types=types),
-            get_complex_listings(loc, estate_types=types),
-            return_exceptions=True,
-        )
-        await asyncio.sleep(0.5)
-        combined = []
-        for r in city_results:
-            if isinstance(r, Exception):
-                logger.warning(f"[{city}] 조회 실패: {r}")
-            else:
-                combined.extend(r)
-        return combined
-
-    tasks = [fetch(city, lat, lng) for city, (lat, lng) in CITY_CENTERS.items()]
-    listings_per_city = await asyncio.gather(*tasks)
-
-    for (city, _), city_listings in zip(CITY_CENTERS.items(), listings_per_city):
-        saved = await asyncio.to_thread(save_listings, city_listings, city)
+    tasks = [_fetch_and_save_city(city, lat, lng, types) for city, (lat, lng) in CITY_CENTERS.items()]
+    for city, saved in await asyncio.gather(*tasks):
         results[city] = saved
         all_listings.extend(saved)
 
@@ -116,6 +109,69 @@ async def nationwide_listings(
     return results
 
 
+async def _fetch_city(city: str, lat: float, lng: float, types: Optional[List[str]]) -> list:
+    # 도시는 스케줄러가 항상 갱신하므로 인기 지역 집계에서 제외
+    return await get_area_listings(NLocation(lat, lng), types, label=city, track=False)
+
+
+async def _fetch_and_save_city(city: str, lat: float, lng: float, types: Optional[List[str]]):
+    """도시 하나를 조회한 뒤 바로 저장 — 다른 도시의 조회를 기다리지 않는다"""
+    saved = await save_listings(await _fetch_city(city, lat, lng, types), city)
+    return city, saved
+
+
+async def _stream_city(city: str, lat: float, lng: float, types: Optional[List[str]]):
+    """스트리밍용 — 실패해도 어느 도시인지 알 수 있도록 (도시, 결과, 예외)로 돌려준다"""
+    try:
+        return (*await _fetch_and_save_city(city, lat, lng, types), None)
+    except Exception as e:
+        return city, None, e
+
+
+async def _stream_nationwide(types: Optional[List[str]]):
+    """
+    도시별 조회·저장이 끝나는 대로 NDJSON 한 줄씩 내보낸다.
+    보낸 도시의 결과는 더 들고 있지 않으므로 전체 응답을 한꺼번에 직렬화하지 않는다
+    (cached_listings도 갱신하지 않는다 — 전체 목록을 모아야 하기 때문).
+    """
+    start = time.perf_counter()
+    ttfb = None
+    total = 0
+    failed = []
+    tasks = [
+        asyncio.create_task(_stream_city(city, lat, lng, types))
+        for city, (lat, lng) in CITY_CENTERS.items()
+    ]
+    try:
+        for done in asyncio.as_completed(tasks):
+            city, saved, error = await done
+            if error is not None:
+                logger.warning(f"[전국 스트리밍] {city} 조회·저장 실패: {error}")
+                failed.append(city)
+                yield json.dumps({"city": city, "error": str(error)}, ensure_ascii=False) + "\n"
+                continue
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            total += len(saved)
+            yield json.dumps(
+                {"city": city, "listings": saved, "count": len(saved), "elapsed_ms": elapsed_ms},
+                ensure_ascii=False,
+            ) + "\n"
+            if ttfb is None:
+                ttfb = elapsed_ms
+                logger.info(f"[전국 스트리밍] 첫 도시 {city} 전송, TTFB {ttfb:.0f}ms")
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.info(f"[전국 스트리밍 완료] {len(tasks)}개 도시 {total}건, TTFB {ttfb}ms, 전체 {elapsed_ms:.0f}ms")
+        yield json.dumps(
+            {"done": True, "cities": len(tasks), "failed": failed, "total": total,
+             "ttfb_ms": ttfb, "elapsed_ms": elapsed_ms},
+            ensure_ascii=False,
+        ) + "\n"
+    finally:
+        # 클라이언트가 중간에 끊으면 남은 도시 조회를 취소
+        for task in tasks:
+            task.cancel()
+
+
 @router.get(
     "/listings/{id}",
     summary="ID로 개별 매물 조회",
@@ -125,8 +181,8 @@ async def nationwide_listings(
     ),
     response_description="단일 매물 상세 정보",
 )
-def get_listing_by_id(id: int):
-    row = get_listing_by_id_db(id)
+async def get_listing_by_id(id: int):
+    row = await get_listing_by_id_db(id)
     if row:
         return row
     return {"error": f"해당 ID({id})의 매물이 존재하지 않습니다."}
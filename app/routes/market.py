@@ -1,14 +1,13 @@
-import asyncio
 import logging
 import time
 from typing import Optional
 
 from fastapi import APIRouter, Query
-from app.database import get_market_trend_db
+from app.db_async import get_market_trend_db
 from app.services.geolocation import address_to_coords
+from app.services.prefetch import get_area_listings
 from app.routes._shared import TYPES_QUERY_DESC
 from src.classes import NLocation
-from src.util import get_article_listings, get_complex_listings
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -33,16 +32,7 @@ async def get_market_stats(
         loc = NLocation(lat, lng)
         type_filter = [type] if type else None
 
-        results = await asyncio.gather(
-            get_article_listings(loc, pages=2, estate_types=type_filter),
-            get_complex_listings(loc, estate_types=type_filter),
-            return_exceptions=True,
-        )
-
-        listings = []
-        for r in results:
-            if not isinstance(r, Exception):
-                listings.extend(r)
+        listings = await get_area_listings(loc, type_filter, label=query)
 
         if not listings:
             return {"area": query, "total_count": 0, "by_type": {}, "price_range": {"min": 0, "max": 0}}
@@ -83,7 +73,8 @@ async def get_market_stats(
     summary="지역 가격 트렌드 조회",
     description=(
         "지역명과 유형을 입력하면 날짜별 평균 환산가격 추이를 반환합니다.\n\n"
-        "데이터는 listings/search 또는 listings/all 조회 시 DB에 축적됩니다."
+        "데이터는 listings/search 또는 listings/all 조회 시 DB에 축적됩니다.\n\n"
+        "시도·시군구 단위 지역명(예: 서울, 마포구)은 일일 집계 테이블에서 조회합니다."
     ),
     response_description="날짜별 평균 가격 트렌드",
 )
@@ -92,7 +83,7 @@ async def get_market_trend(
     type: Optional[str] = Query(None, description="매물 유형 필터 (선택). 예) 원룸"),
 ):
     try:
-        rows = await asyncio.to_thread(get_market_trend_db, query, type)
+        rows = await get_market_trend_db(query, type)
         trend = [
             {"date": str(r["date"]), "avg_price": int(r["avg_price"] or 0), "count": r["count"]}
             for r in rows
@@ -4,7 +4,7 @@ import time
 
 from fastapi import APIRouter, Body
 from app.schemas import RecommendRequest
-from app.database import save_listings
+from app.db_async import save_listings
 from app.services.geolocation import address_to_coords
 from app.routes._shared import pyeong_to_m2, to_pyeong, TYPES_QUERY_DESC
 from src.classes import NLocation
@@ -54,7 +54,7 @@ async def recommend_listings(data: RecommendRequest = Body(...)):
             return l.get("price", 0) / (l.get("area") or 1)
 
         sorted_listings = sorted(filtered, key=price_per_m2)[:data.top_n]
-        saved = await asyncio.to_thread(save_listings, sorted_listings, data.query)
+        saved = await save_listings(sorted_listings, data.query)
 
         recommendations = [
             {
@@ -1,9 +1,11 @@
 import os
-import time
 import asyncio
 import httpx
 from dotenv import load_dotenv
 from app.schemas import FacilityItem, FacilitySummary
+from app.services.http_clients import get_client, get_rate_limiter, KAKAO_API_HOST
+from app.utils.cache import TTLCache
+from app.utils.singleflight import SingleFlight
 
 load_dotenv()
 
@@ -22,9 +24,10 @@ CATEGORIES = {
     "parks": "PK6",                # 공원
 }
 
-# 편의시설 TTL 캐시: { "lat,lng" -> (result_dict, timestamp) }
-_FACILITIES_CACHE: dict[str, tuple[dict, float]] = {}
+# 편의시설 TTL 캐시: { "lat,lng" -> result_dict }
 _FACILITIES_TTL = 300  # 5분
+_FACILITIES_CACHE = TTLCache("facilities", maxsize=5_000, ttl=_FACILITIES_TTL)
+_facilities_flight = SingleFlight("kakao.facilities")
 
 # 카테고리별 비동기 요청
 async def fetch_category(client: httpx.AsyncClient, lat: float, lng: float, category_code: str) -> list[FacilityItem]:
@@ -37,6 +40,7 @@ async def fetch_category(client: httpx.AsyncClient, lat: float, lng: float, cate
         "size": 15
     }
     try:
+        await get_rate_limiter(KAKAO_API_HOST).acquire()
         resp = await client.get(CATEGORY_URL, headers=headers, params=params, timeout=3.0)
         resp.raise_for_status()
         data = resp.json()
@@ -52,21 +56,22 @@ async def fetch_category(client: httpx.AsyncClient, lat: float, lng: float, cate
         print(f"[카테고리 요청 실패] {category_code}: {e}")
         return []
 
-# 비동기 편의시설 전체 수집 (TTL 캐시 적용)
+# 비동기 편의시설 전체 수집 (TTL 캐시 + 동시 요청 병합)
 async def async_get_nearby_facilities(lat: float, lng: float) -> dict:
     cache_key = f"{lat:.4f},{lng:.4f}"
     cached = _FACILITIES_CACHE.get(cache_key)
     if cached is not None:
-        result, ts = cached
-        if time.time() - ts < _FACILITIES_TTL:
-            return result
+        return cached
+    return await _facilities_flight.do(cache_key, lambda: _fetch_nearby_facilities(lat, lng, cache_key))
 
-    async with httpx.AsyncClient() as client:
-        tasks = {
-            name: fetch_category(client, lat, lng, code)
-            for name, code in CATEGORIES.items()
-        }
-        results = await asyncio.gather(*tasks.values(), return_exceptions=False)
+
+async def _fetch_nearby_facilities(lat: float, lng: float, cache_key: str) -> dict:
+    client = get_client(KAKAO_API_HOST)  # 공유 커넥션 풀 (keep-alive 재사용)
+    tasks = {
+        name: fetch_category(client, lat, lng, code)
+        for name, code in CATEGORIES.items()
+    }
+    results = await asyncio.gather(*tasks.values(), return_exceptions=False)
     result = dict(zip(tasks.keys(), results))
-    _FACILITIES_CACHE[cache_key] = (result, time.time())
+    _FACILITIES_CACHE.set(cache_key, result)
     return result
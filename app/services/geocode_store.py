@@ -0,0 +1,290 @@
+"""
+디스크 지오코딩 저장소 (SQLite).
+
+인메모리 캐시(geolocation._address_cache / _coords_cache)는 배포나 --reload 때마다 비워진다.
+GeocodeStore는 주소↔좌표 결과를 로컬 SQLite 파일에 보관한다.
+- 읽기: 메모리 캐시 미스 시 디스크를 조회 (read-through)
+- 쓰기: put_*()은 메모리 버퍼에만 쌓고 flush()에서 한 트랜잭션으로 기록 (write-behind)
+- 크기: 테이블별 max_entries를 넘으면 가장 오래 사용되지 않은 행부터 삭제
+- 시작: recent_*()로 최근 항목을 메모리 캐시에 미리 적재 (warm start)
+
+내보내기/가져오기 (JSON Lines):
+    python -m app.services.geocode_store export geocode.jsonl
+    python -m app.services.geocode_store import geocode.jsonl
+"""
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from typing import IO, Optional
+
+logger = logging.getLogger(__name__)
+
+GEOCODE_STORE_PATH = os.getenv("GEOCODE_STORE_PATH", "data/geocode.sqlite3")
+GEOCODE_STORE_MAX_ENTRIES = int(os.getenv("GEOCODE_STORE_MAX_ENTRIES", 500_000))
+
+_M_PER_DEG_LAT = 111_320.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS address (
+    address TEXT PRIMARY KEY,
+    lat REAL NOT NULL,
+    lng REAL NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_address_used ON address (used_at);
+CREATE TABLE IF NOT EXISTS coords (
+    lat REAL NOT NULL,
+    lng REAL NOT NULL,
+    address TEXT NOT NULL,
+    used_at REAL NOT NULL,
+    PRIMARY KEY (lat, lng)
+);
+CREATE INDEX IF NOT EXISTS idx_coords_used ON coords (used_at);
+"""
+
+
+class GeocodeStore:
+    """스레드 안전 SQLite 지오코딩 저장소. 이벤트 루프에서는 asyncio.to_thread로 호출한다."""
+
+    def __init__(self, path: str, max_entries: int = GEOCODE_STORE_MAX_ENTRIES):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # _lock: SQLite 연결 (읽기·flush 기록), _pending_lock: 쓰기 버퍼만
+        # put_*()은 이벤트 루프에서 바로 호출되므로 디스크 기록 중인 _lock을 기다리지 않게 분리한다
+        self._lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        # 쓰기 대기 버퍼 — 같은 키는 마지막 값만 남긴다
+        self._pending_address: dict[str, tuple[float, float, float]] = {}
+        self._pending_coords: dict[tuple[float, float], tuple[str, float]] = {}
+        # 테이블별 행 수 — flush마다 COUNT(*)를 하지 않도록 쓰기·삭제 시 갱신
+        self._rows = {table: self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                      for table in ("address", "coords")}
+        self.hits = 0
+        self.misses = 0
+        self.flushed = 0
+        self.pruned = 0
+
+    # ── 읽기 ─────────────────────────────────────────────
+    def get_address(self, address: str) -> Optional[tuple[float, float]]:
+        with self._lock:
+            row = self._conn.execute("SELECT lat, lng FROM address WHERE address = ?", (address,)).fetchone()
+            self._count(row)
+        if row is None:
+            return None
+        self.put_address(address, row[0], row[1])  # used_at 갱신
+        return row[0], row[1]
+
+    def get_coords(self, lat: float, lng: float, radius_m: float) -> Optional[str]:
+        """radius_m 이내에서 가장 가까운 저장 좌표의 주소"""
+        return self.get_coords_many([(lat, lng)], radius_m)[0]
+
+    def get_coords_many(self, points: list[tuple[float, float]], radius_m: float) -> list[Optional[str]]:
+        dlat = radius_m / _M_PER_DEG_LAT
+        results: list[Optional[str]] = []
+        touched = []
+        with self._lock:
+            for lat, lng in points:
+                dlng = dlat / max(math.cos(math.radians(lat)), 1e-6)
+                rows = self._conn.execute(
+                    "SELECT lat, lng, address FROM coords WHERE lat BETWEEN ? AND ? AND lng BETWEEN ? AND ?",
+                    (lat - dlat, lat + dlat, lng - dlng, lng + dlng),
+                ).fetchall()
+                best, best_d = None, radius_m
+                for row in rows:
+                    x = (row[1] - lng) * math.cos(math.radians((lat + row[0]) / 2))
+                    d = math.hypot(x, row[0] - lat) * _M_PER_DEG_LAT
+                    if d <= best_d:
+                        best, best_d = row, d
+                self._count(best)
+                results.append(best[2] if best else None)
+                if best:
+                    touched.append(best)
+        for row in touched:
+            self.put_coords(row[0], row[1], row[2])
+        return results
+
+    def recent_addresses(self, limit: int) -> list[tuple[str, float, float]]:
+        """최근 사용 순 (address, lat, lng)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT address, lat, lng FROM address ORDER BY used_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+    def recent_coords(self, limit: int) -> list[tuple[float, float, str]]:
+        """최근 사용 순 (lat, lng, address)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT lat, lng, address FROM coords ORDER BY used_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+    # ── 쓰기 ─────────────────────────────────────────────
+    def put_address(self, address: str, lat: float, lng: float):
+        with self._pending_lock:
+            self._pending_address[address] = (lat, lng, time.time())
+
+    def put_coords(self, lat: float, lng: float, address: str):
+        with self._pending_lock:
+            self._pending_coords[(lat, lng)] = (address, time.time())
+
+    def flush(self) -> int:
+        """쓰기 버퍼를 한 트랜잭션으로 기록하고 크기 제한을 적용. 기록한 행 수 반환"""
+        # 버퍼 교체는 _pending_lock 안에서 짧게, 디스크 기록은 _lock 안에서만 한다
+        # (_lock을 교체 전에 잡아 두 flush가 겹쳐도 먼저 교체한 쪽이 먼저 기록한다)
+        with self._lock:
+            with self._pending_lock:
+                pending_address, self._pending_address = self._pending_address, {}
+                pending_coords, self._pending_coords = self._pending_coords, {}
+            if not pending_address and not pending_coords:
+                return 0
+            addresses = [(a, lat, lng, t) for a, (lat, lng, t) in pending_address.items()]
+            coords = [(lat, lng, a, t) for (lat, lng), (a, t) in pending_coords.items()]
+            with self._conn:
+                self._write(addresses, coords)
+            self.flushed += len(addresses) + len(coords)
+        return len(addresses) + len(coords)
+
+    def _write(self, addresses: list[tuple], coords: list[tuple]):
+        """_lock 안에서 호출. 기존 행은 갱신하고 새 행만 삽입해 행 수를 추적한다"""
+        self._conn.executemany("UPDATE address SET lat = ?, lng = ?, used_at = ? WHERE address = ?",
+                               [(lat, lng, t, a) for a, lat, lng, t in addresses])
+        self._rows["address"] += self._conn.executemany(
+            "INSERT OR IGNORE INTO address VALUES (?, ?, ?, ?)", addresses).rowcount
+        self._conn.executemany("UPDATE coords SET address = ?, used_at = ? WHERE lat = ? AND lng = ?",
+                               [(a, t, lat, lng) for lat, lng, a, t in coords])
+        self._rows["coords"] += self._conn.executemany(
+            "INSERT OR IGNORE INTO coords VALUES (?, ?, ?, ?)", coords).rowcount
+        for table in ("address", "coords"):
+            excess = self._rows[table] - self.max_entries
+            if excess > 0:
+                deleted = self._conn.execute(
+                    f"DELETE FROM {table} WHERE rowid IN "
+                    f"(SELECT rowid FROM {table} ORDER BY used_at LIMIT ?)", (excess,)
+                ).rowcount
+                self._rows[table] -= deleted
+                self.pruned += deleted
+
+    # ── 내보내기 / 가져오기 ───────────────────────────────
+    def export_jsonl(self, fp: IO[str]) -> int:
+        self.flush()
+        count = 0
+        with self._lock:
+            for address, lat, lng, used_at in self._conn.execute("SELECT * FROM address ORDER BY used_at"):
+                fp.write(json.dumps({"kind": "address", "address": address, "lat": lat, "lng": lng,
+                                     "used_at": used_at}, ensure_ascii=False) + "\n")
+                count += 1
+            for lat, lng, address, used_at in self._conn.execute("SELECT * FROM coords ORDER BY used_at"):
+                fp.write(json.dumps({"kind": "coords", "address": address, "lat": lat, "lng": lng,
+                                     "used_at": used_at}, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def import_jsonl(self, fp: IO[str]) -> int:
+        addresses, coords = [], []
+        now = time.time()
+        for line in fp:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            used_at = item.get("used_at", now)
+            if item["kind"] == "address":
+                addresses.append((item["address"], item["lat"], item["lng"], used_at))
+            elif item["kind"] == "coords":
+                coords.append((item["lat"], item["lng"], item["address"], used_at))
+        with self._lock, self._conn:
+            self._write(addresses, coords)
+        return len(addresses) + len(coords)
+
+    # ── 기타 ─────────────────────────────────────────────
+    def _count(self, row):
+        if row is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+    def stats(self) -> dict:
+        # 이벤트 루프(/admin/metrics)에서 호출되므로 SQLite 연결 락을 잡지 않는다
+        sizes = dict(self._rows)
+        with self._pending_lock:
+            pending = len(self._pending_address) + len(self._pending_coords)
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "max_entries": self.max_entries,
+            **sizes,
+            "pending": pending,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "flushed": self.flushed,
+            "pruned": self.pruned,
+        }
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+_store: Optional[GeocodeStore] = None
+
+
+def open_store(path: str = GEOCODE_STORE_PATH, max_entries: int = GEOCODE_STORE_MAX_ENTRIES) -> GeocodeStore:
+    global _store
+    if _store is None:
+        _store = GeocodeStore(path, max_entries)
+    return _store
+
+
+def get_store() -> Optional[GeocodeStore]:
+    """lifespan에서 open_store()를 호출하기 전에는 None — 디스크 저장 없이 메모리 캐시만 사용"""
+    return _store
+
+
+def close_store():
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="지오코딩 저장소 관리 명령")
+    parser.add_argument("--db", default=GEOCODE_STORE_PATH, help="SQLite 파일 경로")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("export", help="JSON Lines로 내보내기 (- 는 stdout)").add_argument("file")
+    sub.add_parser("import", help="JSON Lines 가져오기 (- 는 stdin)").add_argument("file")
+    sub.add_parser("stats", help="저장 항목 수")
+    args = parser.parse_args()
+
+    store = GeocodeStore(args.db)
+    if args.command == "export":
+        if args.file == "-":
+            n = store.export_jsonl(sys.stdout)
+        else:
+            with open(args.file, "w", encoding="utf-8") as f:
+                n = store.export_jsonl(f)
+        print(f"{n}건 내보냄", file=sys.stderr)
+    elif args.command == "import":
+        if args.file == "-":
+            n = store.import_jsonl(sys.stdin)
+        else:
+            with open(args.file, encoding="utf-8") as f:
+                n = store.import_jsonl(f)
+        print(f"{n}건 가져옴", file=sys.stderr)
+    else:
+        print(store.stats())
+    store.close()
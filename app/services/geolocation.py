@@ -1,7 +1,12 @@
 import os
+import asyncio
 import logging
 import httpx
 from dotenv import load_dotenv
+from app.utils.cache import TTLCache
+from app.utils.spatial_cache import SpatialCache
+from app.services.geocode_store import get_store
+from app.services.http_clients import get_rate_limiter, KAKAO_API_HOST
 
 load_dotenv()
 logger = logging.getLogger(__name__)
@@ -10,9 +15,19 @@ KAKAO_API_KEY = os.getenv("KAKAO_REST_API_KEY")
 GEOCODE_URL = "https://dapi.kakao.com/v2/local/search/address.json"
 REVERSE_GEOCODE_URL = "https://dapi.kakao.com/v2/local/geo/coord2address.json"
 
-# 캐시
-_address_cache: dict[str, tuple[float, float]] = {}
-_coords_cache: dict[str, str] = {}
+# 캐시 — 주소·좌표 매핑은 거의 변하지 않으므로 TTL을 길게 둔다
+_GEOCODE_TTL = 7 * 24 * 3600  # 7일
+# 역지오코딩은 반경 GEOCODE_CACHE_RADIUS_M 이내의 캐시 좌표가 있으면 그 주소를 재사용
+GEOCODE_CACHE_RADIUS_M = float(os.getenv("GEOCODE_CACHE_RADIUS_M", 10))
+_address_cache = TTLCache("geocode.address", maxsize=50_000, ttl=_GEOCODE_TTL)   # address -> (lat, lng)
+_coords_cache = SpatialCache("geocode.coords", radius_m=GEOCODE_CACHE_RADIUS_M,
+                             maxsize=100_000, ttl=_GEOCODE_TTL)                   # (lat, lng) -> address
+
+# 배치 역지오코딩 — 이 간격(도) 격자 안의 좌표는 같은 주소로 보고 한 번만 조회 (약 11m)
+REVERSE_GEOCODE_TOLERANCE = 1e-4
+REVERSE_GEOCODE_CONCURRENCY = 8
+_reverse_semaphore = asyncio.Semaphore(REVERSE_GEOCODE_CONCURRENCY)
+_reverse_stats = {"batches": 0, "points": 0, "deduped": 0, "cache_hits": 0, "store_hits": 0, "upstream_calls": 0}
 
 _shared_client: httpx.AsyncClient | None = None
 
@@ -26,14 +41,36 @@ async def close_shared_client():
         await _shared_client.aclose()
         _shared_client = None
 
+async def _store_call(method: str, *args):
+    """디스크 저장소 조회 — 저장소가 없거나 실패하면 None (업스트림 조회로 진행)"""
+    store = get_store()
+    if store is None:
+        return None
+    try:
+        return await asyncio.to_thread(getattr(store, method), *args)
+    except Exception as e:
+        logger.warning(f"[지오코딩 저장소 조회 실패] {e}")
+        return None
+
+def _store_put(method: str, *args):
+    store = get_store()
+    if store is not None:
+        getattr(store, method)(*args)
+
 async def address_to_coords(address: str) -> tuple[float, float]:
-    if address in _address_cache:
-        return _address_cache[address]
+    cached = _address_cache.get(address)
+    if cached is not None:
+        return cached
+    stored = await _store_call("get_address", address)
+    if stored is not None:
+        _address_cache.set(address, stored)
+        return stored
 
     headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
     params = {"query": address}
 
     try:
+        await get_rate_limiter(KAKAO_API_HOST).acquire()
         resp = await _shared_client.get(GEOCODE_URL, headers=headers, params=params)
         resp.raise_for_status()
         documents = resp.json().get("documents", [])
@@ -41,7 +78,13 @@ async def address_to_coords(address: str) -> tuple[float, float]:
             raise ValueError(f"[주소 변환 실패] 결과 없음: {address}")
         x = float(documents[0]["x"])  # 경도
         y = float(documents[0]["y"])  # 위도
-        _address_cache[address] = (y, x)
+        _address_cache.set(address, (y, x))
+        _store_put("put_address", address, y, x)
+        # 지번 주소가 있으면 해당 좌표의 역지오코딩 결과로도 재사용
+        jibun = (documents[0].get("address") or {}).get("address_name")
+        if jibun:
+            _coords_cache.set(y, x, jibun)
+            _store_put("put_coords", y, x, jibun)
         return y, x
     except Exception as e:
         logger.warning(f"[주소 변환 실패] {e}")
@@ -52,21 +95,114 @@ async def coords_to_address(lat: float, lng: float) -> str:
     if _shared_client is None:
         raise RuntimeError("HTTP client is not initialized")
 
-    key = f"{lat:.5f},{lng:.5f}"
-    if key in _coords_cache:
-        return _coords_cache[key]
+    cached = _coords_cache.get(lat, lng)
+    if cached is not None:
+        return cached
+    stored = await _store_call("get_coords", lat, lng, GEOCODE_CACHE_RADIUS_M)
+    if stored is not None:
+        _coords_cache.set(lat, lng, stored)
+        return stored
+    return await _fetch_address(lat, lng)
 
+async def _fetch_address(lat: float, lng: float) -> str:
+    """Kakao coord2address 호출. 성공한 결과만 캐시에 저장"""
     try:
         headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
         params = {"x": lng, "y": lat}
+        await get_rate_limiter(KAKAO_API_HOST).acquire()
         response = await _shared_client.get(REVERSE_GEOCODE_URL, headers=headers, params=params)
         response.raise_for_status()
         documents = response.json().get("documents", [])
         if not documents:
             return "주소 미상"
         address = documents[0]["address"].get("address_name", "주소 미상")
-        _coords_cache[key] = address
+        _coords_cache.set(lat, lng, address)
+        _store_put("put_coords", lat, lng, address)
         return address
     except Exception as e:
         logger.warning(f"[주소 변환 실패] {e}")
         return "주소 미상"
+
+async def reverse_geocode_batch(coords: list[tuple[float, float]]) -> list[str]:
+    """
+    좌표 목록 → 주소 목록 (입력 순서 유지).
+    REVERSE_GEOCODE_TOLERANCE 격자 단위로 근접 좌표를 묶고, 캐시에 없는 대표 좌표만
+    REVERSE_GEOCODE_CONCURRENCY개씩 Kakao에 조회한다.
+    """
+    if _shared_client is None:
+        raise RuntimeError("HTTP client is not initialized")
+
+    # 1) 근접 좌표 묶기: 격자 셀 → 대표 좌표(셀에 처음 들어온 좌표)
+    cells: dict[tuple[int, int], tuple[float, float]] = {}
+    point_cells = []
+    for lat, lng in coords:
+        cell = (round(lat / REVERSE_GEOCODE_TOLERANCE), round(lng / REVERSE_GEOCODE_TOLERANCE))
+        cells.setdefault(cell, (lat, lng))
+        point_cells.append(cell)
+
+    # 2) 캐시 조회
+    resolved: dict[tuple[int, int], str] = {}
+    pending: list[tuple[tuple[int, int], tuple[float, float]]] = []
+    for cell, (lat, lng) in cells.items():
+        cached = _coords_cache.get(lat, lng)
+        if cached is not None:
+            resolved[cell] = cached
+        else:
+            pending.append((cell, (lat, lng)))
+
+    # 2-1) 메모리 미스는 디스크 저장소에서 한 번에 조회
+    stored_hits = 0
+    if pending:
+        stored = await _store_call("get_coords_many", [p for _, p in pending], GEOCODE_CACHE_RADIUS_M)
+        if stored is not None:
+            still_pending = []
+            for (cell, (lat, lng)), address in zip(pending, stored):
+                if address is None:
+                    still_pending.append((cell, (lat, lng)))
+                else:
+                    _coords_cache.set(lat, lng, address)
+                    resolved[cell] = address
+            stored_hits = len(pending) - len(still_pending)
+            pending = still_pending
+
+    # 3) 남은 좌표만 동시 호출 수를 제한해 업스트림 조회
+    async def _bounded(lat: float, lng: float) -> str:
+        async with _reverse_semaphore:
+            return await _fetch_address(lat, lng)
+
+    addresses = await asyncio.gather(*[_bounded(lat, lng) for _, (lat, lng) in pending])
+    for (cell, _), address in zip(pending, addresses):
+        resolved[cell] = address
+
+    saved = len(coords) - len(pending)
+    _reverse_stats["batches"] += 1
+    _reverse_stats["points"] += len(coords)
+    _reverse_stats["deduped"] += len(coords) - len(cells)
+    _reverse_stats["cache_hits"] += len(cells) - len(pending) - stored_hits
+    _reverse_stats["store_hits"] += stored_hits
+    _reverse_stats["upstream_calls"] += len(pending)
+    logger.info(
+        f"[역지오코딩] 좌표 {len(coords)}개 → 근접 병합 {len(coords) - len(cells)}, "
+        f"캐시 {len(cells) - len(pending) - stored_hits}, 저장소 {stored_hits}, 업스트림 {len(pending)}건 ({saved}건 절감)"
+    )
+    return [resolved[cell] for cell in point_cells]
+
+def get_reverse_geocode_stats() -> dict:
+    """배치 역지오코딩 누적 지표 — saved_calls는 좌표당 1회 호출 대비 절감한 Kakao 호출 수"""
+    stats = dict(_reverse_stats)
+    stats["saved_calls"] = stats["points"] - stats["upstream_calls"]
+    return stats
+
+def warm_geocode_cache() -> int:
+    """디스크 저장소의 최근 항목을 메모리 캐시 크기만큼 미리 적재. 적재한 항목 수 반환"""
+    store = get_store()
+    if store is None:
+        return 0
+    # 오래된 것부터 넣어야 최근 항목이 LRU 뒤쪽에 남는다
+    addresses = store.recent_addresses(_address_cache.maxsize)
+    coords = store.recent_coords(_coords_cache.maxsize)
+    for address, lat, lng in reversed(addresses):
+        _address_cache.set(address, (lat, lng))
+    for lat, lng, address in reversed(coords):
+        _coords_cache.set(lat, lng, address)
+    return len(addresses) + len(coords)
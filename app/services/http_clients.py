@@ -0,0 +1,83 @@
+"""
+업스트림 호스트별 공유 httpx.AsyncClient.
+
+요청마다 AsyncClient를 새로 만들면 매번 TCP·TLS 핸드셰이크를 다시 하게 된다.
+호스트별로 커넥션 풀을 유지하는 클라이언트를 lifespan에서 만들고(init_clients)
+종료 시 닫는다(close_clients). h2 패키지가 설치되어 있으면 HTTP/2를 사용한다.
+"""
+import logging
+import os
+
+import httpx
+
+from app.utils.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+NAVER_MOBILE_HOST = "m.land.naver.com"
+NAVER_API_HOST = "new.land.naver.com"
+KAKAO_API_HOST = "dapi.kakao.com"
+
+# 호스트별 커넥션 제한 · keep-alive 설정
+_HOST_LIMITS: dict[str, httpx.Limits] = {
+    NAVER_MOBILE_HOST: httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0),
+    NAVER_API_HOST:    httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0),
+    KAKAO_API_HOST:    httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0),
+}
+_DEFAULT_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0)
+_DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+# 호스트별 초당 요청 수 / 버스트 — 토큰이 남아 있는 동안은 대기 없이 통과
+# 고정 sleep 대신 모든 업스트림 호출이 요청 직전에 get_rate_limiter(host).acquire()를 거친다
+_HOST_RATES: dict[str, tuple[float, float]] = {
+    NAVER_API_HOST:    (float(os.getenv("NAVER_API_RATE", 5)), float(os.getenv("NAVER_API_BURST", 10))),
+    NAVER_MOBILE_HOST: (float(os.getenv("NAVER_MOBILE_RATE", 10)), float(os.getenv("NAVER_MOBILE_BURST", 40))),
+    KAKAO_API_HOST:    (float(os.getenv("KAKAO_API_RATE", 20)), float(os.getenv("KAKAO_API_BURST", 40))),
+}
+_rate_limiters: dict[str, TokenBucket] = {}
+
+try:
+    import h2  # noqa: F401 — httpx의 HTTP/2 지원에 필요
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def build_client(host: str) -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=_HTTP2,
+        limits=_HOST_LIMITS.get(host, _DEFAULT_LIMITS),
+        timeout=_DEFAULT_TIMEOUT,
+    )
+
+
+def get_client(host: str) -> httpx.AsyncClient:
+    """호스트 전용 공유 클라이언트. lifespan 밖(스크립트 등)에서 호출되면 이 시점에 생성"""
+    client = _clients.get(host)
+    if client is None or client.is_closed:
+        client = _clients[host] = build_client(host)
+    return client
+
+
+def get_rate_limiter(host: str) -> TokenBucket:
+    """호스트 전용 토큰 버킷. _HOST_RATES에 없는 호스트는 제한 없음"""
+    bucket = _rate_limiters.get(host)
+    if bucket is None:
+        rate, burst = _HOST_RATES.get(host, (None, None))
+        bucket = _rate_limiters[host] = TokenBucket(host, rate, burst)
+    return bucket
+
+
+async def init_clients():
+    for host in _HOST_LIMITS:
+        get_client(host)
+    logger.info(f"[HTTP] 공유 클라이언트 준비 완료 ({', '.join(_clients)}, http2={_HTTP2})")
+
+
+async def close_clients():
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
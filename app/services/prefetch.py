@@ -0,0 +1,237 @@
+"""
+인기 지역 매물 스냅샷 + 백그라운드 갱신 스케줄러.
+
+/listings/all과 /market/stats는 요청마다 Naver를 실시간 조회했다.
+지역(좌표 + 유형 필터)별 조회 결과를 스냅샷으로 보관하고 stale-while-revalidate로 응답한다.
+- PREFETCH_FRESH_SECONDS 이내: 스냅샷 그대로
+- PREFETCH_STALE_SECONDS 이내: 스냅샷으로 바로 응답하고 백그라운드에서 갱신
+- 그보다 오래됐거나 없으면: 실시간 조회 후 저장
+
+lifespan의 PrefetchScheduler는 PREFETCH_INTERVAL_SECONDS마다 CITY_CENTERS와
+최근 조회가 많은 지역 상위 PREFETCH_HOT_AREAS개를 신선도가 떨어지기 전에 갱신한다.
+백그라운드 갱신은 업스트림 호스트별 분당 예산(토큰 버킷) 안에서만 한다.
+사용자 요청의 실시간 조회는 예산과 무관하다.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Optional
+
+from app.services.http_clients import KAKAO_API_HOST, NAVER_MOBILE_HOST
+from app.utils.cache import TTLCache
+from app.utils.rate_limit import TokenBucket
+from app.utils.singleflight import SingleFlight
+from src.classes import NLocation
+from src.util import get_article_listings, get_complex_listings
+
+logger = logging.getLogger(__name__)
+
+PREFETCH_ENABLED = os.getenv("PREFETCH_ENABLED", "true").lower() not in ("0", "false", "no")
+PREFETCH_INTERVAL_SECONDS = float(os.getenv("PREFETCH_INTERVAL_SECONDS", 60))
+PREFETCH_FRESH_SECONDS = float(os.getenv("PREFETCH_FRESH_SECONDS", 180))
+PREFETCH_STALE_SECONDS = float(os.getenv("PREFETCH_STALE_SECONDS", 1800))
+PREFETCH_HOT_AREAS = int(os.getenv("PREFETCH_HOT_AREAS", 10))
+PREFETCH_MAX_AREAS = int(os.getenv("PREFETCH_MAX_AREAS", 500))
+PREFETCH_CONCURRENCY = int(os.getenv("PREFETCH_CONCURRENCY", 3))
+
+ARTICLE_PAGES = 2
+ARTICLE_PAGE_SIZE = 20  # articleList 한 페이지 최대 매물 수
+
+# 업스트림 호스트별 백그라운드 갱신 예산 (분당 요청 수)
+_REFRESH_BUDGETS: dict[str, float] = {
+    NAVER_MOBILE_HOST: float(os.getenv("PREFETCH_NAVER_MOBILE_BUDGET", 60)),
+    KAKAO_API_HOST:    float(os.getenv("PREFETCH_KAKAO_BUDGET", 600)),
+}
+# 지역 하나 갱신에 드는 호스트별 최대 요청 수
+# - m.land.naver.com: articleList 페이지 수 + complexList 1회
+# - dapi.kakao.com: articleList 매물마다 역지오코딩 (캐시 적중분은 실제로 호출하지 않지만 최악의 경우로 잡는다)
+_REFRESH_COST: dict[str, int] = {
+    NAVER_MOBILE_HOST: ARTICLE_PAGES + 1,
+    KAKAO_API_HOST:    ARTICLE_PAGES * ARTICLE_PAGE_SIZE,
+}
+_budgets = {
+    host: TokenBucket(f"prefetch:{host}", per_min / 60, per_min) for host, per_min in _REFRESH_BUDGETS.items()
+}
+
+# 키 → (매물 목록, 조회 시각). 하드 만료는 stale 기한
+_snapshots = TTLCache("prefetch_snapshots", maxsize=PREFETCH_MAX_AREAS, ttl=PREFETCH_STALE_SECONDS)
+_refresh_flight = SingleFlight("prefetch_refresh")
+_background: set[asyncio.Task] = set()
+
+# 최근 조회 빈도 — 스케줄러 주기마다 절반으로 줄여 오래된 인기는 사라진다
+_hot_counts: dict[tuple, float] = {}
+_hot_labels: dict[tuple, str] = {}
+
+_stats = {"fresh": 0, "stale": 0, "miss": 0, "refreshed": 0, "refresh_failed": 0, "budget_skipped": 0}
+
+
+def _key(loc: NLocation, types: Optional[list[str]]) -> tuple:
+    return round(loc.lat, 4), round(loc.lon, 4), tuple(sorted(types)) if types else None
+
+
+async def fetch_area_listings(loc: NLocation, types: Optional[list[str]] = None, label: str = "") -> tuple[list, bool]:
+    """articleList + complexList 실시간 조회. (매물 목록, 하나라도 성공했는지)"""
+    results = await asyncio.gather(
+        get_article_listings(loc, pages=ARTICLE_PAGES, estate_types=types),
+        get_complex_listings(loc, estate_types=types),
+        return_exceptions=True,
+    )
+    combined = []
+    ok = False
+    for r in results:
+        if isinstance(r, Exception):
+            logger.warning(f"[{label or loc}] 조회 실패: {r}")
+        else:
+            ok = True
+            combined.extend(r)
+    return combined, ok
+
+
+async def _refresh(key: tuple, loc: NLocation, types: Optional[list[str]], label: str) -> list:
+    async def _do():
+        listings, ok = await fetch_area_listings(loc, types, label)
+        if ok:
+            # 모두 실패한 결과는 저장하지 않는다 — 기존 스냅샷을 계속 쓰도록
+            _snapshots.set(key, (listings, time.monotonic()))
+            _stats["refreshed"] += 1
+        else:
+            _stats["refresh_failed"] += 1
+        return listings
+    return await _refresh_flight.do(key, _do)
+
+
+def _take_budget() -> bool:
+    """백그라운드 갱신 1회분 예산을 모든 업스트림에서 확보. 하나라도 부족하면 소비하지 않는다"""
+    if any(_budgets[host].available() < cost for host, cost in _REFRESH_COST.items()):
+        _stats["budget_skipped"] += 1
+        return False
+    for host, cost in _REFRESH_COST.items():
+        _budgets[host].try_acquire(cost)
+    return True
+
+
+def _refresh_in_background(key: tuple, loc: NLocation, types: Optional[list[str]], label: str):
+    if not _take_budget():
+        return
+    task = asyncio.create_task(_refresh(key, loc, types, label))
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+async def cancel_background_refreshes() -> int:
+    """진행 중인 stale 스냅샷 백그라운드 갱신 취소 — lifespan 종료 시 HTTP 클라이언트를 닫기 전에 호출"""
+    tasks = list(_background)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    _background.clear()
+    return len(tasks)
+
+
+def record_query(loc: NLocation, types: Optional[list[str]] = None, label: str = ""):
+    key = _key(loc, types)
+    _hot_counts[key] = _hot_counts.get(key, 0.0) + 1
+    if label:
+        _hot_labels[key] = label
+
+
+async def get_area_listings(loc: NLocation, types: Optional[list[str]] = None, label: str = "",
+                            track: bool = True) -> list:
+    """스냅샷 우선 지역 매물 조회 (stale-while-revalidate). track=True면 인기 지역 집계에 반영"""
+    key = _key(loc, types)
+    if track:
+        record_query(loc, types, label)
+    if not PREFETCH_ENABLED:
+        listings, _ = await fetch_area_listings(loc, types, label)
+        return listings
+
+    snapshot = _snapshots.get(key)
+    if snapshot is not None:
+        listings, fetched_at = snapshot
+        if time.monotonic() - fetched_at < PREFETCH_FRESH_SECONDS:
+            _stats["fresh"] += 1
+        else:
+            _stats["stale"] += 1
+            _refresh_in_background(key, loc, types, label)
+        return list(listings)
+
+    _stats["miss"] += 1
+    return list(await _refresh(key, loc, types, label))
+
+
+class PrefetchScheduler:
+    """CITY_CENTERS + 인기 지역을 주기적으로 갱신"""
+
+    def __init__(self, cities: dict, interval: float = PREFETCH_INTERVAL_SECONDS, hot_areas: int = PREFETCH_HOT_AREAS,
+                 concurrency: int = PREFETCH_CONCURRENCY):
+        self.cities = cities
+        self.interval = interval
+        self.hot_areas = hot_areas
+        self.concurrency = concurrency
+        self.cycles = 0
+        self.last_cycle_seconds = 0.0
+
+    def targets(self) -> list[tuple[tuple, NLocation, Optional[list[str]], str]]:
+        targets = {}
+        for city, (lat, lng) in self.cities.items():
+            loc = NLocation(lat, lng)
+            targets[_key(loc, None)] = (loc, None, city)
+        hot = sorted(_hot_counts.items(), key=lambda kv: kv[1], reverse=True)
+        for key, _ in hot[:self.hot_areas]:
+            if key not in targets:
+                lat, lng, types = key
+                targets[key] = (NLocation(lat, lng), list(types) if types else None, _hot_labels.get(key, ""))
+        return [(key, *value) for key, value in targets.items()]
+
+    def _due(self, key: tuple) -> bool:
+        """다음 주기 전에 신선도가 떨어질 스냅샷만 갱신"""
+        snapshot = _snapshots.peek(key)
+        return snapshot is None or time.monotonic() - snapshot[1] + self.interval >= PREFETCH_FRESH_SECONDS
+
+    async def run_once(self) -> int:
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _one(key, loc, types, label):
+            async with semaphore:
+                await _refresh(key, loc, types, label)
+
+        tasks = []
+        for key, loc, types, label in self.targets():
+            if self._due(key) and _take_budget():
+                tasks.append(_one(key, loc, types, label))
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        for key in list(_hot_counts):
+            _hot_counts[key] /= 2
+            if _hot_counts[key] < 0.5:
+                del _hot_counts[key]
+                _hot_labels.pop(key, None)
+        self.cycles += 1
+        self.last_cycle_seconds = time.perf_counter() - started
+        if tasks:
+            logger.info(f"[프리페치] {len(tasks)}개 지역 갱신, {self.last_cycle_seconds:.2f}초")
+        return len(tasks)
+
+    async def run(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"[프리페치 실패] {e}")
+            await asyncio.sleep(self.interval)
+
+
+def get_prefetch_stats() -> dict:
+    return {
+        **_stats,
+        "enabled": PREFETCH_ENABLED,
+        "snapshots": len(_snapshots),
+        "background_refreshing": len(_background),
+        "budgets": {host: bucket.stats() for host, bucket in _budgets.items()},
+        "hot_areas": [
+            {"label": _hot_labels.get(key, ""), "lat": key[0], "lng": key[1], "types": key[2], "score": round(score, 2)}
+            for key, score in sorted(_hot_counts.items(), key=lambda kv: kv[1], reverse=True)[:PREFETCH_HOT_AREAS]
+        ],
+    }
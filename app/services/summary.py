@@ -2,6 +2,7 @@ import logging
 import os
 import google.generativeai as genai
 from app.schemas import HousingRequest, FacilitySummary, ComparisonResult
+from app.utils.cache import TTLCache
 from dotenv import load_dotenv
 import time
 import random
@@ -16,7 +17,7 @@ AVAILABLE_MODELS = [
     "gemini-1.5-flash-8b",
 ]
 
-SUMMARY_CACHE = {}
+SUMMARY_CACHE = TTLCache("summary", maxsize=10_000, ttl=24 * 3600)
 MODEL_FAILURE_COUNT = {model_name: 0 for model_name in AVAILABLE_MODELS}
 
 def pyeong_to_m2(pyeong: float) -> float:
@@ -74,8 +75,9 @@ def _generate_summary_sync(req: HousingRequest, fac: FacilitySummary, cmp: Compa
     try:
         # 입력값 캐싱 키 생성
         cache_key = (req.address, req.deposit, req.monthly, req.netLeasableArea)
-        if cache_key in SUMMARY_CACHE:
-            return SUMMARY_CACHE[cache_key]
+        cached = SUMMARY_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
 
         area_m2 = pyeong_to_m2(req.netLeasableArea)
         prompt = build_prompt(area_m2, req.deposit, req.monthly, fac, cmp)
@@ -113,7 +115,7 @@ def _generate_summary_sync(req: HousingRequest, fac: FacilitySummary, cmp: Compa
                 logging.info(f"[Gemini 요약 완료] 모델: {model_name}, {duration}초 소요")
                 
                 # 캐시에 저장
-                SUMMARY_CACHE[cache_key] = text
+                SUMMARY_CACHE.set(cache_key, text)
                 return text
                 
             except Exception as e:
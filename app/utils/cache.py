@@ -0,0 +1,122 @@
+"""
+크기 제한 + 항목별 TTL + LRU 제거를 지원하는 인메모리 캐시.
+
+모듈 전역 dict 캐시가 장기 실행 워커에서 무한히 커지는 문제를 막기 위해
+geolocation / facilities / summary / 유형 추론 / 섹터 캐시가 공통으로 사용한다.
+생성된 캐시는 이름으로 등록되어 get_cache_stats()로 적중률을 확인할 수 있다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+_registry: dict[str, Any] = {}
+_registry_lock = threading.Lock()
+
+
+def register_cache(cache: Any):
+    """stats()를 가진 캐시 객체를 이름으로 등록 (get_cache_stats 집계 대상)"""
+    with _registry_lock:
+        _registry[cache.name] = cache
+
+
+class TTLCache:
+    """
+    스레드 안전 LRU + TTL 캐시.
+
+    - maxsize: 최대 항목 수. 초과 시 가장 오래 사용되지 않은 항목부터 제거
+    - ttl: 기본 만료 시간(초). None이면 만료 없음. set()에서 항목별로 덮어쓸 수 있다.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: Optional[float] = None):
+        if maxsize < 1:
+            raise ValueError("maxsize는 1 이상이어야 합니다.")
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()  # key -> (value, 만료 시각 또는 None)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        register_cache(self)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+        """만료되지 않은 (key, value) 스냅샷 — 오래된 순"""
+        now = time.monotonic()
+        with self._lock:
+            return [(k, v) for k, (v, exp) in self._data.items() if exp is None or exp > now]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """적중 통계와 LRU 순서에 영향을 주지 않는 존재 확인"""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (entry[1] is None or entry[1] > time.monotonic())
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """적중 통계와 LRU 순서에 영향을 주지 않는 조회"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or (entry[1] is not None and entry[1] <= time.monotonic()):
+                return default
+            return entry[0]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+def get_cache_stats() -> dict:
+    """등록된 모든 캐시의 크기·적중률·제거 횟수"""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return {cache.name: cache.stats() for cache in caches}
@@ -1,9 +1,151 @@
 import math
 
+import numpy as np
+
+# haversine 패키지와 같은 평균 지구 반지름 — src.util.distance_between 결과와 일치시키기 위함
+EARTH_RADIUS_M = 6371008.8
+# distance_matrix를 행 단위로 나눠 계산할 때 한 번에 만드는 최대 원소 수 (float64 약 128MB)
+MATRIX_CHUNK_ELEMENTS = 16_000_000
+
 def haversine(lat1, lng1, lat2, lng2):
     R = 6371  # 지구 반지름 (km)
     d_lat = math.radians(lat2 - lat1)
     d_lng = math.radians(lng2 - lng1)
     a = math.sin(d_lat/2)**2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lng/2)**2
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    return round(R * c, 2)
\ No newline at end of file
+    return round(R * c, 2)
+
+def haversine_m(lat1, lng1, lat2, lng2) -> np.ndarray:
+    """
+    브로드캐스팅 haversine (미터). 스칼라·배열을 섞어 넣을 수 있다.
+    haversine 패키지(unit='m')와 같은 공식 — 2R·asin(√a)
+    """
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lng1, lat2, lng2))
+    a = np.sin((lat2 - lat1) * 0.5) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) * 0.5) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+def distances_to(lats, lngs, center_lat: float, center_lng: float) -> np.ndarray:
+    """여러 점 → 한 중심점까지 거리 (미터, 길이 n)"""
+    return haversine_m(center_lat, center_lng, lats, lngs)
+
+def distance_matrix(lats1, lngs1, lats2, lngs2) -> np.ndarray:
+    """
+    (n, m) 거리 행렬 (미터). 행마다 필요한 삼각함수 값을 미리 계산해 두고 브로드캐스팅한다.
+    결과 전체가 메모리에 올라가므로 큰 입력은 iter_distance_chunks를 사용한다.
+    """
+    return next(iter_distance_chunks(lats1, lngs1, lats2, lngs2, chunk_rows=len(np.atleast_1d(lats1))))[1]
+
+def iter_distance_chunks(lats1, lngs1, lats2, lngs2, chunk_rows: int | None = None):
+    """
+    거리 행렬을 행 묶음 단위로 생성: (시작 행, (rows, m) 거리 행렬).
+    chunk_rows를 주지 않으면 MATRIX_CHUNK_ELEMENTS 이하가 되도록 정한다.
+    """
+    phi1 = np.radians(np.asarray(lats1, dtype=np.float64)).reshape(-1, 1)
+    lam1 = np.radians(np.asarray(lngs1, dtype=np.float64)).reshape(-1, 1)
+    phi2 = np.radians(np.asarray(lats2, dtype=np.float64)).reshape(1, -1)
+    lam2 = np.radians(np.asarray(lngs2, dtype=np.float64)).reshape(1, -1)
+    cos1, cos2 = np.cos(phi1), np.cos(phi2)
+
+    n, m = phi1.shape[0], phi2.shape[1]
+    if chunk_rows is None:
+        chunk_rows = max(1, MATRIX_CHUNK_ELEMENTS // max(m, 1))
+    for start in range(0, max(n, 1), max(chunk_rows, 1)):
+        stop = min(start + chunk_rows, n)
+        a = (np.sin((phi2 - phi1[start:stop]) * 0.5) ** 2
+             + cos1[start:stop] * cos2 * np.sin((lam2 - lam1[start:stop]) * 0.5) ** 2)
+        yield start, 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+def count_within(lats1, lngs1, lats2, lngs2, thresholds, groups, n_groups: int,
+                 chunk_rows: int | None = None) -> np.ndarray:
+    """
+    각 점(1)마다 round(거리) <= thresholds[j]인 점(2)의 수를 그룹별로 센다.
+    - thresholds: 점(2)별 기준 거리(미터, 길이 m)
+    - groups: 점(2)별 그룹 번호 (0 ~ n_groups-1)
+    반환: (n, n_groups) int64 — 거리 행렬 전체를 만들지 않고 청크 단위로 누적
+    """
+    n = len(np.atleast_1d(lats1))
+    counts = np.zeros((n, n_groups), dtype=np.int64)
+    if n == 0 or len(np.atleast_1d(lats2)) == 0:
+        return counts
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    onehot = np.zeros((len(thresholds), n_groups), dtype=np.float32)
+    onehot[np.arange(len(thresholds)), np.asarray(groups)] = 1.0
+    for start, d in iter_distance_chunks(lats1, lngs1, lats2, lngs2, chunk_rows):
+        within = np.round(d) <= thresholds
+        # float32 행렬곱으로 그룹별 합산 (2^24 미만 개수는 정확)
+        counts[start:start + len(d)] = within.astype(np.float32) @ onehot
+    return counts
+
+def count_within_grid(lats1, lngs1, lats2, lngs2, thresholds, groups, n_groups: int,
+                      max_pairs: int = MATRIX_CHUNK_ELEMENTS) -> np.ndarray:
+    """
+    count_within과 같은 결과를 격자 버킷으로 계산한다.
+    그룹마다 점(2)을 기준 거리 이상 크기의 위경도 격자 셀에 넣고, 점(1)이 속한 셀과
+    주변 8개 셀의 후보만 haversine으로 확인한다 — 점(1)당 비용이 전체 m이 아닌 주변 밀도에 비례.
+    후보 판정은 count_within과 같은 식(np.round(d) <= 기준)이므로 개수가 정확히 일치한다.
+    """
+    lat1 = np.asarray(lats1, dtype=np.float64).ravel()
+    lng1 = np.asarray(lngs1, dtype=np.float64).ravel()
+    lat2 = np.asarray(lats2, dtype=np.float64).ravel()
+    lng2 = np.asarray(lngs2, dtype=np.float64).ravel()
+    n = len(lat1)
+    counts = np.zeros((n, n_groups), dtype=np.int64)
+    if n == 0 or len(lat2) == 0:
+        return counts
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    groups = np.asarray(groups)
+    max_abs_lat = max(np.abs(lat1).max(), np.abs(lat2).max())
+
+    for g in range(n_groups):
+        members = np.flatnonzero(groups == g)
+        if members.size == 0:
+            continue
+        g_lat, g_lng, g_thr = lat2[members], lng2[members], thresholds[members]
+
+        # round(d) <= R 이려면 d <= R + 0.5 — 이 거리보다 큰 셀이면 3×3 셀 안에 모든 후보가 들어온다
+        reach = g_thr.max() + 0.5
+        cell_lat = math.degrees(reach / EARTH_RADIUS_M) * 1.001
+        cos_min = math.cos(math.radians(min(max_abs_lat + cell_lat, 89.9)))
+        cell_lng = cell_lat / cos_min * 1.001
+
+        keys = _cell_keys(np.floor(g_lat / cell_lat), np.floor(g_lng / cell_lng))
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+
+        ci, cj = np.floor(lat1 / cell_lat), np.floor(lng1 / cell_lng)
+        ranges = []
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                q = _cell_keys(ci + di, cj + dj)
+                ranges.append((np.searchsorted(sorted_keys, q, "left"), np.searchsorted(sorted_keys, q, "right")))
+        per_point = sum(hi - lo for lo, hi in ranges)
+
+        # 후보 쌍 수가 max_pairs를 넘지 않도록 점(1)을 나눠 처리
+        start = 0
+        cumulative = np.cumsum(per_point)
+        while start < n:
+            base = cumulative[start - 1] if start else 0
+            stop = max(int(np.searchsorted(cumulative, base + max_pairs, "right")), start + 1)
+            stop = min(stop, n)
+            t_idx, c_idx = [], []
+            for lo, hi in ranges:
+                lo, hi = lo[start:stop], hi[start:stop]
+                lens = hi - lo
+                total = int(lens.sum())
+                if total == 0:
+                    continue
+                offsets = np.arange(total) - np.repeat(np.cumsum(lens) - lens, lens)
+                t_idx.append(np.repeat(np.arange(start, stop), lens))
+                c_idx.append(order[np.repeat(lo, lens) + offsets])
+            if t_idx:
+                t = np.concatenate(t_idx)
+                c = np.concatenate(c_idx)
+                d = haversine_m(lat1[t], lng1[t], g_lat[c], g_lng[c])
+                hit = t[np.round(d) <= g_thr[c]]
+                counts[:, g] += np.bincount(hit, minlength=n)
+            start = stop
+    return counts
+
+def _cell_keys(ci: np.ndarray, cj: np.ndarray) -> np.ndarray:
+    """(위도 셀, 경도 셀) → 정렬 가능한 int64 키"""
+    return ci.astype(np.int64) * (1 << 32) + (cj.astype(np.int64) + (1 << 31))
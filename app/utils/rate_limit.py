@@ -0,0 +1,98 @@
+"""
+업스트림 호스트별 비동기 토큰 버킷.
+
+고정 sleep 대신 초당 rate개, 최대 capacity개까지 쌓이는 토큰을 소비한다.
+토큰이 남아 있으면 기다리지 않고, 부족할 때만 부족분이 채워질 때까지 대기한다.
+생성된 버킷은 이름으로 등록되어 get_rate_limit_stats()로 대기 시간을 확인할 수 있다.
+"""
+import asyncio
+import time
+from typing import Optional
+
+_registry: dict[str, "TokenBucket"] = {}
+
+
+class TokenBucket:
+    """
+    - rate: 초당 토큰 보충량 (초당 허용 요청 수). None이면 제한 없음
+    - capacity: 버킷 크기 (순간 허용 버스트). 기본값은 rate
+    """
+
+    def __init__(self, name: str, rate: Optional[float], capacity: Optional[float] = None):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else (rate or 0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self.acquired = 0
+        self.waited = 0          # 대기가 필요했던 요청 수
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+        _registry[name] = self
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1) -> float:
+        """토큰을 소비하고 실제로 기다린 시간(초)을 반환"""
+        self.acquired += 1
+        if self.rate is None:
+            return 0.0
+        # 토큰을 먼저 예약(음수 허용)하고 부족분만큼 잔다 — await 전까지는 원자적이므로 락이 필요 없고
+        # 먼저 온 요청이 먼저 깨어난다
+        self._refill(time.monotonic())
+        self._tokens -= tokens
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        self.last_wait = wait
+        if wait > 0:
+            self.waited += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # 예약만 하고 쓰지 않은 토큰을 돌려준다 — 뒤 대기자가 불필요하게 더 기다리지 않도록
+                self._tokens += tokens
+                raise
+        return wait
+
+    def available(self) -> float:
+        """지금 남아 있는 토큰 수 (예약으로 음수일 수 있다)"""
+        if self.rate is None:
+            return float("inf")
+        self._refill(time.monotonic())
+        return self._tokens
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """기다리지 않고 토큰을 소비. 부족하면 소비하지 않고 False"""
+        if self.available() < tokens:
+            return False
+        self.acquired += 1
+        if self.rate is not None:
+            self._tokens -= tokens
+        return True
+
+    def current_wait(self) -> float:
+        """지금 요청하면 기다려야 하는 시간(초)"""
+        if self.rate is None:
+            return 0.0
+        self._refill(time.monotonic())
+        return max(0.0, (1 - self._tokens) / self.rate)
+
+    def stats(self) -> dict:
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "current_wait": round(self.current_wait(), 3),
+            "last_wait": round(self.last_wait, 3),
+            "avg_wait": round(self.total_wait / self.waited, 3) if self.waited else 0.0,
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+def get_rate_limit_stats() -> dict:
+    return {name: bucket.stats() for name, bucket in _registry.items()}
@@ -0,0 +1,93 @@
+"""
+주소·지역명 → 정규화된 지역 키 (시도, 시군구) 추출.
+
+listings 저장 시 sido / region 컬럼을 채우고, 시세 트렌드 조회 시
+사용자 입력 지역명을 같은 키로 바꿔 인덱스로 조회하는 데 사용한다.
+"""
+from typing import Optional
+
+# 시도 표기 → Kakao 주소(address_name)의 축약 표기
+_SIDO_ALIASES: dict[str, str] = {}
+for _short, _names in {
+    "서울": ["서울특별시", "서울시"],
+    "부산": ["부산광역시", "부산시"],
+    "대구": ["대구광역시", "대구시"],
+    "인천": ["인천광역시", "인천시"],
+    "광주": ["광주광역시"],
+    "대전": ["대전광역시", "대전시"],
+    "울산": ["울산광역시", "울산시"],
+    "세종": ["세종특별자치시", "세종시"],
+    "경기": ["경기도"],
+    "강원": ["강원도", "강원특별자치도"],
+    "충북": ["충청북도"],
+    "충남": ["충청남도"],
+    "전북": ["전라북도", "전북특별자치도"],
+    "전남": ["전라남도"],
+    "경북": ["경상북도"],
+    "경남": ["경상남도"],
+    "제주": ["제주특별자치도", "제주도"],
+}.items():
+    _SIDO_ALIASES[_short] = _short
+    for _name in _names:
+        _SIDO_ALIASES[_name] = _short
+
+_SIGUNGU_SUFFIXES = ("시", "군", "구")
+# 시군구로 추측하면 안 되는 지명 접미사 (역·동·도로명 등)
+_NON_REGION_SUFFIXES = ("역", "동", "읍", "면", "리", "로", "길", "교", "대")
+
+
+def normalize_sido(token: str) -> Optional[str]:
+    return _SIDO_ALIASES.get(token)
+
+
+def _is_sigungu(token: str) -> bool:
+    return len(token) >= 2 and token.endswith(_SIGUNGU_SUFFIXES) and token not in _SIDO_ALIASES
+
+
+def parse_region(text: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """
+    주소 문자열에서 (시도, 시군구) 추출. 없는 값은 None.
+    예) "서울 마포구 합정동 123" → ("서울", "마포구")
+        "경기 수원시 팔달구 인계동" → ("경기", "수원시")
+    """
+    if not text:
+        return None, None
+    tokens = text.split()
+    sido = normalize_sido(tokens[0]) if tokens else None
+    for token in tokens[1 if sido else 0:]:
+        if _is_sigungu(token):
+            return sido, token
+    return sido, None
+
+
+def listing_region(address: Optional[str], city: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+    """매물 주소 기준으로 지역 키를 구하고, 빠진 값은 검색 지역명(city)에서 보충"""
+    sido, region = parse_region(address)
+    if sido is None or region is None:
+        city_sido, city_region = parse_region(city)
+        sido = sido or city_sido
+        region = region or city_region
+    return sido, region
+
+
+def region_query_keys(text: str) -> Optional[tuple[Optional[str], list[str]]]:
+    """
+    조회용 지역명 → (시도, 시군구 후보 목록). 지역 키로 표현할 수 없으면 None.
+    예) "마포구" → (None, ["마포구"]), "서울" → ("서울", []),
+        "수원" → (None, ["수원시", "수원군", "수원구"]), "홍대입구역" → None
+    """
+    tokens = text.split()
+    if not tokens:
+        return None
+    sido = normalize_sido(tokens[0])
+    rest = tokens[1:] if sido else tokens
+    if not rest:
+        return sido, []
+    if len(rest) != 1:
+        return None
+    token = rest[0]
+    if _is_sigungu(token):
+        return sido, [token]
+    if token.endswith(_NON_REGION_SUFFIXES):
+        return None
+    return sido, [token + suffix for suffix in _SIGUNGU_SUFFIXES]
@@ -0,0 +1,50 @@
+"""
+동일 요청 병합(single-flight) — 같은 키로 진행 중인 업스트림 호출이 있으면
+새로 호출하지 않고 그 결과를 함께 기다린다.
+
+여러 사용자가 같은 지역을 동시에 조회할 때 Naver·Kakao로 같은 요청이
+중복 발송되는 것을 막는다. 캐시와 달리 호출이 끝나면 결과를 보관하지 않는다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+_registry: dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0       # 실제 업스트림 호출 수
+        self.coalesced = 0   # 진행 중인 호출에 합류한 요청 수
+        _registry[name] = self
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._done(k, t))
+        else:
+            self.coalesced += 1
+        # 먼저 들어온 요청이 취소돼도 다른 대기자에게는 결과가 전달되도록 shield
+        return await asyncio.shield(task)
+
+    def _done(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 대기자가 모두 취소된 경우 "exception was never retrieved" 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
+
+
+def get_singleflight_stats() -> dict:
+    return {name: flight.stats() for name, flight in _registry.items()}
@@ -0,0 +1,145 @@
+"""
+좌표 기반 근접 캐시 — 고정 격자 셀 인덱스.
+
+"lat,lng" 문자열 키 캐시는 1m만 떨어져도 서로 적중하지 못한다.
+SpatialCache는 좌표를 radius_m 이상 크기의 격자 셀에 넣어 두고,
+조회 좌표가 속한 셀과 주변 8개 셀만 확인해 radius_m 이내의 가장 가까운 값을 돌려준다.
+셀당 항목 수가 적으므로 평균 O(1) 조회다.
+"""
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.utils.cache import register_cache
+
+_M_PER_DEG_LAT = 111_320.0
+# 경도 셀 폭은 이 위도에서도 radius 이상이 되도록 잡는다 (국내 최북단 약 38.6°)
+_MAX_LAT_FOR_CELL = 39.0
+
+
+class SpatialCache:
+    """
+    스레드 안전 근접 좌표 캐시 (크기 제한 + TTL + LRU).
+
+    - radius_m: 이 거리(미터) 이내의 캐시 좌표를 적중으로 본다. 0이면 좌표가 정확히 같을 때만 적중
+    - maxsize / ttl: TTLCache와 동일
+    """
+
+    def __init__(self, name: str, radius_m: float, maxsize: int, ttl: Optional[float] = None):
+        if radius_m < 0:
+            raise ValueError("radius_m은 0 이상이어야 합니다.")
+        self.name = name
+        self.radius_m = radius_m
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # radius_m=0이면 격자 없이 좌표 자체를 셀 키로 쓴다 (정확히 일치할 때만 적중)
+        self._exact = radius_m == 0
+        if not self._exact:
+            self._cell_lat = radius_m / _M_PER_DEG_LAT
+            self._cell_lng = radius_m / (_M_PER_DEG_LAT * math.cos(math.radians(_MAX_LAT_FOR_CELL)))
+        # (lat, lng) -> (value, 만료 시각 또는 None), LRU 순서
+        self._entries: OrderedDict = OrderedDict()
+        self._cells: dict[tuple[int, int], set] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        register_cache(self)
+
+    def _cell(self, lat: float, lng: float) -> tuple:
+        if self._exact:
+            return lat, lng
+        return math.floor(lat / self._cell_lat), math.floor(lng / self._cell_lng)
+
+    def _neighbor_cells(self, lat: float, lng: float):
+        """조회 좌표의 셀과 주변 8개 셀 (정확 일치 모드에서는 자기 셀만)"""
+        if self._exact:
+            return ((lat, lng),)
+        ci, cj = self._cell(lat, lng)
+        return [(ci + di, cj + dj) for di in (-1, 0, 1) for dj in (-1, 0, 1)]
+
+    def _distance_m(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+        # 수십 미터 범위에서는 등장방형 근사로 충분
+        x = (lng2 - lng1) * math.cos(math.radians((lat1 + lat2) / 2))
+        y = lat2 - lat1
+        return math.hypot(x, y) * _M_PER_DEG_LAT
+
+    def _remove(self, point: tuple[float, float]):
+        del self._entries[point]
+        cell = self._cell(*point)
+        bucket = self._cells[cell]
+        bucket.discard(point)
+        if not bucket:
+            del self._cells[cell]
+
+    def get(self, lat: float, lng: float, default: Any = None) -> Any:
+        """radius_m 이내에서 가장 가까운 캐시 값"""
+        now = time.monotonic()
+        cells = self._neighbor_cells(lat, lng)
+        with self._lock:
+            best, best_d = None, self.radius_m
+            expired = []
+            for cell in cells:
+                for point in self._cells.get(cell, ()):
+                    expires_at = self._entries[point][1]
+                    if expires_at is not None and expires_at <= now:
+                        expired.append(point)
+                        continue
+                    d = self._distance_m(lat, lng, *point)
+                    if d <= best_d:
+                        best, best_d = point, d
+            for point in expired:
+                self._remove(point)
+                self.expirations += 1
+            if best is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(best)
+            self.hits += 1
+            return self._entries[best][0]
+
+    def set(self, lat: float, lng: float, value: Any, ttl: Optional[float] = None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        point = (lat, lng)
+        with self._lock:
+            if point not in self._entries:
+                self._cells.setdefault(self._cell(lat, lng), set()).add(point)
+            self._entries[point] = (value, expires_at)
+            self._entries.move_to_end(point)
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def items(self) -> list[tuple[tuple[float, float], Any]]:
+        """만료되지 않은 ((lat, lng), value) 스냅샷 — 오래된 순"""
+        now = time.monotonic()
+        with self._lock:
+            return [(p, v) for p, (v, exp) in self._entries.items() if exp is None or exp > now]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._cells.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "radius_m": self.radius_m,
+                "cells": len(self._cells),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
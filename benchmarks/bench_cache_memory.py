@@ -0,0 +1,67 @@
+"""
+TTLCache 메모리 사용량 벤치마크 — 100만 개 합성 키.
+
+- 무제한 dict: 키 수에 비례해 계속 증가 (기존 모듈 전역 캐시)
+- TTLCache(maxsize=N): 100만 개를 넣어도 N개 분량에서 멈춤
+    python -m benchmarks.bench_cache_memory --keys 1000000 --maxsize 100000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+from app.utils.cache import TTLCache
+
+
+def key_value(i: int) -> tuple[str, tuple[float, float]]:
+    # geocode.coords 캐시와 같은 형태의 키·값
+    lat, lng = 37 + (i % 1000) * 1e-5, 127 + (i // 1000) * 1e-5
+    return f"{lat:.5f},{lng:.5f}", (lat, lng)
+
+
+def measure(fill) -> tuple[float, float]:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    holder = fill()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del holder
+    return current / 1024 / 1024, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--maxsize", type=int, default=100_000)
+    args = parser.parse_args()
+
+    def fill_dict():
+        d = {}
+        for i in range(args.keys):
+            k, v = key_value(i)
+            d[k] = v
+        return d
+
+    def fill_cache(maxsize):
+        def _fill():
+            c = TTLCache(f"bench.{maxsize}", maxsize=maxsize, ttl=3600)
+            for i in range(args.keys):
+                k, v = key_value(i)
+                c.set(k, v)
+            return c
+        return _fill
+
+    rows = [
+        ("dict (무제한)", measure(fill_dict)),
+        (f"TTLCache maxsize={args.keys:,}", measure(fill_cache(args.keys))),
+        (f"TTLCache maxsize={args.maxsize:,}", measure(fill_cache(args.maxsize))),
+    ]
+    print(f"keys={args.keys:,}")
+    for label, (mb, sec) in rows:
+        print(f"{label:<28} {mb:8.1f} MiB  {sec:6.2f}s  ({mb * 1024 * 1024 / args.keys:6.1f} B/key inserted)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+매물 × 편의시설 거리 계산 — 쌍별 haversine() 루프 vs NumPy 벡터화 vs 격자 버킷 비교.
+
+기존 update_things_intersection은 매물 수 × 편의시설 수만큼 haversine()을 호출했다.
+10k × 10k(1억 쌍)는 루프로 끝까지 돌리기 어려우므로 --sample 행만 측정해 전체 시간을 추정한다.
+    python -m benchmarks.bench_distance --things 10000 --neighbors 10000
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+from haversine import haversine
+
+from app.utils.distance import count_within, count_within_grid, distances_to
+
+STANDARD = [500, 500, 750, 750, 1000, 1000, 2000, 500, 500, 300, 500, 750, 1250]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--things", type=int, default=10_000)
+    parser.add_argument("--neighbors", type=int, default=10_000)
+    parser.add_argument("--sample", type=int, default=50, help="루프 방식으로 실제 측정할 매물 수")
+    parser.add_argument("--spread", type=float, default=0.03, help="좌표 분포 반경(도) — 클수록 섹터가 넓다")
+    args = parser.parse_args()
+
+    rnd = random.Random(42)
+    def point():
+        return 37.55 + rnd.uniform(-args.spread, args.spread), 126.95 + rnd.uniform(-args.spread, args.spread)
+
+    things = [point() for _ in range(args.things)]
+    neighbors = [point() for _ in range(args.neighbors)]
+    groups = [rnd.randrange(len(STANDARD)) for _ in range(args.neighbors)]
+    thresholds = [STANDARD[g] for g in groups]
+
+    # 1) 기존 방식: 쌍별 haversine() — sample 행만 측정 후 외삽
+    sample = things[:args.sample]
+    start = time.perf_counter()
+    loop_counts = []
+    for t in sample:
+        row = [0] * len(STANDARD)
+        for n, g, s in zip(neighbors, groups, thresholds):
+            if round(haversine(t, n, unit="m")) <= s:
+                row[g] += 1
+        loop_counts.append(row)
+    loop_sec = (time.perf_counter() - start) * args.things / max(len(sample), 1)
+
+    # 2) 벡터화: 청크 단위 거리 행렬 + 그룹별 합산
+    lats1, lngs1 = np.array(things).T
+    lats2, lngs2 = np.array(neighbors).T
+    start = time.perf_counter()
+    counts = count_within(lats1, lngs1, lats2, lngs2, thresholds, groups, len(STANDARD))
+    vec_sec = time.perf_counter() - start
+    assert counts[:len(sample)].tolist() == loop_counts, "벡터화 결과가 루프 결과와 다름"
+
+    # 3) 격자 버킷: 매물 주변 셀의 후보만 확인
+    start = time.perf_counter()
+    grid_counts = count_within_grid(lats1, lngs1, lats2, lngs2, thresholds, groups, len(STANDARD))
+    grid_sec = time.perf_counter() - start
+    assert (grid_counts == counts).all(), "격자 결과가 벡터화 결과와 다름"
+
+    # 4) 한 중심점까지 거리 (get_article_listings)
+    center = things[0]
+    start = time.perf_counter()
+    for n in neighbors:
+        haversine(center, n, unit="m")
+    point_loop = time.perf_counter() - start
+    start = time.perf_counter()
+    distances_to(lats2, lngs2, *center)
+    point_vec = time.perf_counter() - start
+
+    pairs = args.things * args.neighbors
+    print(f"매물 {args.things:,} × 편의시설 {args.neighbors:,} = {pairs:,} 쌍")
+    print(f"haversine() 루프 (추정)  {loop_sec:9.2f}s")
+    print(f"count_within (벡터화)    {vec_sec:9.2f}s  ({pairs / vec_sec / 1e6:,.0f}M 쌍/s, x{loop_sec / vec_sec:,.0f})")
+    print(f"count_within_grid (격자) {grid_sec:9.2f}s  (x{loop_sec / grid_sec:,.0f}, 벡터화 대비 x{vec_sec / grid_sec:,.1f})")
+    print(f"중심점 거리 {args.neighbors:,}개: 루프 {point_loop * 1000:.1f}ms / 벡터화 {point_vec * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+매물 내보내기 메모리 — 전체 list of lists 생성 vs ThingExporter 스트리밍.
+
+매물 수를 늘려도 스트리밍 방식의 최대 메모리는 chunk_size 분량에서 멈춘다.
+    python -m benchmarks.bench_export --things 200000
+"""
+import argparse
+import csv
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.bench_thing_memory import build, make_rows
+from src.classes import NArea, NLocation, NPrice, NThing
+from src.export import ThingExporter, load_columns
+
+
+def generate(n: int):
+    # 크롤링처럼 매물이 하나씩 생성되는 상황 — 원본 1000건을 반복 사용
+    base = make_rows(1000)
+    for i in range(n):
+        yield build([base[i % 1000]], NLocation, NArea, NPrice, NThing)[0]
+
+
+def measure(fn) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024 / 1024, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--things", type=int, default=200_000)
+    parser.add_argument("--chunk", type=int, default=5_000)
+    args = parser.parse_args()
+    out = tempfile.mkdtemp()
+
+    def list_of_lists():
+        rows = [NThing.HEADER] + [t.get_list() for t in generate(args.things)]
+        with open(os.path.join(out, "all.csv"), "w", encoding="utf-8-sig", newline="") as f:
+            csv.writer(f).writerows(rows)
+
+    def streaming():
+        with ThingExporter(os.path.join(out, "stream"), ("csv", "columns"), args.chunk) as ex:
+            ex.write(generate(args.things))
+
+    for label, fn in (("list of lists → CSV", list_of_lists), ("ThingExporter (csv+columns)", streaming)):
+        mb, sec = measure(fn)
+        print(f"{label:<28} 최대 {mb:8.1f} MiB  {sec:6.2f}s")
+
+    start = time.perf_counter()
+    cols = load_columns(os.path.join(out, "stream.columns"))
+    mean_deal = float(np.nanmean(cols["minDeal"]))
+    print(f"columns memmap 재적재 + minDeal 평균 {mean_deal:,.0f}: {(time.perf_counter() - start) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
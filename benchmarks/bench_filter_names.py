@@ -0,0 +1,58 @@
+"""
+유치원·어린이집 이름 중복 제거 — filter_item(O(n²)) vs filter_contained_names 비교.
+
+parse_neighbor는 "OO어린이집"과 "OO어린이집 분원"처럼 다른 이름을 포함하는 항목을 걸러낸다.
+합성 이름 5천 개(일부는 다른 이름 + 접미사)로 두 방식의 결과가 같은지 확인하고 시간을 잰다.
+    python -m benchmarks.bench_filter_names --names 5000
+"""
+import argparse
+import random
+import time
+
+from src.util import filter_contained_names, filter_item
+
+_PREFIX = ["서울", "한빛", "새싹", "푸른", "해맑은", "사랑", "늘봄", "꿈나무", "햇살", "아이숲"]
+_KIND = ["어린이집", "유치원", "국공립어린이집", "병설유치원"]
+_SUFFIX = [" 분원", " 2호점", "(본원)", " 별관"]
+
+
+class _Item:
+    def __init__(self, name: str):
+        self.name = name
+
+
+def make_names(n: int) -> list[_Item]:
+    rnd = random.Random(42)
+    names = []
+    for i in range(n):
+        if names and rnd.random() < 0.3:
+            # 기존 이름을 포함하는 변형 — 걸러져야 할 항목
+            names.append(names[rnd.randrange(len(names))] + rnd.choice(_SUFFIX))
+        else:
+            names.append(f"{rnd.choice(_PREFIX)}{i}{rnd.choice(_KIND)}")
+    rnd.shuffle(names)
+    return [_Item(name) for name in names]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--names", type=int, default=5_000)
+    args = parser.parse_args()
+    items = make_names(args.names)
+
+    start = time.perf_counter()
+    old = filter_item(items, lambda x: len(x.name), lambda x, y: x.name in y.name and x.name != y.name)
+    old_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    new = filter_contained_names(items, lambda x: x.name)
+    new_sec = time.perf_counter() - start
+
+    assert [id(x) for x in old] == [id(x) for x in new], "결과가 다름"
+    print(f"이름 {len(items):,}개 → {len(new):,}개 유지")
+    print(f"filter_item             {old_sec * 1000:9.1f}ms")
+    print(f"filter_contained_names  {new_sec * 1000:9.1f}ms  (x{old_sec / new_sec:,.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+요청별 AsyncClient 생성 vs 공유 커넥션 풀 비교 — 로컬 목 서버 대상.
+
+목 서버가 새로 수락한 TCP 연결 수를 세어 핸드셰이크 절감량을 보여준다.
+(실서비스의 TLS 핸드셰이크도 연결 1개당 1회이므로 같은 비율로 줄어든다)
+    python -m benchmarks.bench_http_pool --requests 200 --concurrency 10
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from app.services.http_clients import build_client
+
+_BODY = b'{"body": [], "more": false}'
+_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+    b"Content-Length: " + str(len(_BODY)).encode() + b"\r\n\r\n" + _BODY
+)
+
+
+class MockServer:
+    """keep-alive를 지원하는 최소 HTTP/1.1 서버"""
+
+    def __init__(self):
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                writer.write(_RESPONSE)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+async def run(url: str, total: int, concurrency: int, shared: bool) -> float:
+    sem = asyncio.Semaphore(concurrency)
+    client = build_client("mock") if shared else None
+
+    async def one():
+        async with sem:
+            if shared:
+                (await client.get(url)).raise_for_status()
+            else:
+                async with httpx.AsyncClient() as c:
+                    (await c.get(url)).raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[one() for _ in range(total)])
+    elapsed = time.perf_counter() - start
+    if client is not None:
+        await client.aclose()
+    return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    mock = MockServer()
+    server = await asyncio.start_server(mock.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/cluster/ajax/articleList"
+
+    for label, shared in [("요청별 클라이언트", False), ("공유 커넥션 풀", True)]:
+        mock.connections = 0
+        elapsed = await run(url, args.requests, args.concurrency, shared)
+        print(f"{label:<12} {elapsed * 1000:8.1f}ms  TCP 연결 {mock.connections:>4}개 / 요청 {args.requests}개")
+
+    server.close()
+    await server.wait_closed()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""
+/api/listings/all 첫 바이트까지 시간(TTFB) — 전체 응답 vs stream=true(NDJSON).
+
+기본은 프로세스 안에서 도시별 조회·저장을 지연이 있는 가짜 함수로 바꿔 라우트를 직접 호출한다.
+--url을 주면 실행 중인 서버에 두 방식으로 요청해 TTFB와 전체 시간을 잰다.
+    python -m benchmarks.bench_listings_stream --listings 2000
+    python -m benchmarks.bench_listings_stream --url http://127.0.0.1:8000/api/listings/all
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+import tracemalloc
+
+import httpx
+
+import app.routes.listings as listings_route
+
+
+def _fake_listing(i: int) -> dict:
+    return {"id": i, "name": f"매물{i}", "address": "서울시 어딘가", "area": 33.0, "deposit": 10000,
+            "monthly": 50, "price": 10000, "lat": 37.5, "lng": 127.0, "type": "원룸",
+            "trade_type": "월세", "distance_km": 0.5, "source": "article"}
+
+
+def patch_upstream(per_city: int, seed: int = 1):
+    """도시별 조회 0.2~3초, 저장 0.1초짜리 가짜 함수로 교체"""
+    rnd = random.Random(seed)
+    delays = {}
+
+    async def fake_articles(loc, pages=2, estate_types=None):
+        delay = delays.setdefault((loc.lat, loc.lon), rnd.uniform(0.2, 3.0))
+        await asyncio.sleep(delay)
+        return [_fake_listing(i) for i in range(per_city)]
+
+    async def fake_complexes(loc, estate_types=None):
+        return []
+
+    async def fake_save(items, city=None):
+        await asyncio.sleep(0.1)
+        return items
+
+    listings_route.get_article_listings = fake_articles
+    listings_route.get_complex_listings = fake_complexes
+    listings_route.save_listings = fake_save
+
+
+async def in_process():
+    tracemalloc.start()
+    start = time.perf_counter()
+    body = json.dumps(await listings_route.nationwide_listings(types=None, stream=False), ensure_ascii=False)
+    full_sec = time.perf_counter() - start
+    _, full_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"전체 응답   TTFB {full_sec * 1000:7.0f}ms  전체 {full_sec * 1000:7.0f}ms  "
+          f"{len(body.encode()) / 1024:8.0f} KiB  최대 {full_peak / 1024 / 1024:6.1f} MiB")
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    ttfb, size = None, 0
+    async for line in listings_route._stream_nationwide(None):
+        if ttfb is None:
+            ttfb = time.perf_counter() - start
+        size += len(line.encode())
+    stream_sec = time.perf_counter() - start
+    _, stream_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"NDJSON     TTFB {ttfb * 1000:7.0f}ms  전체 {stream_sec * 1000:7.0f}ms  "
+          f"{size / 1024:8.0f} KiB  최대 {stream_peak / 1024 / 1024:6.1f} MiB")
+
+
+async def against(url: str):
+    async with httpx.AsyncClient(timeout=None) as client:
+        for label, params in (("전체 응답", {}), ("NDJSON", {"stream": "true"})):
+            start = time.perf_counter()
+            ttfb, size = None, 0
+            async with client.stream("GET", url, params=params) as res:
+                async for chunk in res.aiter_bytes():
+                    if ttfb is None:
+                        ttfb = time.perf_counter() - start
+                    size += len(chunk)
+            total = time.perf_counter() - start
+            print(f"{label:<10} TTFB {ttfb * 1000:7.0f}ms  전체 {total * 1000:7.0f}ms  {size / 1024:8.0f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--listings", type=int, default=2_000, help="가짜 모드의 도시별 매물 수")
+    parser.add_argument("--url", help="실행 중인 서버의 /api/listings/all 주소")
+    args = parser.parse_args()
+    if args.url:
+        asyncio.run(against(args.url))
+    else:
+        patch_upstream(args.listings)
+        asyncio.run(in_process())
+
+
+if __name__ == "__main__":
+    main()
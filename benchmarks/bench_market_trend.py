@@ -0,0 +1,90 @@
+"""
+/api/market/trend 쿼리 지연 비교 — 기존 LIKE 풀스캔 vs 지역 키 인덱스 조회.
+
+벤치마크 전용 DB에 N건(기본 100만)을 채운 뒤 두 쿼리를 반복 실행한다.
+    DB_NAME=roomitai_bench python -m benchmarks.bench_market_trend --rows 1000000
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.database import init_db, save_listings, get_connection, get_market_trend_db, reset_table_auto_increment
+
+_REGIONS = [
+    ("서울", ["마포구", "강남구", "서초구", "송파구", "관악구", "영등포구", "성동구", "용산구"]),
+    ("부산", ["해운대구", "수영구", "부산진구", "동래구"]),
+    ("경기", ["수원시", "성남시", "고양시", "용인시", "부천시"]),
+    ("대구", ["수성구", "달서구", "중구"]),
+]
+_TYPES = ["원룸", "빌라", "아파트", "오피스텔"]
+
+_LEGACY_QUERY = """
+    SELECT DATE(created_at) AS date, ROUND(AVG(price), 0) AS avg_price, COUNT(*) AS count
+    FROM listings
+    WHERE (city LIKE %s OR address LIKE %s) AND type = %s
+    GROUP BY DATE(created_at) ORDER BY date ASC
+"""
+
+
+def populate(n: int, batch: int = 10_000):
+    rnd = random.Random(7)
+    for offset in range(0, n, batch):
+        listings = []
+        for _ in range(min(batch, n - offset)):
+            sido, regions = rnd.choice(_REGIONS)
+            price = rnd.randint(500, 100000)
+            listings.append({
+                "name": "매물",
+                "address": f"{sido} {rnd.choice(regions)} 어느동 {rnd.randint(1, 999)}",
+                "area": 33.0, "deposit": price, "monthly": 0, "price": price,
+                "lat": 37.5, "lng": 127.0, "type": rnd.choice(_TYPES),
+                "distance_km": 0.5, "source": "article",
+            })
+        save_listings(listings)
+    # created_at을 최근 90일에 분산
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("UPDATE listings SET created_at = NOW() - INTERVAL (id % 90) DAY")
+        conn.commit()
+        cursor.close()
+
+
+def time_it(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def legacy(area: str, listing_type: str):
+    with get_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(_LEGACY_QUERY, (f"%{area}%", f"%{area}%", listing_type))
+        cursor.fetchall()
+        cursor.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="벤치마크 후 데이터를 지우지 않음")
+    args = parser.parse_args()
+
+    init_db()
+    populate(args.rows)
+
+    for area in ["마포구", "서울"]:
+        before = time_it(lambda: legacy(area, "원룸"), args.repeat)
+        after = time_it(lambda: get_market_trend_db(area, "원룸"), args.repeat)
+        print(f"{area:<6} rows={args.rows:,}  before={before:8.1f}ms  after={after:8.1f}ms  (x{before / after:.1f})")
+
+    if not args.keep:
+        reset_table_auto_increment("listings")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+complexList 가격 문자열 파싱 — 기존 _parse_price_han(호출마다 re 컴파일 캐시 조회 3~4회) vs 사전 컴파일 버전.
+
+1) 무작위 문자열 퍼징으로 기존 구현과 결과가 같은지 확인한다.
+   기존 구현이 예외를 내던 입력(쉼표만 있는 숫자 묶음, 예: '억 ,')은 새 구현이 정수를 돌려주기만 하면 된다.
+2) 실제 응답과 비슷한 가격 문자열로 단건 / 묶음(_parse_prices_han) 처리 시간을 잰다.
+    python -m benchmarks.bench_price_parse --fuzz 200000 --prices 300000
+"""
+import argparse
+import random
+import re
+import time
+
+from src.util import _parse_price_han, _parse_prices_han
+
+
+def legacy_parse_price_han(price_str: str) -> int:
+    """변경 전 src.util._parse_price_han 그대로"""
+    if not price_str or price_str == "0":
+        return 0
+    text = re.sub(r"<[^>]+>", "", price_str).strip()
+    total = 0
+    m_uk = re.search(r"(\d+)\s*억", text)
+    if m_uk:
+        total += int(m_uk.group(1)) * 10000
+    m_man = re.search(r"억\s*([\d,]+)", text)
+    if m_man:
+        total += int(m_man.group(1).replace(",", ""))
+    elif not m_uk:
+        m_only = re.search(r"([\d,]+)", text)
+        if m_only:
+            total = int(m_only.group(1).replace(",", ""))
+    return total
+
+
+_TOKENS = ["0", "1", "2", "9", "12", "9,000", "1,2", ",", ",,", "억", "만", "원", " ", "  ", "\t",
+           "<b>", "</b>", "<em class='x'>", "<", ">", "~", "-", "약", "٣", "a"]
+
+
+def fuzz(n: int, seed: int = 7) -> tuple[int, int]:
+    rnd = random.Random(seed)
+    raised = 0
+    for _ in range(n):
+        text = "".join(rnd.choice(_TOKENS) for _ in range(rnd.randint(0, 8)))
+        try:
+            expected = legacy_parse_price_han(text)
+        except ValueError:
+            raised += 1
+            assert isinstance(_parse_price_han(text), int), repr(text)
+            continue
+        got = _parse_price_han(text)
+        assert got == expected, f"{text!r}: {got} != {expected}"
+    return n, raised
+
+
+def make_prices(n: int, seed: int = 42) -> list[str]:
+    rnd = random.Random(seed)
+    prices = []
+    for _ in range(n):
+        uk, man = rnd.randint(0, 40), rnd.choice([0, 500, 1000, 2500, 9000])
+        kind = rnd.random()
+        if kind < 0.3:
+            prices.append(f"{uk}억 {man:,}" if man else f"{uk}억")
+        elif kind < 0.5:
+            prices.append(f"{rnd.randint(1000, 9999):,}")
+        elif kind < 0.6:
+            prices.append(str(rnd.randint(1000, 9999)))
+        elif kind < 0.8:
+            prices.append(f"<em>{uk}억</em> {man:,}")
+        else:
+            prices.append("0")
+    return prices
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fuzz", type=int, default=200_000)
+    parser.add_argument("--prices", type=int, default=300_000)
+    args = parser.parse_args()
+
+    n, raised = fuzz(args.fuzz)
+    print(f"퍼징 {n:,}건 일치 (기존 구현이 예외를 낸 {raised:,}건은 새 구현이 정수 반환)")
+
+    prices = make_prices(args.prices)
+    timings = []
+    for label, fn in (("기존 _parse_price_han", lambda: [legacy_parse_price_han(p) for p in prices]),
+                      ("사전 컴파일 단건", lambda: [_parse_price_han(p) for p in prices]),
+                      ("_parse_prices_han 묶음", lambda: _parse_prices_han(prices))):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((label, time.perf_counter() - start, result))
+    base = timings[0][1]
+    for label, sec, result in timings:
+        assert result == timings[0][2], label
+        print(f"{label:<24} {sec * 1000:8.1f}ms  (x{base / sec:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+save_listings 행 단위 INSERT vs 다중 행 INSERT 처리량 비교.
+
+.env의 DB 설정으로 접속하므로 벤치마크 전용 DB_NAME을 지정해서 실행할 것.
+    DB_NAME=roomitai_bench python -m benchmarks.bench_save_listings --rows 10000
+"""
+import argparse
+import random
+import time
+
+from app.database import init_db, save_listings, reset_table_auto_increment
+
+
+def make_listings(n: int) -> list[dict]:
+    rnd = random.Random(42)
+    listings = []
+    for i in range(n):
+        deposit = rnd.randint(100, 50000)
+        monthly = rnd.choice([0, rnd.randint(20, 200)])
+        listings.append({
+            "name": f"매물{i}",
+            "address": f"서울 마포구 합정동 {rnd.randint(1, 999)}-{rnd.randint(1, 99)}",
+            "area": round(rnd.uniform(15, 120), 1),
+            "deposit": deposit,
+            "monthly": monthly,
+            "price": deposit + monthly * 10,
+            "lat": 37.55 + rnd.uniform(-0.01, 0.01),
+            "lng": 126.91 + rnd.uniform(-0.01, 0.01),
+            "type": rnd.choice(["원룸", "빌라", "아파트", "오피스텔"]),
+            "distance_km": round(rnd.uniform(0, 2), 2),
+            "source": "article",
+        })
+    return listings
+
+
+def run(listings: list[dict], bulk: bool) -> float:
+    reset_table_auto_increment("listings")
+    start = time.perf_counter()
+    saved = save_listings(listings, "벤치마크", bulk=bulk)
+    elapsed = time.perf_counter() - start
+    assert [s["name"] for s in saved] == [l["name"] for l in listings]
+    assert len({s["id"] for s in saved}) == len(saved)
+    return len(listings) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    init_db()
+    listings = make_listings(args.rows)
+    row_rps = run(listings, bulk=False)
+    bulk_rps = run(listings, bulk=True)
+    reset_table_auto_increment("listings")
+
+    print(f"rows={args.rows}")
+    print(f"row-by-row : {row_rps:>10,.0f} rows/s")
+    print(f"bulk       : {bulk_rps:>10,.0f} rows/s  (x{bulk_rps / row_rps:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+NThing 메모리 사용량 — 매물 1건당 바이트.
+
+- 기존: __dict__를 가진 객체 + 매물마다 13개 키 counter dict (아래 _Legacy* 클래스로 재현)
+- __slots__: 현재 src.classes의 NThing / NLocation / NArea / NPrice / NNeighborAround
+- NThingTable: 열 지향 NumPy 배열
+    python -m benchmarks.bench_thing_memory --things 50000
+"""
+import argparse
+import gc
+import random
+import tracemalloc
+
+from src.classes import NArea, NLocation, NNeighborAround, NPrice, NThing, NThingTable
+
+
+class _LegacyLocation:
+    def __init__(self, lat, lon, zoom=16):
+        self.lat, self.lon, self.zoom = float(lat), float(lon), zoom
+
+
+class _LegacyArea:
+    def __init__(self, mn, mx, representative, floorRatio):
+        self.mn, self.mx, self.representative, self.floorRatio = mn, mx, representative, floorRatio
+
+
+class _LegacyPrice:
+    def __init__(self, mn, mx, med):
+        self.mn = mn if mn != 0 else None
+        self.mx = mx if mx != 0 else None
+        self.med = med if med != 0 else None
+
+
+class _LegacyAround:
+    def __init__(self):
+        self.counter = {tag: 0 for tag in NNeighborAround.HEADER}
+
+
+class _LegacyThing:
+    def __init__(self, name, type, buildTime, loc, area, deal, lease, udeal, ulease):
+        self.type, self.buildTime, self.area, self.name, self.loc = type, buildTime, area, name, loc
+        self.deal, self.udeal, self.lease, self.ulease = deal, udeal, lease, ulease
+        self.dir = ''
+        self.neiAround = _LegacyAround()
+
+
+def make_rows(n: int) -> list[dict]:
+    rnd = random.Random(42)
+    rows = []
+    for i in range(n):
+        deal = rnd.randint(20000, 200000)
+        rows.append({
+            "name": f"단지{i}", "type": rnd.choice(["APT", "OPST", "VL"]), "build": f"20{rnd.randint(0, 23):02d}01",
+            "lat": 37.5 + rnd.uniform(-0.05, 0.05), "lon": 127.0 + rnd.uniform(-0.05, 0.05),
+            "area": (rnd.uniform(20, 60), rnd.uniform(60, 150), rnd.uniform(40, 100), rnd.randint(100, 300)),
+            "deal": (deal, deal * 2, rnd.choice([0, deal])),
+            "lease": (deal // 2, deal, 0),
+            "counts": [rnd.randint(0, 20) for _ in NNeighborAround.HEADER],
+        })
+    return rows
+
+
+def build(rows, loc_cls, area_cls, price_cls, thing_cls):
+    things = []
+    for r in rows:
+        t = thing_cls(r["name"], r["type"], r["build"], loc_cls(r["lat"], r["lon"]), area_cls(*r["area"]),
+                      price_cls(*r["deal"]), price_cls(*r["lease"]), price_cls(*r["deal"]), price_cls(*r["lease"]))
+        t.dir = "EE"
+        if thing_cls is NThing:
+            t.neiAround = NNeighborAround(r["counts"])
+        else:
+            t.neiAround.counter.update(zip(NNeighborAround.HEADER, r["counts"]))
+        things.append(t)
+    return things
+
+
+def measure(fn) -> tuple[int, object]:
+    gc.collect()
+    tracemalloc.start()
+    holder = fn()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, holder
+
+
+def _typed_rows(rows) -> list:
+    # 84 == 84.0이므로 값과 함께 타입까지 비교한다
+    return [[(type(v), v) for v in row] for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--things", type=int, default=50_000)
+    args = parser.parse_args()
+    rows = make_rows(args.things)
+    n = len(rows)
+
+    legacy, _ = measure(lambda: build(rows, _LegacyLocation, _LegacyArea, _LegacyPrice, _LegacyThing))
+    slotted, things = measure(lambda: build(rows, NLocation, NArea, NPrice, NThing))
+    table_bytes, table = measure(lambda: NThingTable.from_things(things))
+    assert _typed_rows(table.rows()) == _typed_rows(t.get_list() for t in things), "NThingTable 행이 NThing과 다름"
+
+    # int와 float가 섞인 열 (대표 면적 84 / 84.97) — 84가 84.0으로 바뀌지 않아야 한다
+    mixed = build(rows[:1000], NLocation, NArea, NPrice, NThing)
+    for i, t in enumerate(mixed[::2]):
+        t.area.representative = 84 + i % 3
+    mixed_table = NThingTable.from_things(mixed)
+    assert 'area.representative' in mixed_table.int_rows
+    assert _typed_rows(mixed_table.rows()) == _typed_rows(t.get_list() for t in mixed), "혼합 열 행이 NThing과 다름"
+
+    print(f"매물 {n:,}건 (이름 문자열은 입력과 공유되므로 세 방식 모두 제외)")
+    print(f"기존 (__dict__ + counter dict) {legacy / n:8.0f} B/건")
+    print(f"__slots__ + array 카운터       {slotted / n:8.0f} B/건  (x{legacy / slotted:.1f})")
+    print(f"NThingTable (열 지향)          {table_bytes / n:8.0f} B/건  (x{legacy / table_bytes:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+new.land.naver.com API 로컬 목 서버 — src.crawler 시험용.
+
+지역 트리(시도 → 시군구 → 읍면동), 섹터, 단지, 편의시설, 학교 응답을 결정적으로 생성하고
+MOCK_FAIL_RATE 비율로 429/500을 섞어 재시도·백오프를 확인할 수 있다.
+    MOCK_FAIL_RATE=0.1 uvicorn benchmarks.mock_naver:app --port 8765
+    python -m src.crawler --base-url http://127.0.0.1:8765/api/ --checkpoint /tmp/crawl.json --out /tmp/crawl/things
+"""
+import os
+import random
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+app = FastAPI()
+
+FAIL_RATE = float(os.getenv("MOCK_FAIL_RATE", 0))
+FANOUT = int(os.getenv("MOCK_FANOUT", 3))        # 단계별 하위 지역 수
+COMPLEXES = int(os.getenv("MOCK_COMPLEXES", 20))  # 방향별 단지 수
+_counts = {"requests": 0, "failures": 0}
+
+
+@app.middleware("http")
+async def _inject_failures(request: Request, call_next):
+    _counts["requests"] += 1
+    if request.url.path.startswith("/api/") and random.random() < FAIL_RATE:
+        _counts["failures"] += 1
+        status = random.choice([429, 500])
+        return JSONResponse({"error": "mock failure"}, status_code=status)
+    return await call_next(request)
+
+
+def _center(code: str) -> tuple[float, float]:
+    rnd = random.Random(code)
+    return 35.5 + rnd.uniform(-1.5, 2.0), 127.5 + rnd.uniform(-1.0, 1.5)
+
+
+@app.get("/api/regions/list")
+def regions(cortarNo: str = "0000000000"):
+    if cortarNo == "0000000000":
+        children = [f"{10 + i}00000000" for i in range(FANOUT)]
+    elif cortarNo.endswith("00000000"):
+        children = [cortarNo[:2] + f"{100 + i * 10:03d}" + "00000" for i in range(FANOUT)]
+    elif cortarNo.endswith("00000"):
+        children = [cortarNo[:5] + f"{101 + i:03d}" + "00" for i in range(FANOUT)]
+    else:
+        children = []
+    regions = []
+    for code in children:
+        lat, lon = _center(code)
+        regions.append({"cortarNo": code, "cortarName": f"지역{code}", "centerLat": lat, "centerLon": lon})
+    return {"regionList": regions}
+
+
+@app.get("/api/cortars")
+def cortars(centerLat: float, centerLon: float, zoom: int = 16):
+    d = 0.01
+    return {
+        "sectorName": f"섹터{centerLat:.4f}", "centerLat": centerLat, "centerLon": centerLon,
+        "sectorNo": f"{int(centerLat * 1e4)}{int(centerLon * 1e4)}", "cityName": "목시", "divisionName": "목구",
+        "cortarVertexLists": [[[centerLat - d, centerLon - d], [centerLat - d, centerLon + d],
+                               [centerLat + d, centerLon + d], [centerLat + d, centerLon - d]]],
+    }
+
+
+@app.get("/api/complexes/single-markers/2.0")
+def complexes(request: Request):
+    q = request.query_params
+    lat, lon = (float(q["topLat"]) + float(q["bottomLat"])) / 2, (float(q["leftLon"]) + float(q["rightLon"])) / 2
+    rnd = random.Random(f"{lat:.5f}{lon:.5f}{q.get('directions')}")
+    res = []
+    for i in range(COMPLEXES):
+        deal = rnd.randint(20000, 200000)
+        res.append({
+            "complexName": f"단지{i}", "realEstateTypeCode": rnd.choice(["APT", "OPST", "VL"]),
+            "completionYearMonth": f"20{rnd.randint(0, 23):02d}01",
+            "latitude": lat + rnd.uniform(-0.012, 0.012), "longitude": lon + rnd.uniform(-0.012, 0.012),
+            "minArea": 40.0, "maxArea": 110.0, "representativeArea": 84.0, "floorAreaRatio": 250,
+            "minDealPrice": deal, "maxDealPrice": deal * 2, "medianDealPrice": deal,
+            "minLeasePrice": deal // 2, "maxLeasePrice": deal, "minDealUnitPrice": 3000, "maxDealUnitPrice": 5000,
+            "minLeaseUnitPrice": 1500, "maxLeaseUnitPrice": 2500, "dealCount": rnd.randint(0, 5), "leaseCount": 1,
+        })
+    return res
+
+
+@app.get("/api/regions/neighborhoods")
+def neighborhoods(request: Request):
+    q = request.query_params
+    lat, lon = (float(q["topLat"]) + float(q["bottomLat"])) / 2, (float(q["leftLon"]) + float(q["rightLon"])) / 2
+    rnd = random.Random(f"{lat:.5f}{lon:.5f}{q.get('type')}")
+    return {"neighborhoods": [
+        {"name": f"{q.get('type')}{i}", "latitude": lat + rnd.uniform(-0.01, 0.01), "longitude": lon + rnd.uniform(-0.01, 0.01)}
+        for i in range(10)
+    ]}
+
+
+@app.get("/api/schools")
+def schools(request: Request):
+    q = request.query_params
+    lat, lon = (float(q["topLat"]) + float(q["bottomLat"])) / 2, (float(q["leftLon"]) + float(q["rightLon"])) / 2
+    rnd = random.Random(f"{lat:.5f}{lon:.5f}school")
+    return [
+        {"organizationType": rnd.choice(["공립", "사립"]), "schoolName": f"학교{i}",
+         "latitude": lat + rnd.uniform(-0.01, 0.01), "longitude": lon + rnd.uniform(-0.01, 0.01)}
+        for i in range(5)
+    ]
+
+
+@app.get("/stats")
+def stats():
+    return _counts
@@ -1,7 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.services.geolocation import set_shared_client, close_shared_client
-from app.database import init_db, reset_table_auto_increment
+from app.services.geolocation import set_shared_client, close_shared_client, warm_geocode_cache
+from app.services.geocode_store import open_store, get_store, close_store
+from app.services.http_clients import init_clients, close_clients
+from app.services.prefetch import PrefetchScheduler, PREFETCH_ENABLED, cancel_background_refreshes
+from app.routes._shared import CITY_CENTERS
+from app.database import init_db, open_pool, close_pool
+from app.db_async import reset_table_auto_increment, shutdown_executor
 from dotenv import load_dotenv
 from contextlib import asynccontextmanager
 import asyncio
@@ -18,6 +23,7 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 RESET_INTERVAL_SECONDS = 10 * 60  # 10분
+GEOCODE_FLUSH_INTERVAL_SECONDS = 30
 
 
 async def _periodic_reset():
@@ -25,38 +31,78 @@ async def _periodic_reset():
     while True:
         await asyncio.sleep(RESET_INTERVAL_SECONDS)
         try:
-            result = await asyncio.to_thread(reset_table_auto_increment, "listings")
+            result = await reset_table_auto_increment("listings")
             logger.info(f"[주기적 초기화] listings {result['deleted_count']}건 삭제, AUTO_INCREMENT=1")
         except Exception as e:
             logger.error(f"[주기적 초기화 실패] {e}")
 
 
+async def _periodic_geocode_flush():
+    """지오코딩 저장소 쓰기 버퍼를 주기적으로 디스크에 기록"""
+    while True:
+        await asyncio.sleep(GEOCODE_FLUSH_INTERVAL_SECONDS)
+        store = get_store()
+        if store is None:
+            continue
+        try:
+            await asyncio.to_thread(store.flush)
+        except Exception as e:
+            logger.error(f"[지오코딩 저장소 기록 실패] {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # 이전 lifespan의 종료 처리로 닫힌 커넥션 풀을 다시 연다 (DB 스레드풀은 첫 사용 시 생성)
+    open_pool()
+
     # 시작 시 초기화 — DB 연결 실패해도 서버는 기동 유지
     try:
         init_db()
-        result = await asyncio.to_thread(reset_table_auto_increment, "listings")
+        result = await reset_table_auto_increment("listings")
         logger.info(f"[서버 시작] listings 초기화 완료 ({result['deleted_count']}건 삭제, AUTO_INCREMENT=1)")
     except Exception as e:
         logger.error(f"[서버 시작 초기화 실패] {e} — DB 없이 기동 계속")
 
+    try:
+        await asyncio.to_thread(open_store)
+        loaded = await asyncio.to_thread(warm_geocode_cache)
+        logger.info(f"[서버 시작] 지오코딩 저장소에서 {loaded}건 미리 적재")
+    except Exception as e:
+        logger.error(f"[지오코딩 저장소 열기 실패] {e} — 메모리 캐시만 사용")
+
     client = httpx.AsyncClient()
     set_shared_client(client)
+    await init_clients()
 
     reset_task = asyncio.create_task(_periodic_reset())
+    flush_task = asyncio.create_task(_periodic_geocode_flush())
+    # 주요 도시 + 인기 지역 매물 스냅샷 주기적 갱신
+    prefetch_task = asyncio.create_task(PrefetchScheduler(CITY_CENTERS).run()) if PREFETCH_ENABLED else None
 
     yield
 
     # 종료 시 초기화
     reset_task.cancel()
+    flush_task.cancel()
+    if prefetch_task:
+        prefetch_task.cancel()
+    # 닫힌 HTTP 클라이언트로 갱신하다 실패하지 않도록 클라이언트를 닫기 전에 취소
+    await cancel_background_refreshes()
     try:
-        result = await asyncio.to_thread(reset_table_auto_increment, "listings")
+        result = await reset_table_auto_increment("listings")
         logger.info(f"[서버 종료] listings 초기화 완료 ({result['deleted_count']}건 삭제, AUTO_INCREMENT=1)")
     except Exception as e:
         logger.error(f"[서버 종료 초기화 실패] {e}")
 
+    try:
+        await asyncio.to_thread(close_store)
+    except Exception as e:
+        logger.error(f"[지오코딩 저장소 닫기 실패] {e}")
+
     await close_shared_client()
+    await close_clients()
+    shutdown_executor()
+    close_pool()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -1,12 +1,13 @@
-# shapely / cv2 는 레거시 시각화 기능(NMap, NDimension)에서만 사용됨.
+# cv2 는 레거시 시각화 기능(NDimension)에서만 사용됨.
 # 프로덕션 경량화를 위해 없어도 앱이 기동되도록 조건부 임포트 처리.
 try:
-    from shapely.geometry import Point, Polygon
     import cv2
     _HAS_VISUAL_DEPS = True
 except ImportError:
     _HAS_VISUAL_DEPS = False
 
+from array import array
+
 import numpy as np
 
 #Con
@@ -17,6 +18,7 @@ def LIST_EXTENDS(v1 : list, v2 : list):
 
 class NLocation:
     TO_INTEGER = 10 ** 8
+    __slots__ = ('lat', 'lon', 'zoom')
 
     def __init__(self, lat, lon, zoom = 16):
         self.lat = lat if type(lat) == 'float' else float(lat)
@@ -43,14 +45,40 @@ class NMap:
         for vs in shape_vertexs:
             if len(vs) == 0: continue
             self.vertexs.append(vs)
-        self.polys = [Polygon(vs) for vs in self.vertexs]
+        # (lat, lon) 꼭짓점 배열과 bbox — shapely 없이 NumPy ray casting으로 포함 판정
+        self.rings = [np.asarray(vs, dtype=np.float64).reshape(-1, 2) for vs in self.vertexs]
+        self.bboxes = [(r[:, 0].min(), r[:, 0].max(), r[:, 1].min(), r[:, 1].max()) for r in self.rings]
 
     def contain(self, loc : NLocation):
-        p = Point(loc.lat, loc.lon)
-        for poly in self.polys:
-            if p.within(poly) is True:
-                return True
-        return False
+        return bool(self.contains_many([loc.lat], [loc.lon])[0])
+
+    def contains_many(self, lats, lons) -> np.ndarray:
+        """좌표 배열 → 어느 한 다각형 안에 있는지 bool 마스크"""
+        lats = np.asarray(lats, dtype=np.float64).ravel()
+        lons = np.asarray(lons, dtype=np.float64).ravel()
+        mask = np.zeros(len(lats), dtype=bool)
+        for ring, (lat_min, lat_max, lon_min, lon_max) in zip(self.rings, self.bboxes):
+            if len(ring) < 3:
+                continue
+            # bbox 밖이거나 이미 다른 다각형에 포함된 점은 건너뜀
+            cand = np.flatnonzero(~mask & (lats >= lat_min) & (lats <= lat_max) & (lons >= lon_min) & (lons <= lon_max))
+            if cand.size:
+                mask[cand] = NMap._ray_cast(ring, lats[cand], lons[cand])
+        return mask
+
+    @staticmethod
+    def _ray_cast(ring : np.ndarray, xs : np.ndarray, ys : np.ndarray) -> np.ndarray:
+        """even-odd 규칙. 고리가 닫혀 있지 않아도 마지막 → 첫 꼭짓점 변을 포함한다"""
+        inside = np.zeros(len(xs), dtype=bool)
+        x1, y1 = ring[:, 0], ring[:, 1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        for ax, ay, bx, by in zip(x1, y1, x2, y2):
+            if ay == by:
+                continue
+            crosses = (ay > ys) != (by > ys)
+            x_at = ax + (ys - ay) * (bx - ax) / (by - ay)
+            inside ^= crosses & (xs < x_at)
+        return inside
 
     def get_dimension(self):
         return NDimension(self.vertexs)
@@ -198,29 +226,23 @@ class NNeighborAround:
     HEADER = ['BUS','METRO','INFANT','PRESCHOOL','HOSPITAL',
     'PARKING','MART','CONVENIENCE','WASHING','BANK','OFFICE',
     'PRI_SCHOOL', 'PUB_SCHOOL']
+    INDEX = {tag: i for i, tag in enumerate(HEADER)}
+    __slots__ = ('counts',)
 
-    def __init__(self) -> None:
-        self.counter = {
-            'BUS': 0,
-            'METRO' : 0,
-            'INFANT' : 0,
-            'PRESCHOOL' : 0,
-            'HOSPITAL' : 0,
-            'PARKING' : 0,
-            'MART' : 0,
-            'CONVENIENCE': 0,
-            'WASHING': 0,
-            'BANK' : 0,
-            'OFFICE' : 0,
-            'PRI_SCHOOL' : 0,
-            'PUB_SCHOOL' : 0
-        }
+    def __init__(self, counts = None) -> None:
+        # HEADER 순서의 개수 배열 — 매물마다 13개 키 dict를 만들지 않는다
+        self.counts = array('i', counts) if counts is not None else array('i', bytes(4 * len(NNeighborAround.HEADER)))
 
-    def increase(self, tag = ''):
-        self.counter[tag] += 1
+    @property
+    def counter(self):
+        """{유형: 개수} 스냅샷 (읽기 전용 — 변경은 increase 사용)"""
+        return dict(zip(NNeighborAround.HEADER, self.counts))
+
+    def increase(self, tag = '', n = 1):
+        self.counts[NNeighborAround.INDEX[tag]] += n
 
     def get_list(self):
-        return self.counter.values()
+        return list(self.counts)
 
 class NNeighbor:
     BUS = 'BUS' # 버스정류장
@@ -237,6 +259,7 @@ class NNeighbor:
     OFFICE = 'OFFICE' # 관공서
 
     EACH = [BUS, METRO, KID, PRESCHOOL, SCHOOL, HOSPITAL, PARKING, MART, CONVENIENCE, WASHING, BANK, OFFICE]
+    __slots__ = ('type', 'name', 'loc')
 
     def __init__(self, type, name, loc) -> None:
         self.type = type
@@ -247,6 +270,8 @@ class NNeighbor:
         return "%s %s %s" % (self.type, self.name, self.loc)
 
 class NArea:
+    __slots__ = ('mn', 'mx', 'representative', 'floorRatio')
+
     def __init__(self, mn, mx, representative, floorRatio) -> None:
         self.mn = mn
         self.mx = mx
@@ -254,6 +279,8 @@ class NArea:
         self.floorRatio = floorRatio
 
 class NPrice:
+    __slots__ = ('mn', 'mx', 'med')
+
     def __init__(self, mn, mx, med) -> None:
         self.mn = mn if mn != 0 else None
         self.mx = mx if mx != 0 else None
@@ -272,6 +299,7 @@ class NThing:
         'minLeaseUnit', 'maxLeaseUnit', 'medianLeaseUnit',
         'Lat', 'Lon'],
         NNeighborAround.HEADER)
+    __slots__ = ('type', 'buildTime', 'area', 'name', 'loc', 'deal', 'udeal', 'lease', 'ulease', 'dir', 'neiAround')
 
     def __init__(self, name, type, buildTime, loc, area, deal, lease, udeal, ulease) -> None:
         self.type = type
@@ -293,6 +321,125 @@ class NThing:
     def __str__(self) -> str:
         return "%s %s %s" % (self.name, self.type, self.buildTime)
 
+class NThingTable:
+    """
+    NThing 묶음의 열 지향(struct-of-arrays) 표현.
+    - 수치 열(면적·가격·좌표): int64 또는 float64 배열 + None 마스크 (원래 int/float 값을 그대로 복원)
+      int와 float가 섞인 열은 float64로 두고 int였던 행을 int_rows 마스크에 기록한다
+    - 유형·준공·방향: 범주 코드(int32) + 범주 목록
+    - 편의시설 개수: (n, 13) int32, 열 순서는 NNeighborAround.HEADER
+    get_list(i)는 NThing.get_list()와 같은 행을 돌려준다.
+    """
+    HEADER = NThing.HEADER
+    CATEGORY_COLUMNS = ('type', 'buildTime', 'dir')
+    NUMERIC_COLUMNS = ('area.mn', 'area.mx', 'area.representative', 'area.floorRatio',
+                       'deal.mn', 'deal.mx', 'deal.med', 'lease.mn', 'lease.mx', 'lease.med',
+                       'udeal.mn', 'udeal.mx', 'udeal.med', 'ulease.mn', 'ulease.mx', 'ulease.med',
+                       'loc.lat', 'loc.lon')
+    __slots__ = ('names', 'categories', 'numeric', 'neighbors', 'int_rows')
+
+    def __init__(self, names, categories, numeric, neighbors, int_rows = None) -> None:
+        self.names = names # type: np.ndarray  # object
+        self.categories = categories # type: dict[str, tuple[np.ndarray, list]]
+        self.numeric = numeric # type: dict[str, tuple[np.ndarray, np.ndarray]]
+        self.neighbors = neighbors # type: np.ndarray
+        self.int_rows = int_rows or {} # type: dict[str, np.ndarray]  # 혼합 열만
+
+    @classmethod
+    def from_things(cls, things : list[NThing]):
+        names = np.empty(len(things), dtype=object)
+        names[:] = [t.name for t in things]
+        categories = {}
+        for col in cls.CATEGORY_COLUMNS:
+            codes, labels = cls._encode([getattr(t, col) for t in things])
+            categories[col] = (codes, labels)
+        numeric = {}
+        int_rows = {}
+        for col in cls.NUMERIC_COLUMNS:
+            outer, inner = col.split('.')
+            arr, mask, is_int = cls._numeric([getattr(getattr(t, outer), inner) for t in things])
+            numeric[col] = (arr, mask)
+            if is_int is not None:
+                int_rows[col] = is_int
+        neighbors = np.array([t.neiAround.counts for t in things], dtype=np.int32).reshape(len(things), len(NNeighborAround.HEADER))
+        return cls(names, categories, numeric, neighbors, int_rows)
+
+    @staticmethod
+    def _encode(values : list):
+        index = {}
+        codes = np.fromiter((index.setdefault(v, len(index)) for v in values), dtype=np.int32, count=len(values))
+        return codes, list(index)
+
+    @staticmethod
+    def _numeric(values : list):
+        """(값 배열, None 마스크, int였던 행 마스크 — int·float 혼합 열일 때만, 아니면 None)"""
+        mask = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+        present = [v for v in values if v is not None]
+        ints = [type(v) is int for v in present]
+        if all(ints):
+            arr = np.zeros(len(values), dtype=np.int64)
+            arr[~mask] = present
+            return arr, mask, None
+        arr = np.zeros(len(values), dtype=np.float64)
+        arr[~mask] = present
+        is_int = None
+        if any(ints):
+            is_int = np.zeros(len(values), dtype=bool)
+            is_int[~mask] = ints
+        return arr, mask, is_int
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def lats(self) -> np.ndarray:
+        return self.numeric['loc.lat'][0]
+
+    @property
+    def lons(self) -> np.ndarray:
+        return self.numeric['loc.lon'][0]
+
+    def _value(self, col, i):
+        arr, mask = self.numeric[col]
+        if mask[i]:
+            return None
+        is_int = self.int_rows.get(col)
+        if is_int is not None and is_int[i]:
+            return int(arr[i])
+        return arr[i].item()
+
+    def _label(self, col, i):
+        codes, labels = self.categories[col]
+        return labels[codes[i]]
+
+    def get_list(self, i):
+        row = [self.names[i], self._label('type', i), self._label('buildTime', i), self._label('dir', i)]
+        row.extend(self._value(col, i) for col in NThingTable.NUMERIC_COLUMNS)
+        row.extend(self.neighbors[i].tolist())
+        return row
+
+    def rows(self):
+        for i in range(len(self)):
+            yield self.get_list(i)
+
+    def to_things(self) -> list[NThing]:
+        things = []
+        for i in range(len(self)):
+            v = lambda col: self._value(col, i)
+            thing = NThing(
+                self.names[i], self._label('type', i), self._label('buildTime', i),
+                NLocation(v('loc.lat'), v('loc.lon')),
+                NArea(v('area.mn'), v('area.mx'), v('area.representative'), v('area.floorRatio')),
+                NPrice(v('deal.mn'), v('deal.mx'), v('deal.med')),
+                NPrice(v('lease.mn'), v('lease.mx'), v('lease.med')),
+                NPrice(v('udeal.mn'), v('udeal.mx'), v('udeal.med')),
+                NPrice(v('ulease.mn'), v('ulease.mx'), v('ulease.med')),
+            )
+            thing.dir = self._label('dir', i)
+            thing.neiAround = NNeighborAround(self.neighbors[i].tolist())
+            things.append(thing)
+        return things
+
 class NRegion:
     def __init__(self, name='', loc = None, no = '') -> None:
         self.name = name
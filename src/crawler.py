@@ -0,0 +1,217 @@
+"""
+전국 지역 비동기 크롤러 — get_region_list → get_sector → get_all_on_sector.
+
+get_sector_list는 지역을 하나씩 돌며 interval건마다 sleep(delay), 오류마다 20초를 쉬었다.
+RegionCrawler는
+- 요청 속도를 호스트별 토큰 버킷(http_clients.get_rate_limiter)으로만 제한하고
+- 최대 concurrency개 지역을 동시에 처리하며
+- 실패한 요청은 지수 백오프 + full jitter로 재시도하고
+- 완료한 지역 코드를 체크포인트 파일에 남겨 중단 후 이어서 실행할 수 있다.
+
+    python -m src.crawler --checkpoint data/crawl.json --out data/crawl/things
+    NAVER_API_BASE_URL=http://127.0.0.1:8765/api/ python -m src.crawler ...   # 목 서버 (benchmarks/mock_naver.py)
+"""
+import asyncio
+import inspect
+import json
+import logging
+import os
+import random
+import time
+
+from src import util
+from src.classes import NNeighbor, NRegion
+
+logger = logging.getLogger(__name__)
+
+ROOT_REGION_CODE = "0000000000"
+CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", 4))
+CRAWL_MAX_RETRIES = int(os.getenv("CRAWL_MAX_RETRIES", 5))
+
+
+class CrawlCheckpoint:
+    """완료·실패한 지역 코드를 JSON 파일에 기록 (임시 파일에 쓴 뒤 교체)"""
+
+    def __init__(self, path: str, save_every: int = 20):
+        self.path = path
+        self.save_every = save_every
+        self.done: set[str] = set()
+        self.failed: dict[str, str] = {}
+        self._dirty = 0
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            self.done = set(data.get("done", []))
+            self.failed = data.get("failed", {})
+
+    def is_done(self, code: str) -> bool:
+        return code in self.done
+
+    def mark_done(self, code: str):
+        self.done.add(code)
+        self.failed.pop(code, None)
+        self._touch()
+
+    def mark_failed(self, code: str, error: str):
+        self.failed[code] = error
+        self._touch()
+
+    def _touch(self):
+        self._dirty += 1
+        if self._dirty >= self.save_every:
+            self.save()
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"done": sorted(self.done), "failed": self.failed, "saved_at": time.time()}, f, ensure_ascii=False)
+        os.replace(tmp, self.path)
+        self._dirty = 0
+
+
+class RegionCrawler:
+    """
+    - on_sector(region, sector, things, neighbors): 지역 하나를 마칠 때마다 호출 (코루틴 함수도 가능)
+    - depth: 루트에서 몇 단계 아래 지역까지 내려갈지 (3 = 시도 → 시군구 → 읍면동)
+    """
+
+    def __init__(self, checkpoint: CrawlCheckpoint, on_sector=None, concurrency: int = CRAWL_CONCURRENCY,
+                 max_retries: int = CRAWL_MAX_RETRIES, base_delay: float = 1.0, max_delay: float = 60.0,
+                 depth: int = 3):
+        self.checkpoint = checkpoint
+        self.on_sector = on_sector
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.depth = depth
+        self.stats = {"regions": 0, "skipped": 0, "sectors": 0, "things": 0, "failed": 0, "retries": 0}
+
+    async def _retry(self, label: str, fn, *args):
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await fn(*args)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                # full jitter: [0, min(max_delay, base * 2^n)] 사이에서 무작위로 쉰다
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                self.stats["retries"] += 1
+                logger.warning(f"[크롤러] {label} 실패 ({attempt + 1}/{self.max_retries}): {e} — {delay:.1f}s 후 재시도")
+                await asyncio.sleep(delay)
+
+    async def _walk(self, code: str, level: int, queue: asyncio.Queue):
+        """지역 트리를 내려가며 최하위 지역을 작업 큐에 넣는다"""
+        try:
+            regions = await self._retry(f"지역 목록 {code}", util.get_region_list_async, code)
+        except Exception as e:
+            logger.error(f"[크롤러] 지역 목록 {code} 포기: {e}")
+            self.checkpoint.mark_failed(f"regions:{code}", str(e))
+            self.stats["failed"] += 1
+            return
+
+        if level + 1 >= self.depth:
+            for reg in regions:
+                self.stats["regions"] += 1
+                if self.checkpoint.is_done(reg.no):
+                    self.stats["skipped"] += 1
+                else:
+                    await queue.put(reg)
+            return
+        await asyncio.gather(*[self._walk(reg.no, level + 1, queue) for reg in regions])
+
+    async def _crawl_sector(self, reg: NRegion, sector):
+        """util.async_get_all_on_sector와 같은 요청을 보내되, 실패한 요청만 개별 재시도"""
+        def _fetch_things(sector, addon):
+            return self._retry(f"매물 {reg.no}/{addon.dir}", util.fetch_things_async, sector, addon)
+
+        things, neighbors_by_type = await asyncio.gather(
+            util.async_get_things_each_direction(sector, fetch=_fetch_things),
+            asyncio.gather(*[
+                self._retry(f"편의시설 {reg.no}/{nType}", util.get_neighborhood_async, sector, nType)
+                for nType in NNeighbor.EACH]),
+        )
+        neighbors = [n for res in neighbors_by_type for n in res]
+        return things, neighbors
+
+    async def _crawl_region(self, reg: NRegion):
+        try:
+            sector = await self._retry(f"섹터 {reg.no}", util.get_sector_async, reg.loc)
+            things, neighbors = await self._crawl_sector(reg, sector)
+            if self.on_sector:
+                result = self.on_sector(reg, sector, things, neighbors)
+                if inspect.isawaitable(result):
+                    await result
+        except Exception as e:
+            logger.error(f"[크롤러] {reg} 포기: {e}")
+            self.checkpoint.mark_failed(reg.no, str(e))
+            self.stats["failed"] += 1
+            return
+        self.checkpoint.mark_done(reg.no)
+        self.stats["sectors"] += 1
+        self.stats["things"] += len(things)
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            reg = await queue.get()
+            if reg is None:
+                return
+            await self._crawl_region(reg)
+
+    async def run(self, root: str = ROOT_REGION_CODE) -> dict:
+        started = time.perf_counter()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        workers = [asyncio.create_task(self._worker(queue)) for _ in range(self.concurrency)]
+        try:
+            await self._walk(root, 0, queue)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            for w in workers:
+                w.cancel()
+            self.checkpoint.save()
+        self.stats["elapsed"] = round(time.perf_counter() - started, 2)
+        return self.stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.services.http_clients import close_clients, get_rate_limiter, NAVER_API_HOST
+    from src.export import ThingExporter
+
+    logging.basicConfig(level=logging.INFO)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    parser = argparse.ArgumentParser(description="전국 지역 크롤링")
+    parser.add_argument("--checkpoint", default="data/crawl_checkpoint.json")
+    parser.add_argument("--out", default="data/crawl/things", help="내보내기 경로 접두사 (실행마다 시각이 붙는다)")
+    parser.add_argument("--root", default=ROOT_REGION_CODE)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=CRAWL_CONCURRENCY)
+    parser.add_argument("--base-url", help="NAVER_API_BASE_URL 대신 사용할 API 주소")
+    parser.add_argument("--verbose", action="store_true", help="요청마다 [GET] 로그 출력")
+    args = parser.parse_args()
+
+    if args.base_url:
+        util.BASE_API_URL = args.base_url
+    util.IS_LOGGING = args.verbose
+    standard = util.get_distance_standard()
+
+    async def _main():
+        prefix = f"{args.out}.{time.strftime('%Y%m%d-%H%M%S')}"
+        with ThingExporter(prefix) as exporter:
+            def _export(reg, sector, things, neighbors):
+                util.update_things_intersection(things, neighbors, standard)
+                exporter.write(things)
+
+            crawler = RegionCrawler(CrawlCheckpoint(args.checkpoint), _export, args.concurrency, depth=args.depth)
+            try:
+                stats = await crawler.run(args.root)
+            finally:
+                await close_clients()
+        print(stats)
+        print({"rate_limit": get_rate_limiter(NAVER_API_HOST).stats(), "exported": exporter.rows, "prefix": prefix})
+
+    asyncio.run(_main())
@@ -0,0 +1,247 @@
+"""
+크롤링한 매물(NThing)의 스트리밍 내보내기.
+
+매물을 chunk_size건씩 받아 바로 파일에 덧붙이므로 지역 크기와 무관하게 메모리 사용량이 일정하다.
+- csv:     NThing.HEADER 순서의 CSV (NThing.get_list 값 그대로)
+- columns: 열마다 원시 바이너리 파일 (<prefix>.columns/) — np.memmap으로 바로 다시 읽을 수 있다
+           수치 열 float64(None → NaN), 편의시설 개수 int32, 문자열 열 offsets(int64) + UTF-8 바이트
+- arrow / parquet: pyarrow가 설치되어 있을 때만 (Arrow IPC 파일은 pa.memory_map으로 읽기 가능)
+
+    with ThingExporter("out/gangnam", formats=("csv", "columns")) as ex:
+        for sector in sectors:
+            ex.write(things)
+    cols = load_columns("out/gangnam.columns")
+"""
+import csv
+import json
+import os
+from typing import Iterable
+
+import numpy as np
+
+from src.classes import NNeighborAround, NThing, NThingTable
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    _HAS_ARROW = True
+except ImportError:
+    _HAS_ARROW = False
+
+EXPORT_CHUNK_SIZE = 5_000
+
+# HEADER 열 → 종류
+_STRING_COLUMNS = NThing.HEADER[:4]                       # Name, Type, Build, Dir
+_NUMERIC_COLUMNS = NThing.HEADER[4:4 + len(NThingTable.NUMERIC_COLUMNS)]
+_COUNT_COLUMNS = NNeighborAround.HEADER
+_META_FILE = "_meta.json"
+
+
+class ThingExporter:
+    def __init__(self, prefix : str, formats = ("csv", "columns"), chunk_size : int = EXPORT_CHUNK_SIZE) -> None:
+        unknown = set(formats) - {"csv", "columns", "arrow", "parquet"}
+        if unknown:
+            raise ValueError(f"지원하지 않는 형식: {', '.join(sorted(unknown))}")
+        if ({"arrow", "parquet"} & set(formats)) and not _HAS_ARROW:
+            raise RuntimeError("arrow / parquet 형식은 pyarrow가 필요합니다.")
+        os.makedirs(os.path.dirname(prefix) or ".", exist_ok=True)
+        self.prefix = prefix
+        self.formats = tuple(formats)
+        self.chunk_size = chunk_size
+        self.rows = 0
+        self._buffer = [] # type: list[NThing]
+        self._csv_file = self._csv = None
+        self._col_dir = None
+        self._col_files = {}
+        self._string_offsets = {}
+        self._arrow = self._parquet = None
+        self._open()
+
+    # ── 열기 / 닫기 ───────────────────────────────────────
+    def _open(self):
+        if "csv" in self.formats:
+            self._csv_file = open(f"{self.prefix}.csv", "w", encoding="utf-8-sig", newline="")
+            self._csv = csv.writer(self._csv_file)
+            self._csv.writerow(NThing.HEADER)
+        if "columns" in self.formats:
+            self._col_dir = f"{self.prefix}.columns"
+            os.makedirs(self._col_dir, exist_ok=True)
+            for col in _STRING_COLUMNS:
+                self._col_files[col] = (open(os.path.join(self._col_dir, f"{col}.offsets.i8"), "wb"),
+                                        open(os.path.join(self._col_dir, f"{col}.data.u8"), "wb"))
+                self._col_files[col][0].write(np.zeros(1, dtype=np.int64).tobytes())
+                self._string_offsets[col] = 0
+            for col in _NUMERIC_COLUMNS:
+                self._col_files[col] = open(os.path.join(self._col_dir, f"{col}.f8"), "wb")
+            for col in _COUNT_COLUMNS:
+                self._col_files[col] = open(os.path.join(self._col_dir, f"{col}.i4"), "wb")
+        if _HAS_ARROW and ({"arrow", "parquet"} & set(self.formats)):
+            schema = _arrow_schema()
+            if "arrow" in self.formats:
+                self._arrow = pa.ipc.new_file(f"{self.prefix}.arrow", schema)
+            if "parquet" in self.formats:
+                self._parquet = pq.ParquetWriter(f"{self.prefix}.parquet", schema)
+
+    def close(self):
+        self.flush()
+        if self._csv_file:
+            self._csv_file.close()
+        for files in self._col_files.values():
+            for f in (files if isinstance(files, tuple) else (files,)):
+                f.close()
+        if self._col_dir:
+            with open(os.path.join(self._col_dir, _META_FILE), "w", encoding="utf-8") as f:
+                json.dump({
+                    "rows": self.rows,
+                    "header": NThing.HEADER,
+                    "strings": _STRING_COLUMNS,
+                    "float64": _NUMERIC_COLUMNS,
+                    "int32": _COUNT_COLUMNS,
+                }, f, ensure_ascii=False)
+        if self._arrow:
+            self._arrow.close()
+        if self._parquet:
+            self._parquet.close()
+        self._col_files = {}
+        self._csv_file = self._arrow = self._parquet = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── 쓰기 ─────────────────────────────────────────────
+    def write(self, things : Iterable[NThing]):
+        for thing in things:
+            self._buffer.append(thing)
+            if len(self._buffer) >= self.chunk_size:
+                self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        things, self._buffer = self._buffer, []
+        if self._csv:
+            self._csv.writerows(t.get_list() for t in things)
+        if self._col_dir or self._arrow or self._parquet:
+            self._write_columns(NThingTable.from_things(things))
+        self.rows += len(things)
+
+    def write_table(self, table : NThingTable):
+        """NThingTable 한 묶음을 모든 형식에 덧붙인다"""
+        if len(table) == 0:
+            return
+        self.flush()
+        if self._csv:
+            self._csv.writerows(table.rows())
+        self._write_columns(table)
+        self.rows += len(table)
+
+    def _write_columns(self, table : NThingTable):
+        strings = {
+            'Name': list(table.names),
+            'Type': _labels(table, 'type'),
+            'Build': _labels(table, 'buildTime'),
+            'Dir': _labels(table, 'dir'),
+        }
+        numeric = {}
+        for header, col in zip(_NUMERIC_COLUMNS, NThingTable.NUMERIC_COLUMNS):
+            arr, mask = table.numeric[col]
+            values = arr.astype(np.float64)
+            values[mask] = np.nan
+            numeric[header] = values
+        counts = np.ascontiguousarray(table.neighbors, dtype=np.int32)
+
+        if self._col_dir:
+            for col, values in strings.items():
+                encoded = [("" if v is None else str(v)).encode("utf-8") for v in values]
+                lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+                offsets = self._string_offsets[col] + np.cumsum(lengths)
+                offsets_file, data_file = self._col_files[col]
+                offsets_file.write(offsets.tobytes())
+                data_file.write(b"".join(encoded))
+                self._string_offsets[col] = int(offsets[-1])
+            for col, values in numeric.items():
+                self._col_files[col].write(values.tobytes())
+            for i, col in enumerate(_COUNT_COLUMNS):
+                self._col_files[col].write(np.ascontiguousarray(counts[:, i]).tobytes())
+        if self._arrow or self._parquet:
+            batch = pa.record_batch(
+                [pa.array([None if v is None else str(v) for v in strings[c]], pa.string()) for c in _STRING_COLUMNS]
+                + [pa.array(numeric[c], pa.float64()) for c in _NUMERIC_COLUMNS]
+                + [pa.array(counts[:, i], pa.int32()) for i in range(len(_COUNT_COLUMNS))],
+                schema=_arrow_schema(),
+            )
+            if self._arrow:
+                self._arrow.write_batch(batch)
+            if self._parquet:
+                self._parquet.write_batch(batch)
+
+
+def _labels(table : NThingTable, col : str) -> list:
+    codes, labels = table.categories[col]
+    return [labels[c] for c in codes.tolist()]
+
+
+def _arrow_schema():
+    return pa.schema(
+        [(c, pa.string()) for c in _STRING_COLUMNS]
+        + [(c, pa.float64()) for c in _NUMERIC_COLUMNS]
+        + [(c, pa.int32()) for c in _COUNT_COLUMNS]
+    )
+
+
+class MappedStrings:
+    """offsets + UTF-8 바이트 파일 위의 지연 디코딩 문자열 열"""
+    __slots__ = ('offsets', 'data')
+
+    def __init__(self, offsets : np.ndarray, data : np.ndarray) -> None:
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i : int) -> str:
+        if i < 0:
+            i += len(self)
+        return bytes(self.data[self.offsets[i]:self.offsets[i + 1]]).decode("utf-8")
+
+
+def load_columns(path : str) -> dict:
+    """ThingExporter의 columns 출력을 메모리 매핑으로 연다. {HEADER 열: np.memmap 또는 MappedStrings}"""
+    with open(os.path.join(path, _META_FILE), encoding="utf-8") as f:
+        meta = json.load(f)
+    rows = meta["rows"]
+
+    def _map(name, dtype, count):
+        file = os.path.join(path, name)
+        if count == 0 or os.path.getsize(file) == 0:
+            return np.zeros(count, dtype=dtype)
+        return np.memmap(file, dtype=dtype, mode="r", shape=(count,))
+
+    columns = {}
+    for col in meta["strings"]:
+        offsets = _map(f"{col}.offsets.i8", np.int64, rows + 1)
+        data = _map(f"{col}.data.u8", np.uint8, int(offsets[-1]))
+        columns[col] = MappedStrings(offsets, data)
+    for col in meta["float64"]:
+        columns[col] = _map(f"{col}.f8", np.float64, rows)
+    for col in meta["int32"]:
+        columns[col] = _map(f"{col}.i4", np.int32, rows)
+    return columns
+
+
+def export_sectors(sectors, prefix : str, formats = ("csv", "columns"), standard = None,
+                   chunk_size : int = EXPORT_CHUNK_SIZE) -> int:
+    """섹터별로 매물·편의시설을 수집해 편의시설 개수를 계산한 뒤 바로 내보낸다. 내보낸 매물 수 반환"""
+    from src.util import get_all_on_sector, get_distance_standard, update_things_intersection
+
+    standard = standard or get_distance_standard()
+    with ThingExporter(prefix, formats, chunk_size) as exporter:
+        for sector in sectors:
+            _, things, neighbors = get_all_on_sector(sector)
+            update_things_intersection(things, neighbors, standard)
+            exporter.write(things)
+    return exporter.rows
@@ -1,27 +1,38 @@
-import functools
 from time import sleep
-from haversine import haversine
-from app.services.geolocation import coords_to_address
+from app.services.geolocation import reverse_geocode_batch
+from app.services.http_clients import get_client, get_rate_limiter, NAVER_MOBILE_HOST, NAVER_API_HOST
+from app.utils.cache import TTLCache
+from app.utils.distance import haversine_m, distances_to, count_within_grid
+from app.utils.singleflight import SingleFlight
 from src.classes import *
 import requests
-import httpx
 import asyncio
+import numpy as np
+import os
+import re
+import time
 
-BASE_API_URL = "https://new.land.naver.com/api/"
+# 로컬 목 서버로 크롤러를 시험할 때 NAVER_API_BASE_URL로 바꾼다
+BASE_API_URL = os.getenv("NAVER_API_BASE_URL", "https://new.land.naver.com/api/")
 #Check Log 
 #Time
 IS_LOGGING = True
 
-_sector_cache: dict[str, NSector] = {}
+_sector_cache = TTLCache("sector", maxsize=5_000, ttl=24 * 3600)  # "lat,lon,z" -> NSector
+
+_API_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/117.0.0.0 Safari/537.36",
+    "Referer": "https://new.land.naver.com/"
+}
+API_TIMEOUT = 10.0
+# new.land.naver.com 동시 요청 상한 (섹터 크롤링 시 스레드풀 대신 이 값으로 제한)
+API_CONCURRENCY = 8
+_api_semaphore = asyncio.Semaphore(API_CONCURRENCY)
 
 def get(url = "", params = {}):
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/117.0.0.0 Safari/537.36",
-        "Referer": "https://new.land.naver.com/"
-    }
-    rep = requests.get(BASE_API_URL + url, params=params, headers=headers)
+    rep = requests.get(BASE_API_URL + url, params=params, headers=_API_HEADERS, timeout=API_TIMEOUT)
     if IS_LOGGING:
         print(f"[GET] {rep.request.url} → {rep.status_code}")
     if rep.status_code != 200:
@@ -29,20 +40,34 @@ def get(url = "", params = {}):
         raise Exception(f"Response Error {rep.status_code}: {rep.text[:200]}")
     return rep.json()
 
-def get_neighborhood(sector : NSector, nType = ''):
+async def aget(url = "", params = {}):
+    """get()의 비동기 버전 — 공유 커넥션 풀 사용, 동시 요청 수는 API_CONCURRENCY로 제한"""
+    await get_rate_limiter(NAVER_API_HOST).acquire()
+    async with _api_semaphore:
+        rep = await get_client(NAVER_API_HOST).get(
+            BASE_API_URL + url, params=params, headers=_API_HEADERS, timeout=API_TIMEOUT)
+    if IS_LOGGING:
+        print(f"[GET] {rep.request.url} → {rep.status_code}")
+    if rep.status_code != 200:
+        raise Exception(f"Response Error {rep.status_code}: {rep.text[:200]}")
+    return rep.json()
+
+def make_param_neighborhood(sector : NSector, nType = ''):
     param = sector.loc.get_around_param()
     param.update({'zoom' : sector.loc.zoom})
-    res = None
     if nType != NNeighbor.SCHOOL:
         param.update({ 'type' : nType})
-        res = get(NRE_ROUTER.NEIGHBORHOOD, param)
-    else:
-        res = get(NRE_ROUTER.SCHOOL, param)
+    return param
+
+def get_neighborhood(sector : NSector, nType = ''):
+    router = NRE_ROUTER.SCHOOL if nType == NNeighbor.SCHOOL else NRE_ROUTER.NEIGHBORHOOD
+    res = get(router, make_param_neighborhood(sector, nType))
     return parse_neighbor(res, nType)
 
 async def get_neighborhood_async(sector: NSector, nType: str):
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, functools.partial(get_neighborhood, sector, nType))
+    router = NRE_ROUTER.SCHOOL if nType == NNeighbor.SCHOOL else NRE_ROUTER.NEIGHBORHOOD
+    res = await aget(router, make_param_neighborhood(sector, nType))
+    return parse_neighbor(res, nType)
 
 async def async_get_all_neighbors(sector: NSector):
     tasks = [get_neighborhood_async(sector, nType) for nType in NNeighbor.EACH]
@@ -88,14 +113,29 @@ def get_things(sector: NSector, addon = NAddon.get_default()):
 def make_param_sector(loc : NLocation):
     return  {'centerLat':loc.lat, 'centerLon':loc.lon, 'zoom': loc.zoom}
 
+def _sector_key(loc : NLocation):
+    return f"{loc.lat:.5f},{loc.lon:.5f},z{loc.zoom}"
+
 def get_sector(loc : NLocation):
-    key = f"{loc.lat:.5f},{loc.lon:.5f},z{loc.zoom}"
-    if key in _sector_cache:
-        return _sector_cache[key]
+    key = _sector_key(loc)
+    cached = _sector_cache.get(key)
+    if cached is not None:
+        return cached
 
     res = get(NRE_ROUTER.CORTARS, make_param_sector(loc))
     sector = parse_sector(res)
-    _sector_cache[key] = sector
+    _sector_cache.set(key, sector)
+    return sector
+
+async def get_sector_async(loc : NLocation):
+    key = _sector_key(loc)
+    cached = _sector_cache.get(key)
+    if cached is not None:
+        return cached
+
+    res = await aget(NRE_ROUTER.CORTARS, make_param_sector(loc))
+    sector = parse_sector(res)
+    _sector_cache.set(key, sector)
     return sector
 
 def split_list(list : list, k : int = 5):
@@ -144,6 +184,10 @@ def get_region_list(code = "0000000000"):
     res = get(NRE_ROUTER.REGION_LIST, make_param_region(code))
     return parse_region(res)
 
+async def get_region_list_async(code = "0000000000"):
+    res = await aget(NRE_ROUTER.REGION_LIST, make_param_region(code))
+    return parse_region(res)
+
 def parse_region(region_obj = {}):
     if len(region_obj) < 1:
         return []
@@ -177,7 +221,7 @@ def parse_neighbor(data, nType):
             ))
 
     if nType == NNeighbor.PRESCHOOL or nType == NNeighbor.KID:
-        res = filter_item(res, lambda x : len(x.name), lambda x,y: x.name in y.name and x.name != y.name)
+        res = filter_contained_names(res, lambda x : x.name)
     return res
 
 def parse_things(results, sector : NSector, dir):
@@ -189,7 +233,7 @@ def parse_things(results, sector : NSector, dir):
         if v['dealCount'] == 0 and v['leaseCount'] == 0:
             continue
 
-        thing = NThing(
+        res.append(NThing(
             v['complexName'],
             v['realEstateTypeCode'],
             v['completionYearMonth'],
@@ -199,15 +243,17 @@ def parse_things(results, sector : NSector, dir):
             NPrice(v['minLeasePrice'],v['maxLeasePrice'] , None if 'medianLeasePrice' not in v else v['medianLeasePrice']),
             NPrice(v['minDealUnitPrice'], v['maxDealUnitPrice'], None if 'medianDealUnitPrice' not in v else v['medianDealUnitPrice']),
             NPrice(v['minLeaseUnitPrice'], v['maxLeaseUnitPrice'], None if 'medianLeaseUnitPrice' not in v else  v['medianLeaseUnitPrice'])
-        )
+        ))
 
-        if smap.contain(thing.loc):
-            thing.dir = dir
-            res.append(thing)
+    # 섹터 경계 안의 매물만 — 좌표 배열로 한 번에 판정
+    inside = smap.contains_many([t.loc.lat for t in res], [t.loc.lon for t in res])
+    res = [t for t, ok in zip(res, inside) if ok]
+    for thing in res:
+        thing.dir = dir
     return res
 
 def distance_between(l1 : NLocation, l2 : NLocation):
-    return round(haversine(l1.get_tuple(), l2.get_tuple(), unit='m'))
+    return round(float(haversine_m(l1.lat, l1.lon, l2.lat, l2.lon)))
 
 def get_distance_standard(standard = {}):
     default_standard = {
@@ -260,14 +306,55 @@ def filter_item(list, to_key, condition):
         res.append(item)
     return res
 
+def filter_contained_names(items, to_name):
+    """
+    filter_item(items, len(name), x.name in y.name and x.name != y.name)와 같은 결과.
+    짧은 이름부터 확인하면서, 이미 남긴 이름 중 하나를 (다른 이름으로서) 포함하는 항목을 버린다.
+    남긴 이름을 길이별 set으로 두고 각 이름에서 그 길이의 부분 문자열만 조회하므로
+    항목 간 비교 없이 이름 길이에만 비례한다.
+    """
+    # filter_item의 pop 순서: 길이 오름차순, 같은 길이는 원래 순서의 역순
+    ordered = sorted(items, key=lambda x: len(to_name(x)), reverse=True)
+    ordered.reverse()
+    kept_by_len = {}  # type: dict[int, set[str]]
+    res = []
+    for item in ordered:
+        name = to_name(item)
+        contained = False
+        for size, names in kept_by_len.items():
+            if size >= len(name):
+                continue
+            if any(name[i:i + size] in names for i in range(len(name) - size + 1)):
+                contained = True
+                break
+        if contained:
+            continue
+        kept_by_len.setdefault(len(name), set()).add(name)
+        res.append(item)
+    return res
+
+def count_neighbors_around(lats, lons, neighbors : list[NNeighbor], standard):
+    """
+    좌표별 기준 거리(standard, meter) 이내 편의시설 수 — (n, 13), 열 순서는 NNeighborAround.HEADER.
+    유형별 격자 버킷으로 매물 주변 후보만 확인한다.
+    """
+    return count_within_grid(
+        lats, lons,
+        [nei.loc.lat for nei in neighbors], [nei.loc.lon for nei in neighbors],
+        thresholds=[standard[nei.type] for nei in neighbors],
+        groups=[NNeighborAround.INDEX[nei.type] for nei in neighbors],
+        n_groups=len(NNeighborAround.HEADER),
+    )
+
 def update_things_intersection(things : list[NThing], neighbors : list[NNeighbor], standard):
-    for thing in things: # 매물
-        around = NNeighborAround()
-        for nei in neighbors: # 편의시설
-            d = distance_between(thing.loc, nei.loc)
-            if d <= standard[nei.type]: # meter
-                around.increase(nei.type)
-        thing.neiAround = around
+    counts = count_neighbors_around(
+        [thing.loc.lat for thing in things], [thing.loc.lon for thing in things], neighbors, standard)
+    for thing, row in zip(things, counts.tolist()): # 매물
+        thing.neiAround = NNeighborAround(row)
+
+def update_table_intersection(table : NThingTable, neighbors : list[NNeighbor], standard):
+    """update_things_intersection의 NThingTable 버전 — 개수 행렬을 그대로 저장"""
+    table.neighbors = count_neighbors_around(table.lats, table.lons, neighbors, standard).astype(np.int32)
 
 
 def get_all_neighbors(sector):
@@ -276,13 +363,9 @@ def get_all_neighbors(sector):
         neighbors.extend(get_neighborhood(sector, nType))
     return neighbors
 
-def get_things_each_direction(sector):
-    # addon = NAddon(
-    #     #direction=nc.NAddon.DIR_EACH, #전 방향 탐색
-    #     tradeType=[NAddon.TRADE_DEAL, NAddon.TRADE_LEASE], #목표 거래 - 매매, 전세
-    #     estateType=[NAddon.ESTATE_APT, NAddon.ESTATE_OPST] #목표 매물 - 아파트, 오피스텔
-    # )
-    addon = NAddon(
+def make_addon_each_direction(dirr = ''):
+    return NAddon(
+        dir=dirr,
         tradeType=[NAddon.TRADE_DEAL, NAddon.TRADE_LEASE],
         estateType=[
             NAddon.ESTATE_APT,
@@ -293,11 +376,59 @@ def get_things_each_direction(sector):
             NAddon.ESTATE_ONE_ROOM
         ]
     )
-    things = [] # 매물 기록
+
+def get_things_each_direction(sector):
+    # addon = NAddon(
+    #     #direction=nc.NAddon.DIR_EACH, #전 방향 탐색
+    #     tradeType=[NAddon.TRADE_DEAL, NAddon.TRADE_LEASE], #목표 거래 - 매매, 전세
+    #     estateType=[NAddon.ESTATE_APT, NAddon.ESTATE_OPST] #목표 매물 - 아파트, 오피스텔
+    # )
+    results = [] # 방향별 매물 기록
     for dirr in NAddon.DIR_EACH: # 모든 방향 (남향 등등)
-        addon.dir = dirr # 방향 조건 선택
-        things.extend(get_things(sector, addon))
-    return things
+        started = time.perf_counter()
+        results.append(get_things(sector, make_addon_each_direction(dirr))) # 방향 조건 선택
+        _record_direction_latency(dirr, time.perf_counter() - started)
+    return merge_direction_things(results)
+
+def merge_direction_things(results : list[list[NThing]]):
+    """
+    방향별 결과 합치기. 여러 방향에 함께 나온 단지(이름·좌표 동일)는 하나로 두고
+    dir을 처음 나온 순서대로 ':'로 합친다 (예: 'EE:SS')
+    """
+    merged = {} # type: dict[tuple, NThing]
+    for res in results:
+        for thing in res:
+            key = (thing.name, thing.loc.lat, thing.loc.lon)
+            first = merged.get(key)
+            if first is None:
+                merged[key] = thing
+            elif thing.dir not in first.dir.split(':'):
+                first.dir = f"{first.dir}:{thing.dir}"
+    return list(merged.values())
+
+# 방향별 요청 지연 누적 (get_direction_latency_stats)
+_direction_latency = {} # type: dict[str, dict]
+
+def _record_direction_latency(dirr, elapsed, failed = False):
+    stat = _direction_latency.setdefault(dirr, {"calls": 0, "failures": 0, "total": 0.0, "max": 0.0, "last": 0.0})
+    stat["calls"] += 1
+    stat["failures"] += int(failed)
+    stat["total"] += elapsed
+    stat["max"] = max(stat["max"], elapsed)
+    stat["last"] = elapsed
+
+def get_direction_latency_stats():
+    """방향별 매물 요청 지연(ms) — 평균·최대·최근"""
+    return {
+        dirr: {
+            "calls": s["calls"],
+            "failures": s["failures"],
+            "avg_ms": round(s["total"] / s["calls"] * 1000, 1) if s["calls"] else 0.0,
+            "max_ms": round(s["max"] * 1000, 1),
+            "last_ms": round(s["last"] * 1000, 1),
+        }
+        for dirr, s in _direction_latency.items()
+    }
 
 # 일반 매물 크롤링 (빌라/주택/원룸/투룸)
 def get_articles_by_type(loc: NLocation, real_estate_types: list[str], trade_type="B1", page=1):
@@ -318,6 +449,37 @@ def get_all_on_sector(sector : NSector):
     neighbors = get_all_neighbors(sector)
     return (sector, things, neighbors)
 
+async def async_get_things_each_direction(sector : NSector, directions = NAddon.DIR_EACH,
+                                          fetch = None, raise_errors = True):
+    """
+    get_things_each_direction의 비동기 버전 — 방향별 요청을 동시에 보내고 merge_direction_things로 합친다.
+    호스트별 동시 요청 수·속도 제한은 aget(API_CONCURRENCY, 토큰 버킷)이 맡는다.
+    - fetch(sector, addon): 방향 하나를 가져오는 코루틴 (기본 fetch_things_async, 크롤러는 재시도 래퍼 전달)
+    - raise_errors=False면 실패한 방향은 빈 결과로 둔다
+    """
+    fetch = fetch or fetch_things_async
+
+    async def _one(dirr):
+        started = time.perf_counter()
+        try:
+            res = await fetch(sector, make_addon_each_direction(dirr))
+        except Exception as e:
+            _record_direction_latency(dirr, time.perf_counter() - started, failed=True)
+            if raise_errors:
+                raise
+            print(f"[비동기 매물 요청 실패] {dirr}: {e}")
+            return []
+        _record_direction_latency(dirr, time.perf_counter() - started)
+        return res
+
+    results = await asyncio.gather(*[_one(dirr) for dirr in directions])
+    return merge_direction_things(results)
+
+async def async_get_all_on_sector(sector : NSector):
+    things, neighbors = await asyncio.gather(
+        async_get_things_each_direction(sector), async_get_all_neighbors(sector))
+    return (sector, things, neighbors)
+
 _ARTICLE_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -357,6 +519,11 @@ def _resolve_rlet_codes(estate_types: list[str] | None) -> str:
     return ":".join(codes) if codes else _ALL_ARTICLE_TYPES
 
 
+# 같은 지역·유형의 동시 조회는 업스트림 호출 1회로 병합
+_article_flight = SingleFlight("naver.articleList")
+_complex_flight = SingleFlight("naver.complexList")
+
+
 async def get_article_listings(
     loc: NLocation,
     pages: int = 2,
@@ -370,94 +537,126 @@ async def get_article_listings(
         estate_types: 매물 유형 필터 목록. None이면 전체 조회.
             예) ["원룸", "빌라"], ["APT", "OPST"]
     """
+    rlet_code = _resolve_rlet_codes(estate_types)
+    key = (rlet_code, round(loc.lat, 6), round(loc.lon, 6), pages)
+    listings = await _article_flight.do(key, lambda: _fetch_article_listings(loc, pages, rlet_code))
+    return list(listings)
+
+
+async def _fetch_article_listings(loc: NLocation, pages: int, rlet_code: str) -> list[dict]:
     listings = []
     url = "https://m.land.naver.com/cluster/ajax/articleList"
-    rlet_code = _resolve_rlet_codes(estate_types)
 
-    async with httpx.AsyncClient(headers=_ARTICLE_HEADERS, timeout=10.0) as client:
-        for page in range(1, pages + 1):
-            params = {
-                "rletTpCd": rlet_code,
-                "tradTpCd": "A1:B1:B2",
-                "z": 15,
-                "lat": loc.lat,
-                "lon": loc.lon,
-                "btm": loc.lat - 0.008,
-                "lft": loc.lon - 0.015,
-                "top": loc.lat + 0.008,
-                "rgt": loc.lon + 0.015,
-                "page": page,
-            }
-
-            try:
-                res = await client.get(url, params=params)
-                res.raise_for_status()
-                data = res.json()
-
-                articles = data.get("body") or []
-                if not articles:
-                    break
-
-                coords_list = [(float(a["lat"]), float(a["lng"])) for a in articles]
-                addresses = await asyncio.gather(*[
-                    coords_to_address(lat, lng) for lat, lng in coords_list
-                ])
-
-                for a, address_name in zip(articles, addresses):
-                    try:
-                        deposit = int(a.get("prc", 0))
-                        monthly = int(a.get("rentPrc", 0))
-                        area_m2 = float(a.get("spc2") or 0.0)
-                        lat_a = float(a["lat"])
-                        lng_a = float(a["lng"])
-
-                        listings.append({
-                            "name": a.get("atclNm", "매물"),
-                            "address": address_name,
-                            "area": round(area_m2, 1),
-                            "deposit": deposit,
-                            "monthly": monthly,
-                            "price": deposit + monthly * 10,
-                            "lat": lat_a,
-                            "lng": lng_a,
-                            "type": a.get("rletTpNm", "기타"),
-                            "trade_type": a.get("tradTpNm", ""),
-                            "distance_km": round(distance_between(loc, NLocation(lat_a, lng_a)) / 1000, 2),
-                            "source": "article",
-                        })
-                    except Exception as e:
-                        print(f"[article 파싱 실패] {e}")
-
-                if not data.get("more", False):
-                    break
-
-            except Exception as e:
-                print(f"[articleList 요청 실패] page={page}: {e}")
+    client = get_client(NAVER_MOBILE_HOST)  # 공유 커넥션 풀 (keep-alive 재사용)
+    for page in range(1, pages + 1):
+        params = {
+            "rletTpCd": rlet_code,
+            "tradTpCd": "A1:B1:B2",
+            "z": 15,
+            "lat": loc.lat,
+            "lon": loc.lon,
+            "btm": loc.lat - 0.008,
+            "lft": loc.lon - 0.015,
+            "top": loc.lat + 0.008,
+            "rgt": loc.lon + 0.015,
+            "page": page,
+        }
+
+        try:
+            await get_rate_limiter(NAVER_MOBILE_HOST).acquire()
+            res = await client.get(url, params=params, headers=_ARTICLE_HEADERS, timeout=10.0)
+            res.raise_for_status()
+            data = res.json()
+
+            articles = data.get("body") or []
+            if not articles:
+                break
+
+            coords_list = [(float(a["lat"]), float(a["lng"])) for a in articles]
+            addresses = await reverse_geocode_batch(coords_list)
+            distances = distances_to(
+                [c[0] for c in coords_list], [c[1] for c in coords_list], loc.lat, loc.lon
+            ).tolist()
+
+            for a, address_name, dist_m in zip(articles, addresses, distances):
+                try:
+                    deposit = int(a.get("prc", 0))
+                    monthly = int(a.get("rentPrc", 0))
+                    area_m2 = float(a.get("spc2") or 0.0)
+                    lat_a = float(a["lat"])
+                    lng_a = float(a["lng"])
+
+                    listings.append({
+                        "name": a.get("atclNm", "매물"),
+                        "address": address_name,
+                        "area": round(area_m2, 1),
+                        "deposit": deposit,
+                        "monthly": monthly,
+                        "price": deposit + monthly * 10,
+                        "lat": lat_a,
+                        "lng": lng_a,
+                        "type": a.get("rletTpNm", "기타"),
+                        "trade_type": a.get("tradTpNm", ""),
+                        "distance_km": round(round(dist_m) / 1000, 2),
+                        "source": "article",
+                    })
+                except Exception as e:
+                    print(f"[article 파싱 실패] {e}")
+
+            if not data.get("more", False):
                 break
 
+        except Exception as e:
+            print(f"[articleList 요청 실패] page={page}: {e}")
+            break
+
     return listings
 
 
+# 가격 문자열 패턴 — 호출마다 컴파일하지 않도록 모듈 로드 시 한 번만
+# 숫자 묶음은 숫자로 시작해야 한다 (쉼표만 있는 묶음은 int("")로 예외가 나 단지 목록 전체가 실패했다)
+_PRICE_TAG_RE = re.compile(r"<[^>]+>")
+_PRICE_UK_RE = re.compile(r"(\d+)\s*억")
+_PRICE_MAN_RE = re.compile(r"억\s*,*(\d[\d,]*)")
+_PRICE_NUM_RE = re.compile(r"\d[\d,]*")
+
+
 def _parse_price_han(price_str: str) -> int:
     """'2억 9,000' 또는 HTML 포함 가격 문자열을 만원 단위 정수로 변환"""
-    import re
     if not price_str or price_str == "0":
         return 0
-    text = re.sub(r"<[^>]+>", "", price_str).strip()
+    if price_str.isdecimal(): # '9000' — 가장 흔한 형태
+        return int(price_str)
+    text = _PRICE_TAG_RE.sub("", price_str) if "<" in price_str else price_str
+    if "억" not in text:
+        m_only = _PRICE_NUM_RE.search(text)
+        return int(m_only.group().replace(",", "")) if m_only else 0
     total = 0
-    m_uk = re.search(r"(\d+)\s*억", text)
+    m_uk = _PRICE_UK_RE.search(text)
     if m_uk:
         total += int(m_uk.group(1)) * 10000
-    m_man = re.search(r"억\s*([\d,]+)", text)
+    m_man = _PRICE_MAN_RE.search(text)
     if m_man:
         total += int(m_man.group(1).replace(",", ""))
     elif not m_uk:
-        m_only = re.search(r"([\d,]+)", text)
+        m_only = _PRICE_NUM_RE.search(text)
         if m_only:
-            total = int(m_only.group(1).replace(",", ""))
+            total = int(m_only.group().replace(",", ""))
     return total
 
 
+def _parse_prices_han(prices) -> list[int]:
+    """_parse_price_han의 묶음 버전 — 같은 가격 문자열은 한 번만 파싱한다"""
+    parsed = {}
+    out = []
+    for price in prices:
+        value = parsed.get(price)
+        if value is None:
+            value = parsed[price] = _parse_price_han(price)
+        out.append(value)
+    return out
+
+
 async def get_complex_listings(
     loc: NLocation,
     estate_types: list[str] | None = None,
@@ -475,6 +674,12 @@ async def get_complex_listings(
         if not any(t in allowed for t in estate_types):
             return []  # APT/OPST가 없으면 조회 불필요
 
+    key = (round(loc.lat, 6), round(loc.lon, 6))
+    listings = await _complex_flight.do(key, lambda: _fetch_complex_listings(loc))
+    return list(listings)
+
+
+async def _fetch_complex_listings(loc: NLocation) -> list[dict]:
     listings = []
     url = "https://m.land.naver.com/cluster/ajax/complexList"
     params = {
@@ -490,22 +695,27 @@ async def get_complex_listings(
     }
 
     try:
-        async with httpx.AsyncClient(headers=_ARTICLE_HEADERS, timeout=10.0) as client:
-            res = await client.get(url, params=params)
+        client = get_client(NAVER_MOBILE_HOST)
+        await get_rate_limiter(NAVER_MOBILE_HOST).acquire()
+        res = await client.get(url, params=params, headers=_ARTICLE_HEADERS, timeout=10.0)
         res.raise_for_status()
         data = res.json()
 
         complexes = data.get("result") or []
         print(f"[complexList] 응답 단지 수: {len(complexes)}, 상태코드: {res.status_code}")
+        valid = [] # (단지, 매물 수, 최소 면적)
         for c in complexes:
             total_cnt = int(c.get("totalAtclCnt", 0))
             min_spc = float(c.get("minSpc") or 0)
             if total_cnt == 0 or min_spc == 0:
                 continue
+            valid.append((c, total_cnt, min_spc))
 
-            deal_min = _parse_price_han(c.get("dealPrcMin", "0"))
-            deal_max = _parse_price_han(c.get("dealPrcMax", "0"))
-            lease_min = _parse_price_han(c.get("leasePrcMin", "0"))
+        # 가격 세 열을 단지 목록 단위로 한 번에 파싱
+        prices = _parse_prices_han(
+            c.get(field, "0") for c, _, _ in valid for field in ("dealPrcMin", "dealPrcMax", "leasePrcMin"))
+        for i, (c, total_cnt, min_spc) in enumerate(valid):
+            deal_min, deal_max, lease_min = prices[3 * i:3 * i + 3]
 
             # 매매 > 전세 순으로 대표가 선택
             if deal_min and deal_max:
@@ -541,46 +751,19 @@ async def get_complex_listings(
     print(f"[complexList] 유효 단지 반환: {len(listings)}건")
     return listings
 
-# 비동기 get_things
-async def get_things_async(sector: NSector, addon: NAddon) -> list[NThing]:
-    BASE_API_URL = "https://new.land.naver.com/api/"
-    url = BASE_API_URL + "complexes/single-markers/2.0"
-    params = make_param_thing(sector, addon)
+# 비동기 get_things — 실패를 호출자에게 전파 (크롤러 재시도용)
+async def fetch_things_async(sector: NSector, addon: NAddon) -> list[NThing]:
+    res = await aget(NRE_ROUTER.COMPLEX2, make_param_thing(sector, addon))
+    return parse_things(res, sector, addon.dir)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            resp = await client.get(url, params=params, headers={'User-Agent': '*'}, timeout=5.0)
-            resp.raise_for_status()
-            data = resp.json()
-            return parse_things(data, sector, addon.dir)
-        except Exception as e:
-            print(f"[비동기 매물 요청 실패] {addon.dir}: {e}")
-            return []
+# 비동기 get_things — 실패 시 빈 목록
+async def get_things_async(sector: NSector, addon: NAddon) -> list[NThing]:
+    try:
+        return await fetch_things_async(sector, addon)
+    except Exception as e:
+        print(f"[비동기 매물 요청 실패] {addon.dir}: {e}")
+        return []
 
-# 병렬 방향 요청
+# 병렬 방향 요청 — async_get_things_each_direction과 동일 (실패한 방향은 빈 결과)
 async def async_get_parallel_things(sector: NSector) -> list[NThing]:
-    directions = NAddon.DIR_EACH
-    tasks = []
-
-    for dirr in directions:
-        addon = NAddon(
-            dir=[dirr],
-            tradeType=[NAddon.TRADE_DEAL, NAddon.TRADE_LEASE],
-            estateType=[
-                NAddon.ESTATE_APT,
-                NAddon.ESTATE_OPST,
-                NAddon.ESTATE_VILLA,
-                NAddon.ESTATE_HOUSE
-            ]
-        )
-        tasks.append(get_things_async(sector, addon))
-
-    # asyncio.gather로 병렬 호출
-    all_results = await asyncio.gather(*tasks, return_exceptions=False)
-
-    # 리스트 합치기
-    combined = []
-    for sublist in all_results:
-        combined.extend(sublist)
-
-    return combined
\ No newline at end of file
+    return await async_get_things_each_direction(sector, raise_errors=False)
\ No newline at end of file